@@ -0,0 +1,8 @@
+"""Benchmarks of the pysvd parser.
+
+Run as modules from the repository root, e.g. `python -m benchmark.memory --svd res/cortex-m3.svd`. The suite of synthetic devices
+gates releases on regressions against the results of a previous run:
+
+    python -m benchmark.suite --output baseline.json
+    python -m benchmark.suite --baseline baseline.json --tolerance 0.2
+"""
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Compare load time of the XML backends (see pysvd.node.backends).
+
+Without --svd the bundled res/cortex-m3.svd and a synthetic device with 100 peripherals x 16 registers x 16 fields x 2 enumerated values
+are measured. The XML parsing alone and the complete pysvd.load() are timed, keeping the XML nodes, streamed and lazy.
+"""
+
+import argparse
+import io
+import os
+import time
+
+import pysvd
+import benchmark.generate
+
+
+def best(function, source, repeat):
+    """Best time of repeated calls of function(source) in seconds"""
+    result = None
+    for _ in range(repeat):
+        if isinstance(source, bytes):
+            data = io.BytesIO(source)
+        else:
+            data = source
+        start = time.perf_counter()
+        function(data)
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def measure(source, repeat=5):
+    """Measure source with all backends and return {backend: (parse, load, streamed load, lazy load) seconds}"""
+    previous = pysvd.node.backend.name
+    results = {}
+    try:
+        for backend in sorted(pysvd.node.backends):
+            pysvd.node.use(backend)
+            results[backend] = (
+                best(pysvd.node.parse, source, repeat),
+                best(pysvd.load, source, repeat),
+                best(lambda data: pysvd.load(data, keep_xml=False), source, repeat),
+                best(lambda data: pysvd.load(data, lazy=True), source, repeat),
+            )
+    finally:
+        pysvd.node.use(previous)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--svd', metavar='FILE', action='append', help='System view description (SVD) file')
+    parser.add_argument('--repeat', metavar='N', type=int, default=5, help='Repetitions, the best time is reported')
+    args = parser.parse_args()
+
+    sources = [(name, name) for name in args.svd or ()]
+    if not sources:
+        sources.append(('cortex-m3', os.path.join(os.path.dirname(__file__), '..', 'res', 'cortex-m3.svd')))
+        sources.append(('synthetic', benchmark.generate.generate().encode()))
+
+    if len(pysvd.node.backends) < 2:
+        print("Only backend '{}' available, install lxml to compare".format(pysvd.node.backend.name))
+
+    for (name, source) in sources:
+        for (backend, (parse, load, streamed, lazy)) in measure(source, args.repeat).items():
+            print("{} [{}]: parse {:.4f} s, load {:.4f} s, streamed load {:.4f} s, lazy load {:.4f} s".format(
+                name, backend, parse, load, streamed, lazy))
+
+
+if __name__ == "__main__":
+    main()
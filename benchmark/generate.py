@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Generate synthetic SVD files of configurable size.
+"""
+
+import argparse
+
+# Filler of long descriptions
+lorem = ('Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. '
+         'Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. ')
+
+
+def generate(peripherals=100, registers=16, fields=16, values=2, derived=0, dim=0, depth=0, description=0):
+    """Generate SVD document with peripherals x registers x fields x enumerated values.
+
+    Every base peripheral is followed by derived peripherals with derivedFrom referring to it (peripherals - 1 derives all from the
+    first one). If dim is set, registers and clusters are dim arrays with dim elements. The registers are nested in depth levels of
+    clusters. Descriptions are extended by description characters of filler text.
+    """
+
+    filler = (lorem * (description // len(lorem) + 1))[:description]
+    if filler:
+        filler = ' ' + filler
+    count = max(dim, 1)
+
+    output = [
+        '<?xml version="1.0" encoding="utf-8"?>\n',
+        '<device schemaVersion="1.3">\n',
+        '  <name>SYNTHETIC</name>\n',
+        '  <version>1.0</version>\n',
+        '  <description>Synthetic device{}</description>\n'.format(filler),
+        '  <addressUnitBits>8</addressUnitBits>\n',
+        '  <width>32</width>\n',
+        '  <size>32</size>\n',
+        '  <access>read-write</access>\n',
+        '  <resetValue>0x00000000</resetValue>\n',
+        '  <resetMask>0xFFFFFFFF</resetMask>\n',
+        '  <peripherals>\n',
+    ]
+
+    def add_dim(indent, increment):
+        if dim:
+            output.append('{}<dim>{}</dim>\n'.format(indent, dim))
+            output.append('{}<dimIncrement>0x{:X}</dimIncrement>\n'.format(indent, increment))
+
+    def add_registers(indent, level):
+        # Size of the registers of a cluster at this level
+        size = registers * 4 * count ** (depth - level + 1)
+        if level < depth:
+            output.append('{}<cluster>\n'.format(indent))
+            add_dim(indent + '  ', size // count)
+            output.append('{}  <name>C{}{}</name>\n'.format(indent, level, '_%s' if dim else ''))
+            output.append('{}  <description>Cluster {}{}</description>\n'.format(indent, level, filler))
+            output.append('{}  <addressOffset>0x0</addressOffset>\n'.format(indent))
+            add_registers(indent + '  ', level + 1)
+            output.append('{}</cluster>\n'.format(indent))
+            return
+
+        for register in range(registers):
+            output.append('{}<register>\n'.format(indent))
+            add_dim(indent + '  ', 4)
+            output.append('{}  <name>R{}{}</name>\n'.format(indent, register, '_%s' if dim else ''))
+            output.append('{}  <description>Register {}{}</description>\n'.format(indent, register, filler))
+            output.append('{}  <addressOffset>0x{:X}</addressOffset>\n'.format(indent, register * 4 * count))
+            if fields:
+                output.append('{}  <fields>\n'.format(indent))
+            for field in range(fields):
+                output.append('{}    <field>\n'.format(indent))
+                output.append('{}      <name>F{}</name>\n'.format(indent, field))
+                output.append('{}      <description>Field {}{}</description>\n'.format(indent, field, filler))
+                output.append('{}      <bitOffset>{}</bitOffset>\n'.format(indent, field % 32))
+                output.append('{}      <bitWidth>1</bitWidth>\n'.format(indent))
+                if values:
+                    output.append('{}      <enumeratedValues>\n'.format(indent))
+                for value in range(values):
+                    output.append('{}        <enumeratedValue>\n'.format(indent))
+                    output.append('{}          <name>V{}</name>\n'.format(indent, value))
+                    output.append('{}          <description>Value {}{}</description>\n'.format(indent, value, filler))
+                    output.append('{}          <value>{}</value>\n'.format(indent, value))
+                    output.append('{}        </enumeratedValue>\n'.format(indent))
+                if values:
+                    output.append('{}      </enumeratedValues>\n'.format(indent))
+                output.append('{}    </field>\n'.format(indent))
+            if fields:
+                output.append('{}  </fields>\n'.format(indent))
+            output.append('{}</register>\n'.format(indent))
+
+    size = registers * 4 * count ** (depth + 1)
+    stride = max(0x400, 1 << (size - 1).bit_length())
+    for peripheral in range(peripherals):
+        baseAddress = 0x40000000 + peripheral * stride
+        base = peripheral - peripheral % (derived + 1)
+        if base != peripheral:
+            output.append('    <peripheral derivedFrom="P{}">\n'.format(base))
+            output.append('      <name>P{}</name>\n'.format(peripheral))
+            output.append('      <baseAddress>0x{:08X}</baseAddress>\n'.format(baseAddress))
+            output.append('    </peripheral>\n')
+            continue
+
+        output.append('    <peripheral>\n')
+        output.append('      <name>P{}</name>\n'.format(peripheral))
+        output.append('      <description>Peripheral {}{}</description>\n'.format(peripheral, filler))
+        output.append('      <baseAddress>0x{:08X}</baseAddress>\n'.format(baseAddress))
+        output.append('      <addressBlock>\n')
+        output.append('        <offset>0</offset>\n')
+        output.append('        <size>0x{:X}</size>\n'.format(stride))
+        output.append('        <usage>registers</usage>\n')
+        output.append('      </addressBlock>\n')
+        output.append('      <registers>\n')
+        add_registers('        ', 0)
+        output.append('      </registers>\n')
+        output.append('    </peripheral>\n')
+
+    output.append('  </peripherals>\n')
+    output.append('</device>\n')
+    return ''.join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output', '-o', metavar='FILE', required=True, help='Generated SVD file')
+    parser.add_argument('--peripherals', type=int, default=100, help='Number of peripherals')
+    parser.add_argument('--registers', type=int, default=16, help='Number of registers per peripheral or innermost cluster')
+    parser.add_argument('--fields', type=int, default=16, help='Number of fields per register')
+    parser.add_argument('--values', type=int, default=2, help='Number of enumerated values per field')
+    parser.add_argument('--derived', metavar='N', type=int, default=0, help='Number of peripherals derived from every base peripheral')
+    parser.add_argument('--dim', metavar='N', type=int, default=0, help='Generate registers and clusters as dim arrays of N elements')
+    parser.add_argument('--depth', metavar='N', type=int, default=0, help='Nest registers in N levels of clusters')
+    parser.add_argument('--description', metavar='N', type=int, default=0, help='Extend descriptions by N characters')
+    args = parser.parse_args()
+
+    with open(args.output, 'w') as output:
+        output.write(generate(args.peripherals, args.registers, args.fields, args.values, args.derived, args.dim, args.depth,
+                              args.description))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Measure load time and memory of parsed SVD devices.
+
+Without --svd a synthetic device with 100 peripherals x 16 registers x 16 fields x 2 enumerated values is measured.
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+import pysvd
+import benchmark.generate
+
+
+def count(device):
+    """Count elements of device tree"""
+    elements = 0
+    nodes = [device]
+    for element in nodes:
+        elements += 1
+        nodes.extend(element.children())
+    return elements
+
+
+def measure(source, **kwargs):
+    """Load source with pysvd.load() and return (device, seconds, current bytes, peak bytes). The memory of the source itself is not
+    included."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        device = pysvd.load(source, **kwargs)
+        elapsed = time.perf_counter() - start
+        (current, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (device, elapsed, current, peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--svd', metavar='FILE', action='append', help='System view description (SVD) file')
+    parser.add_argument('--lazy', action='store_true', help='Load in lazy mode')
+    parser.add_argument('--no-xml', dest='keep_xml', action='store_false', help='Release XML nodes after parsing')
+    parser.add_argument('--workers', metavar='N', type=int, help='Parse peripherals with N processes')
+    parser.add_argument('--report', metavar='N', type=int, nargs='?', const=10,
+                        help='Report memory per element class and of the N peripherals with the most memory (see pysvd.memory)')
+    args = parser.parse_args()
+
+    sources = [(name, name) for name in args.svd or ()]
+    if not sources:
+        sources.append(('synthetic', io.BytesIO(benchmark.generate.generate().encode())))
+
+    for (name, source) in sources:
+        (device, elapsed, current, peak) = measure(source, lazy=args.lazy, keep_xml=args.keep_xml, workers=args.workers)
+        print("{}: {} elements, {:.3f} s, {:.1f} MB (peak {:.1f} MB)".format(name, count(device), elapsed, current / 1e6, peak / 1e6))
+        if args.report is not None:
+            print(device.memory_report().format(args.report))
+
+
+if __name__ == "__main__":
+    main()
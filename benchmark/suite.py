@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Benchmark suite of synthetic devices.
+
+Every scenario generates a device (see benchmark.generate) and measures in seconds (best of --repeat runs):
+
+* load: pysvd.load() without XML nodes
+* lookup: resolve the dotted path of every register
+* expand: iterate all clusters and registers, which creates the elements of dim arrays
+* derive: derivedFrom lookups and inheritance during a load (measured with pysvd.profile, the counts are reported as well)
+
+The peak memory of a load is measured with tracemalloc in a separate run. The results are written as JSON. With --baseline a previous
+result is compared, the exit status is 1 if a metric of a scenario regressed more than --tolerance.
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pysvd
+import benchmark.generate
+
+# Generator parameters of the scenarios by name
+scenarios = {
+    'flat': dict(peripherals=100, registers=16, fields=16, values=2),
+    'derived': dict(peripherals=100, registers=16, fields=16, values=2, derived=9),
+    'dim': dict(peripherals=20, registers=8, fields=8, values=2, dim=8, depth=2),
+    'descriptions': dict(peripherals=50, registers=16, fields=16, values=2, description=200),
+}
+
+# Metrics compared with the baseline, lower is better
+metrics = ('load', 'lookup', 'expand', 'derive', 'peak')
+
+
+def best(function, repeat, setup=None):
+    """Best time of repeated calls of function() in seconds. With setup function(setup()) is called, setup() is not timed."""
+    result = None
+    for _ in range(repeat):
+        arguments = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        function(*arguments)
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def registers(element, path=''):
+    """Iterate over (dotted path, register) of all clusters and registers below element"""
+    for cluster in getattr(element, 'clusters', ()):
+        yield from registers(cluster, path + cluster.name + '.')
+    for register in getattr(element, 'registers', ()):
+        yield (path + register.name, register)
+
+
+def expand(device):
+    """Create all clusters and registers of device, returns their number"""
+    return sum(1 for peripheral in device.peripherals for _ in registers(peripheral))
+
+
+def run(parameters, repeat=3):
+    """Measure scenario of generator parameters and return its results"""
+    data = benchmark.generate.generate(**parameters).encode()
+
+    def load():
+        return pysvd.load(io.BytesIO(data), keep_xml=False)
+
+    device = load()
+    paths = [peripheral.name + '.' + path for peripheral in device.peripherals for (path, _) in registers(peripheral)]
+
+    def lookup():
+        for path in paths:
+            device.resolve(path)
+
+    with pysvd.profile.profiling() as stats:
+        load()
+    derive = {name: count for (name, count) in stats.counters.items() if name.startswith(('derive.', 'dim.'))}
+
+    tracemalloc.start()
+    try:
+        load()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'parameters': parameters,
+        'bytes': len(data),
+        'registers': len(paths),
+        'load': best(load, repeat),
+        'lookup': best(lookup, repeat),
+        'expand': best(expand, repeat, load),
+        'derive': stats.timers['derive.find'] + stats.timers['derive.inherit'],
+        'counters': derive,
+        'peak': peak,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """List regressions (scenario, metric, value, baseline value) of results exceeding the baseline by more than tolerance (fraction)"""
+    regressions = []
+    for (name, result) in results['scenarios'].items():
+        reference = baseline.get('scenarios', {}).get(name)
+        if reference is None or reference.get('parameters') != result['parameters']:
+            continue
+        for metric in metrics:
+            if metric in reference and result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append((name, metric, result[metric], reference[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenario', choices=sorted(scenarios), action='append', help='Scenario to run, all by default')
+    parser.add_argument('--scale', type=float, default=1.0, help='Scale the number of peripherals of all scenarios')
+    parser.add_argument('--repeat', metavar='N', type=int, default=3, help='Repetitions, the best time is reported')
+    parser.add_argument('--output', '-o', metavar='FILE', help='JSON output file, stdout by default')
+    parser.add_argument('--baseline', metavar='FILE', help='JSON results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression of every metric as fraction of the baseline')
+    args = parser.parse_args()
+
+    results = {
+        'pysvd': pysvd.__version__,
+        'python': platform.python_version(),
+        'backend': pysvd.node.backend.name,
+        'scenarios': {},
+    }
+    for name in args.scenario or sorted(scenarios):
+        parameters = dict(scenarios[name])
+        parameters['peripherals'] = max(1, round(parameters['peripherals'] * args.scale))
+        result = results['scenarios'][name] = run(parameters, args.repeat)
+        print("{}: load {:.3f} s, peak {:.1f} MB".format(name, result['load'], result['peak'] / 1e6), file=sys.stderr)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for (name, metric, value, reference) in regressions:
+            print("Regression {} {}: {:.4g} > {:.4g}".format(name, metric, value, reference), file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,5 +3,15 @@ from .version import __version__
 import pysvd.type
 import pysvd.node
 import pysvd.parser
+import pysvd.schema
 import pysvd.classes
 import pysvd.element
+import pysvd.loader
+import pysvd.memory
+import pysvd.profile
+import pysvd.cache
+import pysvd.binary
+import pysvd.aio
+
+from pysvd.loader import load, load_many
+from pysvd.aio import aload
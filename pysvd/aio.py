@@ -0,0 +1,66 @@
+"""Load devices from asyncio coroutines.
+
+Parsing large SVD files takes seconds, so they are loaded in an executor (the default thread pool of the event loop unless another one
+is given) instead of blocking the event loop.
+"""
+import asyncio
+import os
+import weakref
+
+import pysvd
+
+
+class AsyncLoader(object):
+    """Load devices in an executor.
+
+    Concurrent loads of the same file name with the same options share one parse. If limit is set, at most that many files are parsed at
+    the same time, further loads wait for a free slot.
+    """
+
+    def __init__(self, limit=None, executor=None):
+        self.limit = limit
+        self.executor = executor
+        self.loading = {}
+        # Semaphores are bound to their event loop
+        self.semaphores = weakref.WeakKeyDictionary()
+
+    def key(self, loop, source, lazy, keep_xml, cache):
+        """Key of loads which share a parse, None for file objects"""
+        if not isinstance(source, (str, bytes, os.PathLike)):
+            return None
+        return (loop, os.path.realpath(source), lazy, keep_xml, cache)
+
+    async def parse(self, loop, source, lazy, keep_xml, cache):
+        if self.limit is None:
+            return await loop.run_in_executor(self.executor, pysvd.loader.load, source, lazy, keep_xml, cache)
+
+        semaphore = self.semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.semaphores[loop] = asyncio.Semaphore(self.limit)
+        async with semaphore:
+            return await loop.run_in_executor(self.executor, pysvd.loader.load, source, lazy, keep_xml, cache)
+
+    async def load(self, source, lazy=False, keep_xml=True, cache=False):
+        """Load device from SVD file name or file object, see pysvd.loader.load()"""
+        # Called from a coroutine, so this is the running loop (get_running_loop() requires Python 3.7)
+        loop = asyncio.get_event_loop()
+        key = self.key(loop, source, lazy, keep_xml, cache)
+        if key is None:
+            return await self.parse(loop, source, lazy, keep_xml, cache)
+
+        task = self.loading.get(key)
+        if task is None:
+            task = self.loading[key] = loop.create_task(self.parse(loop, source, lazy, keep_xml, cache))
+            task.add_done_callback(lambda _: self.loading.pop(key))
+
+        # Cancelling one of the waiting coroutines does not cancel the parse of the others
+        return await asyncio.shield(task)
+
+
+# Loader of aload()
+loader = AsyncLoader()
+
+
+async def aload(source, lazy=False, keep_xml=True, cache=False):
+    """Load device from SVD file name or file object without blocking the event loop, see AsyncLoader"""
+    return await loader.load(source, lazy, keep_xml, cache)
@@ -0,0 +1,471 @@
+"""Compiled binary device format (.svdb).
+
+A loaded device is compiled into a compact binary image with write(). load() opens an image with mmap and returns the device as view. The
+views decode their attributes from the mapped buffer on access, so opening an image does not parse anything and the operating system
+shares the pages of an image between all processes using it.
+
+Without a file, publish() puts the image into shared memory and other processes attach() to it by name. Only one copy of the device
+exists, independent of the number of processes using it.
+
+Format (all integers little-endian):
+
+    header      b'SVDB', format version (u16), number of tables (u16)
+    directory   offset (u32) and number of entries (u32) of every table: the element tables in the order of kinds, then the string table
+    tables      fixed-width records of all elements of one kind
+    strings     number of strings + 1 offsets (u32) into the UTF-8 data following them. Equal strings are stored once.
+
+Every record starts with the reference to its parent element, kind (u8) and index (u32), and a presence mask (u32) of the attributes. The
+attributes of the kind follow, each with a fixed width: texts as index into the string table (u32), integers as u64, booleans as u8 and
+enums as index of the enum member (u8). Child element lists are stored as index of the first element (u32) and number of elements (u32)
+in the table of their kind. Single child elements (e.g. cpu) are stored as list of at most one element.
+
+Attributes inherited from parent elements (registerPropertiesGroup) are stored with their effective value. Dim arrays are stored
+expanded, arrays kept as single element (e.g. 'CH[4]') are stored as this element only. Derived elements are stored with their resolved
+attributes and child elements. XML nodes, dimIndex and derivedFrom references are not stored.
+"""
+import builtins
+import collections.abc
+import functools
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+
+import pysvd
+
+# File name extension of images
+extension = '.svdb'
+
+magic = b'SVDB'
+version = 2
+
+HEADER = struct.Struct('<4sHH')
+ENTRY = struct.Struct('<II')
+PARENT = struct.Struct('<BI')
+MASK = struct.Struct('<I')
+OFFSET = struct.Struct('<I')
+
+# Reference of missing elements
+NONE = 0xFFFFFFFF
+
+# Serializes the suppressed resource tracker registration of attach()
+registering = threading.Lock()
+
+
+class Kind(object):
+    """Record layout of an element kind.
+
+    attributes maps the attribute name to its parser (see pysvd.schema), which defines the stored type. children and singles map the
+    attribute name of child element lists and single child elements to the name of their kind.
+    """
+
+    def __init__(self, name, attributes, children=None, singles=None):
+        self.name = name
+        self.attributes = attributes
+        self.children = children or {}
+        self.singles = singles or {}
+
+        if len(attributes) > 32:
+            raise ValueError("Kind '{}' has more attributes than the presence mask".format(name))
+
+        # Column of attribute: (presence bit, offset in record, struct, parser, enum members)
+        self.columns = {}
+        offset = PARENT.size + MASK.size
+        for (bit, (attribute, parser)) in enumerate(attributes.items()):
+            column = struct.Struct('<' + code(parser))
+            members = tuple(parser.args[0]) if isinstance(parser, functools.partial) else None
+            self.columns[attribute] = (1 << bit, offset, column, parser, members)
+            offset += column.size
+
+        # Child element lists: (offset in record, kind name)
+        self.lists = {}
+        for (attribute, kind) in (*self.children.items(), *self.singles.items()):
+            self.lists[attribute] = (offset, kind)
+            offset += ENTRY.size
+
+        self.format = struct.Struct('<BII' + ''.join(code(parser) for parser in attributes.values()) + 'II' * len(self.lists))
+
+
+def code(parser):
+    """struct format code of values of parser (pysvd.parser.Text, Integer, Boolean or an enum parser of pysvd.schema)"""
+    if parser is pysvd.parser.Text:
+        return 'I'
+    if parser is pysvd.parser.Integer:
+        return 'Q'
+    return 'B'
+
+
+# Attributes parsed by the element classes itself
+dim = {'displayName': pysvd.parser.Text, 'dimName': pysvd.parser.Text}
+
+# registerPropertiesGroup of elements inheriting it without parsing it (enumeratedValues)
+group = {attribute: pysvd.schema.register[attribute] for attribute in pysvd.classes.Group.attributes}
+
+kinds = [
+    Kind('device', {**pysvd.schema.device, 'schemaVersion': pysvd.parser.Text},
+         {'peripherals': 'peripheral'}, {'cpu': 'cpu'}),
+    Kind('cpu', pysvd.schema.cpu,
+         None, {'sauRegionsConfig': 'sauRegionsConfig'}),
+    Kind('sauRegionsConfig', {'enabled': pysvd.parser.Boolean, 'protectionWhenDisabled': pysvd.schema.protection},
+         {'regions': 'region'}),
+    Kind('region', {**pysvd.schema.region, 'enabled': pysvd.parser.Boolean, 'name': pysvd.parser.Text}),
+    Kind('peripheral', {**pysvd.schema.peripheral, **dim},
+         {'addressBlocks': 'addressBlock', 'interrupts': 'interrupt', 'registers': 'register', 'clusters': 'cluster'}),
+    Kind('addressBlock', pysvd.schema.addressBlock),
+    Kind('interrupt', pysvd.schema.interrupt),
+    Kind('cluster', {**pysvd.schema.cluster, **dim},
+         {'registers': 'register', 'clusters': 'cluster'}),
+    Kind('register', {**pysvd.schema.register, **dim},
+         {'fields': 'field'}, {'writeConstraint': 'writeConstraint'}),
+    Kind('writeConstraint', {
+        'writeAsRead': pysvd.parser.Boolean,
+        'useEnumeratedValues': pysvd.parser.Boolean,
+        'rangeMinimum': pysvd.parser.Integer,
+        'rangeMaximum': pysvd.parser.Integer,
+    }),
+    Kind('field', {**pysvd.schema.field, 'bitOffset': pysvd.parser.Integer, 'bitWidth': pysvd.parser.Integer, **dim},
+         None, {'writeConstraint': 'writeConstraint', 'enumeratedValues': 'enumeration'}),
+    Kind('enumeration', {**pysvd.schema.enumeration, **group},
+         {'enumeratedValues': 'enumeratedValue'}),
+    Kind('enumeratedValue', pysvd.schema.enumeratedValue),
+]
+numbers = {kind.name: number for (number, kind) in enumerate(kinds)}
+
+
+class Writer(object):
+    """Collect the records of a device"""
+
+    def __init__(self):
+        self.tables = [[] for kind in kinds]
+        self.strings = {}
+        # Table position of elements and element lists, the elements are referenced to keep their ids valid
+        self.positions = {}
+        self.ranges = {}
+        self.elements = []
+
+    def string(self, value):
+        return self.strings.setdefault(value, len(self.strings))
+
+    def add(self, kind, elements):
+        """Add records of element list and return (first, count)"""
+        number = numbers[kind]
+        elements = list(elements)
+        key = (number, tuple(map(id, elements)))
+        if key in self.ranges:
+            return self.ranges[key]
+
+        # Reserve records first, so the list is stored contiguously
+        table = self.tables[number]
+        first = len(table)
+        table.extend([None] * len(elements))
+        self.ranges[key] = (first, len(elements))
+        self.elements.extend(elements)
+        for (index, element) in enumerate(elements, first):
+            self.positions.setdefault(id(element), (number, index))
+            table[index] = self.record(kinds[number], element)
+        return (first, len(elements))
+
+    def record(self, kind, element):
+        mask = 0
+        values = []
+        for (attribute, (bit, offset, format, parser, members)) in kind.columns.items():
+            value = getattr(element, attribute) if element.has(attribute) else None
+            if value is None:
+                values.append(0)
+                continue
+
+            mask |= bit
+            if parser is pysvd.parser.Text:
+                values.append(self.string(value))
+            elif members is not None:
+                values.append(members.index(value))
+            else:
+                values.append(int(value))
+
+        for (attribute, child) in kind.children.items():
+            values.extend(self.add(child, element.child_list(attribute)))
+        for (attribute, child) in kind.singles.items():
+            values.extend(self.add(child, (getattr(element, attribute),) if element.has(attribute) else ()))
+        return [element, mask] + values
+
+    def pack(self):
+        """Get image of collected records"""
+        offset = HEADER.size + ENTRY.size * (len(kinds) + 1)
+        directory = []
+        for (kind, table) in zip(kinds, self.tables):
+            directory.append((offset, len(table)))
+            offset += kind.format.size * len(table)
+        directory.append((offset, len(self.strings)))
+
+        output = bytearray(HEADER.pack(magic, version, len(kinds) + 1))
+        for entry in directory:
+            output += ENTRY.pack(*entry)
+
+        for (kind, table) in zip(kinds, self.tables):
+            for (element, *values) in table:
+                (number, index) = self.positions.get(id(element.parent), (0xFF, NONE))
+                output += kind.format.pack(number, index, *values)
+
+        data = [string.encode() for string in self.strings]
+        position = 0
+        for value in data:
+            output += OFFSET.pack(position)
+            position += len(value)
+        output += OFFSET.pack(position)
+        output += b''.join(data)
+        return bytes(output)
+
+
+def pack(device):
+    """Compile device (see pysvd.load()) into image"""
+    writer = Writer()
+    writer.add('device', (device,))
+    return writer.pack()
+
+
+def write(device, filename):
+    """Compile device into image file. The file is replaced atomically, so processes having mapped the old file are not affected."""
+    directory = os.path.dirname(os.path.abspath(filename))
+    (handle, temporary) = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(pack(device))
+        os.replace(temporary, filename)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+def load(filename):
+    """Open image file and return the device view"""
+    with builtins.open(filename, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Image(buffer).device
+
+
+def shared_memory():
+    """Import the shared memory support of multiprocessing, which is available since Python 3.8"""
+    try:
+        import multiprocessing.resource_tracker
+        import multiprocessing.shared_memory
+    except ImportError:
+        raise RuntimeError("Publishing devices in shared memory requires Python 3.8 or later") from None
+    return multiprocessing.shared_memory
+
+
+def publish(device, name=None):
+    """Compile device into a new shared memory block, which other processes attach to by name (see attach()). The block is removed when
+    the returned Shared is closed."""
+    SharedMemory = shared_memory().SharedMemory
+    data = pack(device)
+    memory = SharedMemory(name, create=True, size=len(data))
+    memory.buf[:len(data)] = data
+    return Shared(memory, True)
+
+
+def attach(name):
+    """Attach to device published in shared memory block name. Nothing is copied, all processes read the same memory."""
+    SharedMemory = shared_memory().SharedMemory
+    try:
+        memory = SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 every block is registered at the resource tracker, which would remove it when this process exits. The tracker
+        # is shared with the publishing process, so the registration is suppressed instead of removing the one of the publisher.
+        with registering:
+            register = multiprocessing.resource_tracker.register
+            multiprocessing.resource_tracker.register = lambda name, rtype: None
+            try:
+                memory = SharedMemory(name)
+            finally:
+                multiprocessing.resource_tracker.register = register
+    return Shared(memory, False)
+
+
+class Shared(object):
+    """Device image in shared memory. The views of the device are invalid after close()."""
+
+    def __init__(self, memory, owner):
+        self.memory = memory
+        self.owner = owner
+        self.image = Image(memory.buf)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    @property
+    def device(self):
+        return self.image.device
+
+    def close(self):
+        """Detach from shared memory block, the publishing process also removes the block"""
+        self.image.buffer = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Image(object):
+    """Compiled device in a buffer (bytes, mmap or memoryview)"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+        (file_magic, file_version, count) = HEADER.unpack_from(buffer, 0)
+        if file_magic != magic:
+            raise ValueError("No compiled device image")
+        if file_version != version or count != len(kinds) + 1:
+            raise ValueError("Unsupported image version {}".format(file_version))
+
+        self.tables = [ENTRY.unpack_from(buffer, HEADER.size + ENTRY.size * number) for number in range(count)]
+        (self.strings, count) = self.tables.pop()
+        self.data = self.strings + OFFSET.size * (count + 1)
+
+        # Name index of element lists by (kind number, first index)
+        self.names = {}
+
+    @property
+    def device(self):
+        return View(self, 0, 0)
+
+    def offset(self, number, index):
+        """Buffer offset of record"""
+        return self.tables[number][0] + kinds[number].format.size * index
+
+    def string(self, index):
+        (start, end) = ENTRY.unpack_from(self.buffer, self.strings + OFFSET.size * index)
+        return str(self.buffer[self.data + start:self.data + end], 'utf-8')
+
+    def index(self, number, first, count):
+        """Get index of names to record index of element list, built on first use"""
+        names = self.names.get((number, first))
+        if names is None:
+            names = self.names[(number, first)] = {}
+            column = kinds[number].columns.get('name')
+            if column is not None:
+                (bit, offset, format, parser, members) = column
+                for index in range(first, first + count):
+                    record = self.offset(number, index)
+                    (mask,) = MASK.unpack_from(self.buffer, record + PARENT.size)
+                    if mask & bit:
+                        names.setdefault(self.string(format.unpack_from(self.buffer, record + offset)[0]), index)
+        return names
+
+
+class View(object):
+    """Read-only element of an image. Attributes and child elements are read from the image on access, like the attributes of the parsed
+    elements. Missing optional attributes raise AttributeError, has() checks for them."""
+
+    __slots__ = ('image', 'number', 'index')
+
+    def __init__(self, image, number, index):
+        self.image = image
+        self.number = number
+        self.index = index
+
+    @property
+    def kind(self):
+        return kinds[self.number]
+
+    @property
+    def parent(self):
+        (number, index) = PARENT.unpack_from(self.image.buffer, self.image.offset(self.number, self.index))
+        return None if index == NONE else View(self.image, number, index)
+
+    def list(self, attribute):
+        """Get child element list by attribute name"""
+        (offset, kind) = self.kind.lists[attribute]
+        (first, count) = ENTRY.unpack_from(self.image.buffer, self.image.offset(self.number, self.index) + offset)
+        return Views(self.image, numbers[kind], first, count)
+
+    def has(self, name):
+        kind = self.kind
+        if name in kind.columns:
+            (mask,) = MASK.unpack_from(self.image.buffer, self.image.offset(self.number, self.index) + PARENT.size)
+            return bool(mask & kind.columns[name][0])
+        if name in kind.singles:
+            return len(self.list(name)) > 0
+        return name in kind.children
+
+    def __getattr__(self, name):
+        kind = kinds[self.number]
+        column = kind.columns.get(name)
+        if column is not None:
+            if not self.has(name):
+                raise AttributeError("'{}' object has no attribute '{}'".format(kind.name, name))
+
+            (bit, offset, format, parser, members) = column
+            (value,) = format.unpack_from(self.image.buffer, self.image.offset(self.number, self.index) + offset)
+            if parser is pysvd.parser.Text:
+                return self.image.string(value)
+            if members is not None:
+                return members[value]
+            if parser is pysvd.parser.Boolean:
+                return bool(value)
+            return value
+
+        if name in kind.children:
+            return self.list(name)
+        if name in kind.singles and self.has(name):
+            return self.list(name)[0]
+        raise AttributeError("'{}' object has no attribute '{}'".format(kind.name, name))
+
+    def find(self, name):
+        """Find child element by name"""
+        for attribute in self.kind.children:
+            element = self.list(attribute).find(name)
+            if element is not None:
+                return element
+        return None
+
+    def children(self):
+        for attribute in self.kind.children:
+            yield from self.list(attribute)
+
+    def __eq__(self, other):
+        if not isinstance(other, View):
+            return NotImplemented
+        return self.image is other.image and self.number == other.number and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.image), self.number, self.index))
+
+    def __repr__(self):
+        return "<{} {}>".format(self.kind.name, self.name if self.has('name') else self.index)
+
+
+class Views(collections.abc.Sequence):
+    """Read-only child element list of an image"""
+
+    __slots__ = ('image', 'number', 'first', 'count')
+
+    def __init__(self, image, number, first, count):
+        self.image = image
+        self.number = number
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("list index out of range")
+        return View(self.image, self.number, self.first + index)
+
+    def find(self, name):
+        """Find element by name"""
+        index = self.image.index(self.number, self.first, self.count).get(name)
+        return None if index is None else View(self.image, self.number, index)
@@ -0,0 +1,269 @@
+"""Persistent and in-memory caches of parsed devices.
+
+Loaded devices (with resolved derivedFrom references and dim arrays) are pickled into a cache directory. The file name is a hash of the
+SVD file content, the pysvd version and the load options, so modified files or updated versions never hit stale entries.
+
+Entries are written to a temporary file and renamed, so processes populating the cache at the same time never read partial entries. The
+size of the cache directory is limited, the least recently used entries are removed first.
+
+Note: Entries are unpickled, so the cache directory must not be writable by others.
+
+DeviceCache keeps loaded devices of a process, so all users of a file share one device.
+"""
+import collections
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+import pysvd
+
+
+class Cache(object):
+    """Cache directory of parsed devices.
+
+    The default directory is $PYSVD_CACHE or pysvd within $XDG_CACHE_HOME (~/.cache). The default size limit is 256 MB.
+    """
+
+    # File name extension of cache entries
+    extension = '.pickle'
+
+    # Temporary files of crashed writers are removed after this time in seconds
+    timeout = 3600
+
+    def __init__(self, directory=None, size=256 * 1024 * 1024):
+        if directory is None:
+            directory = os.environ.get('PYSVD_CACHE')
+        if directory is None:
+            directory = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'pysvd')
+        self.directory = directory
+        self.size = size
+
+    def key(self, data, **options):
+        """Get cache key of SVD file content and load options"""
+        digest = hashlib.sha256(data)
+        digest.update(pysvd.__version__.encode())
+        for name in sorted(options):
+            digest.update('\0{}={!r}'.format(name, options[name]).encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.extension)
+
+    def get(self, key):
+        """Get cached device, None if not cached. Unreadable entries are removed."""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                device = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.remove(path)
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return device
+
+    def put(self, key, device):
+        """Store device and remove the least recently used entries exceeding the size limit"""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        (handle, temporary) = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(device, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            self.remove(temporary)
+            raise
+        self.evict()
+
+    def entries(self):
+        """List (modification time, size, path) of all entries"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+
+        now = time.time()
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            if name.endswith(self.extension):
+                entries.append((stat.st_mtime, stat.st_size, path))
+            elif name.endswith('.tmp') and now - stat.st_mtime > self.timeout:
+                self.remove(path)
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the size limit is met"""
+        entries = sorted(self.entries())
+        total = sum(size for (mtime, size, path) in entries)
+        for (mtime, size, path) in entries:
+            if total <= self.size:
+                break
+            self.remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+        for (mtime, size, path) in self.entries():
+            self.remove(path)
+
+    def remove(self, path):
+        # Entries may be removed by other processes at the same time
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def load(self, source, lazy=False, workers=None):
+        """Load device from SVD file name or file object, see pysvd.loader.load(). The device is parsed only if it is not cached.
+
+        Cached devices do not keep their XML nodes, unpickling the nodes would take longer than parsing the file again.
+        """
+        if isinstance(source, (str, bytes, os.PathLike)):
+            with open(source, 'rb') as file:
+                data = file.read()
+        else:
+            data = source.read()
+            if isinstance(data, str):
+                data = data.encode()
+
+        key = self.key(data, lazy=lazy)
+        device = self.get(key)
+        if device is None:
+            device = pysvd.loader.load(io.BytesIO(data), lazy, False, workers=workers)
+            self.put(key, device)
+        return device
+
+
+def load(source, lazy=False, cache=True, workers=None):
+    """Load device through cache, which is either a Cache or True for the default cache"""
+    if not isinstance(cache, Cache):
+        cache = Cache()
+    return cache.load(source, lazy, workers)
+
+
+class DeviceCache(object):
+    """Loaded devices of this process by file name or content hash.
+
+    Devices are loaded with the options of the cache (see pysvd.loader.load()) on the first request of a file and shared afterwards.
+    Files with the same content share one device. The least recently used devices are dropped when their total approximate memory (see
+    pysvd.memory.sizeof()) exceeds size bytes, 512 MB by default. Hits, misses and evictions count the requests since construction.
+
+    Cached devices are shared, they must not be modified by their users.
+    """
+
+    def __init__(self, size=512 * 1024 * 1024, lazy=False, keep_xml=False, cache=False):
+        self.size = size
+        self.options = (lazy, keep_xml, cache)
+
+        # Content hash to (device, size) in order of use and file names to (modification time, file size, content hash)
+        self.devices = collections.OrderedDict()
+        self.files = {}
+        self.total = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def key(self, data):
+        """Get content hash of SVD file content"""
+        return hashlib.sha256(data).hexdigest()
+
+    def find(self, key):
+        """Get device of content hash, None if not cached"""
+        with self.lock:
+            entry = self.devices.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.devices.move_to_end(key)
+            return entry[0]
+
+    def load(self, source):
+        """Get device of SVD file name or file object, the file is loaded if it is not cached"""
+        data = None
+        if isinstance(source, (str, bytes, os.PathLike)):
+            # Unmodified files are not read again to get their content hash
+            path = os.path.realpath(source)
+            stat = os.stat(path)
+            with self.lock:
+                known = self.files.get(path)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                key = known[2]
+            else:
+                with open(path, 'rb') as file:
+                    data = file.read()
+                key = self.key(data)
+                with self.lock:
+                    self.files[path] = (stat.st_mtime_ns, stat.st_size, key)
+        else:
+            data = source.read()
+            if isinstance(data, str):
+                data = data.encode()
+            key = self.key(data)
+
+        device = self.find(key)
+        if device is not None:
+            return device
+
+        if data is None:
+            with open(path, 'rb') as file:
+                data = file.read()
+        return self.put(key, pysvd.loader.load(io.BytesIO(data), *self.options))
+
+    def put(self, key, device):
+        """Add device of content hash and drop the least recently used devices exceeding the size. Returns the cached device, which is a
+        device added by another thread in the meantime."""
+        size = pysvd.memory.sizeof(device)
+        with self.lock:
+            entry = self.devices.get(key)
+            if entry is not None:
+                return entry[0]
+
+            self.devices[key] = (device, size)
+            self.total += size
+        self.evict()
+        return device
+
+    def evict(self):
+        """Drop least recently used devices until the size limit is met"""
+        with self.lock:
+            while self.total > self.size and self.devices:
+                (_, (_, size)) = self.devices.popitem(last=False)
+                self.total -= size
+                self.evictions += 1
+
+    def memory(self, key):
+        """Get approximate memory in bytes of cached device of content hash, None if not cached"""
+        entry = self.devices.get(key)
+        return None if entry is None else entry[1]
+
+    def clear(self):
+        """Drop all devices"""
+        with self.lock:
+            self.devices.clear()
+            self.files.clear()
+            self.total = 0
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __contains__(self, key):
+        return key in self.devices
@@ -6,50 +6,729 @@ import pysvd
 # on every parent object automatically.
 
 
+class Unresolved(KeyError):
+    """Raised if a derivedFrom path can not be resolved yet, but the root element resolves pending elements after parsing"""
+
+    def __init__(self, message, root):
+        super().__init__(message)
+        self.root = root
+
+
+class Pending(object):
+    """Node element with forward derivedFrom reference, which is constructed by the root element after parsing"""
+
+    def __init__(self, cls, parent, elements, node, error):
+        self.cls = cls
+        self.parent = parent
+        self.elements = elements
+        self.node = node
+        self.error = error
+        self.position = list.__len__(elements)
+
+    def within(self, element):
+        """Check if pending element is a descendant of element"""
+        parent = self.parent
+        while parent is not None:
+            if parent is element:
+                return True
+            parent = parent.parent
+        return False
+
+    def insert(self, elements, inserted):
+        """Insert constructed Elements at recorded position. inserted keeps track of insertions per list to correct the position."""
+        if isinstance(self.elements, Elements):
+            items = list(elements.loaded(True))
+        else:
+            items = list(elements)
+
+        offsets = inserted.setdefault(id(self.elements), [])
+        index = self.position
+        for (position, count) in offsets:
+            if position <= self.position:
+                index += count
+        offsets.append((self.position, len(items)))
+
+        # Insert without loading or expanding, positions refer to the list as it is stored
+        list.__setitem__(self.elements, slice(index, index), items)
+        if isinstance(self.elements, Elements):
+            self.elements.names = None
+            self.elements.arrays += elements.arrays
+            self.elements.unexpanded = self.elements.unexpanded or elements.unexpanded
+
+
+class DimArray(object):
+    """Virtual sequence of the elements of a dim array.
+
+    The array element node is parsed once as template. Names and offsets of the array elements are computed from the template, the
+    elements itself are only created on access by index or iteration. Created elements are cached and shared by slices of the array.
+    """
+
+    def __init__(self, template, indices, increment, positions=None, elements=None):
+        self.template = template
+        self.indices = indices
+        self.increment = increment
+        self.positions = range(len(indices)) if positions is None else positions
+        self.elements = {} if elements is None else elements
+        self.keys = None
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DimArray(self.template, self.indices[index], self.increment, self.positions[index], self.elements)
+
+        position = self.positions[index]
+        object = self.elements.get(position)
+        if object is None:
+            object = self.template.instance()
+            object.set_index(self.indices[index])
+            object.set_offset(position * self.increment)
+            self.elements[position] = object
+        return object
+
+    def __iter__(self):
+        for index in range(len(self.indices)):
+            yield self[index]
+
+    def name(self, index):
+        """Get name of array element without creating it"""
+        return self.template.name.replace('%s', str(self.indices[index]))
+
+    def offset(self, index):
+        """Get offset attribute (e.g. 'addressOffset') of array element without creating it, None if the element has none"""
+        attribute = self.template.offset_attribute
+        if attribute is None:
+            return None
+        return getattr(self.template, attribute) + self.positions[index] * self.increment
+
+    def find(self, name):
+        """Find array element by name. Only the found element is created."""
+        prefix, separator, suffix = self.template.name.partition('%s')
+        if not separator:
+            return self[0] if name == prefix and len(self) else None
+        if len(name) < len(prefix) + len(suffix) or not name.startswith(prefix) or not name.endswith(suffix):
+            return None
+
+        key = name[len(prefix):len(name) - len(suffix)]
+        if isinstance(self.indices, range):
+            if not key.isdigit() or str(int(key)) != key or int(key) not in self.indices:
+                return None
+            return self[self.indices.index(int(key))]
+
+        if self.keys is None:
+            self.keys = {}
+            for (index, value) in enumerate(self.indices):
+                self.keys.setdefault(str(value), index)
+        index = self.keys.get(key)
+        return None if index is None else self[index]
+
+
+class Elements(list):
+    """List of child elements.
+
+    In lazy mode the element nodes are only recorded with defer() and parsed when the list is accessed the first time.
+
+    Dim arrays are added as DimArray and expanded to their elements when the list is accessed as a whole (e.g. iteration, slicing or
+    comparison). find(), len() and indexing do not expand the arrays, so single array elements can be looked up without creating the
+    others.
+
+    Elements are indexed by name for find(). Appended elements are indexed incrementally, any other modification of the list rebuilds the
+    index. Renaming an indexed element resets the index (see Base.unindex()).
+    """
+
+    # Element lists are the most frequent objects next to the elements, sources and arrays are shared empty tuples until used
+    __slots__ = ('sources', 'names', 'indexed', 'arrays', 'unexpanded')
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.sources = ()
+        self.names = None
+        self.arrays = ()
+        self.unexpanded = False
+
+    def defer(self, cls, parent, node, name):
+        """Record node elements to be parsed on first access"""
+        self.sources += ((cls, parent, node, name),)
+
+    def add_array(self, array, stored=True):
+        """Add dim array without creating its elements. If not stored, the array is only used to find its elements by name."""
+        self.load_sources()
+        if stored:
+            super().append(array)
+            self.unexpanded = True
+        self.arrays += (array,)
+
+    def load(self):
+        """Parse all deferred node elements and expand dim arrays"""
+        self.load_sources()
+        if self.unexpanded:
+            self.expand()
+
+    def load_sources(self):
+        """Parse all deferred node elements"""
+        sources = self.sources
+        if sources:
+            # Clear sources first, so elements resolving derivedFrom during load see the already parsed elements
+            self.sources = ()
+            root = sources[0][1].root()
+            if root.pending is not None:
+                root.loading += 1
+            try:
+                for (cls, parent, node, name) in sources:
+                    if cls is None:
+                        # Elements of base element list, which is complete after its forward references are constructed
+                        node.load_sources()
+                        if root.pending:
+                            root.resolve_pending(node)
+                        self.copy(parent, node)
+                        continue
+
+                    for subnode in node.findall(name):
+                        cls.try_add_element(parent, self, subnode)
+            finally:
+                if root.pending is not None:
+                    root.loading -= 1
+
+            # Forward references are resolved when the outermost load is done
+            if root.pending and not root.loading:
+                root.resolve_pending()
+
+    def expand(self):
+        """Replace dim arrays by their elements"""
+        self.unexpanded = False
+        self.names = None
+        items = []
+        arrays = []
+        for (index, item) in enumerate(super().__iter__()):
+            if isinstance(item, DimArray):
+                arrays.append((index, item))
+                items.extend(item)
+            else:
+                items.append(item)
+        super().__setitem__(slice(None), items)
+
+        # Keep positions of pending elements recorded behind the arrays
+        root = arrays[0][1].template.root() if arrays else None
+        for record in getattr(root, 'pending', None) or ():
+            if record.elements is self:
+                record.position += sum(len(array) - 1 for (index, array) in arrays if index < record.position)
+
+    def share(self, elements):
+        """Add parsed elements and dim arrays of elements list without expanding them"""
+        super().extend(elements.loaded(True))
+        self.arrays += elements.arrays
+        self.unexpanded = self.unexpanded or elements.unexpanded
+
+    def copy(self, parent, elements):
+        """Add copies of the parsed elements and dim arrays of elements list with parent as their parent, without expanding the arrays"""
+        copies = {}
+
+        def copy(element):
+            result = copies.get(id(element))
+            if result is None:
+                result = copies[id(element)] = element.copy(parent)
+            return result
+
+        arrays = {}
+        for array in elements.arrays:
+            created = {position: copy(element) for (position, element) in array.elements.items()}
+            arrays[id(array)] = DimArray(copy(array.template), array.indices, array.increment, None, created)
+
+        for item in elements.loaded(True):
+            super().append(arrays[id(item)] if isinstance(item, DimArray) else copy(item))
+        self.arrays += tuple(arrays.values())
+        self.unexpanded = self.unexpanded or elements.unexpanded
+
+    def inherit(self, parent, elements):
+        """Add elements of base element list without parsing them again. The elements are copied with parent as their parent on first
+        access of the list."""
+        self.sources += ((None, parent, elements, None),)
+
+    def loaded(self, arrays=False):
+        """Iterate over elements without loading deferred ones. Not expanded dim arrays are skipped, unless arrays is set."""
+        if arrays or not self.unexpanded:
+            return super().__iter__()
+        return (item for item in super().__iter__() if not isinstance(item, DimArray))
+
+    def created(self):
+        """Iterate over already created elements including the templates and created elements of dim arrays"""
+        seen = set()
+        for item in super().__iter__():
+            if not isinstance(item, DimArray):
+                seen.add(id(item))
+                yield item
+        for array in self.arrays:
+            for item in (array.template, *array.elements.values()):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    yield item
+
+    def find(self, name):
+        """Find element by name"""
+        self.load_sources()
+
+        if self.names is None:
+            self.names = {}
+            self.indexed = 0
+
+        length = super().__len__()
+        if self.indexed < length:
+            for element in super().__getitem__(slice(self.indexed, length)):
+                if not isinstance(element, DimArray):
+                    self.names.setdefault(element.name, element)
+            self.indexed = length
+
+        element = self.names.get(name)
+        if element is None:
+            for array in self.arrays:
+                element = array.find(name)
+                if element is not None:
+                    break
+        return element
+
+    def __reduce__(self):
+        # Pickle parsed elements without expanding dim arrays. The elements are passed to the constructor, as the list methods of the
+        # default protocol would access the slots before they are restored.
+        self.load_sources()
+        return (self.__class__, (list(self.loaded(True)),), (self.arrays, self.unexpanded))
+
+    def __setstate__(self, state):
+        (self.arrays, self.unexpanded) = state
+
+    def __len__(self):
+        self.load_sources()
+        if self.unexpanded:
+            return sum(len(item) if isinstance(item, DimArray) else 1 for item in super().__iter__())
+        return super().__len__()
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __reversed__(self):
+        self.load()
+        return super().__reversed__()
+
+    def __getitem__(self, index):
+        self.load_sources()
+        if self.unexpanded and not isinstance(index, slice):
+            return self.item(index)
+        self.load()
+        return super().__getitem__(index)
+
+    def item(self, index):
+        """Get element by index without expanding dim arrays, only the element of an array at index is created"""
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for item in super().__iter__():
+                if not isinstance(item, DimArray):
+                    if not index:
+                        return item
+                    index -= 1
+                elif index < len(item):
+                    return item[index]
+                else:
+                    index -= len(item)
+        raise IndexError("list index out of range")
+
+    def __contains__(self, item):
+        self.load()
+        return super().__contains__(item)
+
+    def __eq__(self, other):
+        self.load()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self.load()
+        return super().__ne__(other)
+
+    def __repr__(self):
+        self.load()
+        return super().__repr__()
+
+    def index(self, *args):
+        self.load()
+        return super().index(*args)
+
+    def count(self, item):
+        self.load()
+        return super().count(item)
+
+    def append(self, item):
+        self.load_sources()
+        super().append(item)
+
+    def extend(self, items):
+        self.load_sources()
+        super().extend(items)
+
+    def insert(self, index, item):
+        self.load()
+        self.names = None
+        super().insert(index, item)
+
+    def __setitem__(self, index, item):
+        self.load()
+        self.names = None
+        super().__setitem__(index, item)
+
+    def __delitem__(self, index):
+        self.load()
+        self.names = None
+        super().__delitem__(index)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def remove(self, item):
+        self.load()
+        self.names = None
+        super().remove(item)
+
+    def pop(self, *args):
+        self.load()
+        self.names = None
+        return super().pop(*args)
+
+    def clear(self):
+        self.sources = ()
+        self.names = None
+        self.arrays = ()
+        self.unexpanded = False
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self.load()
+        self.names = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self.load()
+        self.names = None
+        super().reverse()
+
+
+class NoElements(tuple):
+    """Empty read-only list of child elements, returned by Base.child_list() for absent lists"""
+
+    __slots__ = ()
+
+    def find(self, name):
+        return None
+
+    def loaded(self, arrays=False):
+        return iter(())
+
+    def created(self):
+        return iter(())
+
+
+empty = NoElements()
+
+
+class Children(object):
+    """Class attribute of a list of child elements. Elements without such children do not store a list, it is created by factory on the
+    first access of the attribute and can be modified like any other list. Base.child_list() reads the list without creating it."""
+
+    def __init__(self, factory=Elements):
+        self.factory = factory
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        elements = instance.__dict__[self.name] = self.factory()
+        return elements
+
+
 class Base(object):
     """Base class for all SVD elements"""
 
+    # Parse child elements on first access
+    lazy = False
+
+    # Keep reference to XML node after parsing, otherwise node is None
+    keep_xml = True
+    node = None
+
+    # Text of the direct children of node by tag (see pysvd.node.Texts()) while the node is parsed, otherwise None
+    texts = None
+
+    # List of Pending elements, if the element resolves forward derivedFrom references after parsing
+    pending = None
+
+    # Base element, set by derived elements only
+    derivedFrom = None
+
     def __init__(self, node):
-        self.node = node
-        self.parent = getattr(self, 'parent', None)
-        self.derivedFrom = None
+        # Nothing to invalidate during construction, attributes are set without __setattr__()
+        self.__dict__['node'] = node
+        self.__dict__.setdefault('parent', None)
+
+        self.__dict__['texts'] = None if node is None else pysvd.node.Texts(node)
+        try:
+            self.parse(self.node)
+        finally:
+            del self.__dict__['texts']
+        if not self.keep_xml:
+            del self.__dict__['node']
+
+    def __getstate__(self):
+        # XML nodes are not pickled, nodes of lxml can not be pickled at all
+        state = self.__dict__.copy()
+        state.pop('node', None)
+        return state
+
+    def __setattr__(self, name, value):
+        if name == 'name':
+            self.unindex()
+        super().__setattr__(name, value)
+        self.changed(name)
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        self.changed(name)
+
+    def changed(self, name):
+        """Invalidate cached inherited attributes after attribute name has been modified"""
+        if name == 'parent':
+            self.uncache()
+            self.invalidate()
+        elif name in Group.inheritable:
+            cached = self.__dict__.get('cached')
+            if cached and name in cached:
+                self.__dict__['cached'] = tuple(attr for attr in cached if attr != name)
+            self.invalidate(name)
+
+    def unindex(self):
+        """Remove element from the name index of the child element lists of its parent and the symbol table of the root element before
+        it is renamed. Elements not yet added to a list (e.g. while parsing) are not indexed."""
+        name = self.__dict__.get('name')
+        parent = self.__dict__.get('parent')
+        if name is None or parent is None:
+            return
+
+        for value in parent.__dict__.values():
+            if isinstance(value, Elements) and value.names is not None and value.names.get(name) is self:
+                value.names = None
+
+        root = self.root()
+        symbols = root.__dict__.get('symbols')
+        if symbols:
+            path = [name]
+            element = parent
+            while element is not root:
+                path.append(element.name)
+                element = element.parent
+
+            # The paths of the element and its descendants change, the table is filled again on lookup
+            if symbols.get('.'.join(reversed(path))) is self:
+                root.__dict__['symbols'] = {}
+
+    def copy(self, parent):
+        """Create copy of element with another parent without parsing its node again. Attributes are shared, child elements are copied
+        with the copy as their parent (lists of child elements on their first access)."""
+        object = self.__class__.__new__(self.__class__)
+        state = object.__dict__
+        state.update(self.__dict__)
+        state['parent'] = parent
+        if 'cached' in state:
+            object.uncache()
+        for (name, value) in self.__dict__.items():
+            if isinstance(value, (Base, list)) and name not in ('parent', 'derivedFrom', 'node'):
+                state[name] = object.adopt(value)
+        return object
+
+    def adopt(self, value):
+        """Get attribute value with copies of the child elements it contains with self as their parent, other values are returned
+        unchanged"""
+        if isinstance(value, Elements):
+            elements = Elements()
+            elements.inherit(self, value)
+            return elements
+        if isinstance(value, Base):
+            return value.copy(self)
+        if isinstance(value, list):
+            return [item.copy(self) if isinstance(item, Base) else item for item in value]
+        return value
+
+    def uncache(self, name=None):
+        """Remove cached inherited attribute name, all cached attributes if None"""
+        cached = self.__dict__.get('cached')
+        if cached and (name is None or name in cached):
+            for attr in cached if name is None else (name,):
+                del self.__dict__[attr]
+            self.__dict__['cached'] = tuple(attr for attr in cached if name is not None and attr != name)
+
+    def invalidate(self, name=None):
+        """Remove cached inherited attribute name (all if None) of all created descendants"""
+        for (key, value) in self.__dict__.items():
+            if key in ('parent', 'derivedFrom', 'node'):
+                continue
+
+            if isinstance(value, Base):
+                children = (value,)
+            elif isinstance(value, Elements):
+                children = value.created()
+            elif isinstance(value, list):
+                children = value
+            else:
+                continue
 
-        self.parse(self.node)
+            for child in children:
+                if isinstance(child, Base) and child.parent is self:
+                    child.uncache(name)
+                    child.invalidate(name)
 
     def parse(self, node):
         """Overwrite in derived classes to parse nodes"""
         pass
 
+    def element(self, node, name, mandatory=False):
+        """Get text of child element name of node, see pysvd.node.Element(). The node of the element is looked up in its texts while it
+        is parsed."""
+        return pysvd.node.Element(node, name, mandatory, self.texts if node is self.node else None)
+
     def add_attribute(self, node, name, parser_type, mandatory=False, default=None):
         """Parse node element as given type and add it to self if not None"""
-        value = parser_type(pysvd.node.Element(node, name, mandatory), default)
+        value = parser_type(self.element(node, name, mandatory), default)
         if value is not None:
             self.__dict__[name] = value
 
+    def add_attributes(self, node, schema, mandatory=(), defaults=None):
+        """Parse all child elements of node contained in schema (tag to parser, see pysvd.schema) from the texts of node and add them to
+        self. Mandatory tags must be present, defaults are added for tags not present."""
+        texts = self.texts if node is self.node and self.texts is not None else pysvd.node.Texts(node)
+        for tag in mandatory:
+            if tag not in texts:
+                raise SyntaxError("Element '{}.{}' is mandatory, but not present!".format(node.tag, tag))
+
+        for (tag, text) in texts.items():
+            if tag in schema:
+                self.__dict__[tag] = schema[tag](pysvd.node.Normalize(text))
+
+        if defaults:
+            for (tag, value) in defaults.items():
+                if tag not in texts:
+                    self.__dict__[tag] = value
+
     def add_enum_attribute(self, node, name, enum, mandatory=False, default=None):
         """Parse node element as given enum and add it to self if not None"""
-        value = pysvd.parser.Enum(enum, pysvd.node.Element(node, name, mandatory), default)
+        value = pysvd.parser.Enum(enum, self.element(node, name, mandatory), default)
         if value is not None:
             self.__dict__[name] = value
 
+    def has(self, name):
+        """Check if optional attribute is present without raising AttributeError. Equal to hasattr() for SVD attributes, lists of child
+        elements are always present (see Children), has() does not create them."""
+        return name in self.__dict__ or isinstance(getattr(type(self), name, None), Children)
+
+    def child_list(self, name):
+        """Get list of child elements name without creating it, an empty read-only list if the element has no such children"""
+        return self.__dict__.get(name, empty)
+
     def find(self, name):
         """Find child by name. Has to be overwritten by each derived class with child elements."""
         assert not hasattr(super(), 'find')
         return None
 
+    def children(self):
+        """Iterate over already parsed child elements, which can be found by name. Has to be overwritten by each derived class with child
+        elements."""
+        return iter(())
+
+    def root(self):
+        """Get root element of tree"""
+        element = self
+        while element.parent is not None:
+            element = element.parent
+        return element
+
+    def resolve(self, path):
+        """Find descendant by dotted path, e.g. 'TIM1.CCMR1_Output.OC1M'"""
+        element = self
+        for name in path.split('.'):
+            element = element.find(name)
+            if element is None:
+                return None
+        return element
+
+    def address(self, path):
+        """Get absolute address of descendant by dotted path, e.g. 'TIMER0.CH[37].CTRL'. The address is accumulated along the path."""
+        address = getattr(self, 'baseAddress', 0)
+        element = self
+        for name in path.split('.'):
+            element = element.find(name)
+            if element is None:
+                return None
+            if 'baseAddress' in element.__dict__:
+                address = element.baseAddress
+            elif 'addressOffset' in element.__dict__:
+                address += element.addressOffset
+        return address
+
+    def __getitem__(self, name):
+        """Get child by name, e.g. device['GPIOA']['MODER']['MODE3']"""
+        element = self.find(name)
+        if element is None:
+            raise KeyError("'{}' has no child element '{}'".format(getattr(self, 'name', self.__class__.__name__), name))
+        return element
+
+    def add_children(self, cls, attribute, node, name, factory=Elements):
+        """Parse node elements as cls and add them to the list of child elements attribute. The list is created by factory on the first
+        element, elements without such children do not store a list (see Children)."""
+        if node.find(name) is None:
+            return
+
+        elements = self.__dict__.get(attribute)
+        if elements is None:
+            elements = factory()
+            self.__dict__[attribute] = elements
+        cls.add_elements(self, elements, node, name)
+
     @classmethod
     def add_elements(cls, parent, elements, node, name):
-        """Parse node elements and add them to elements list"""
+        """Parse node elements and add them to elements list. If parent is lazy, parsing is deferred to first access of elements."""
+
+        if parent is not None and parent.lazy and isinstance(elements, Elements):
+            elements.defer(cls, parent, node, name)
+            return
 
         for subnode in node.findall(name):
-            elements.append(cls(parent, subnode))
+            cls.try_add_element(parent, elements, subnode)
+
+    @classmethod
+    def add_element(cls, parent, elements, node):
+        """Parse a single node element and add it to elements list"""
+
+        elements.append(cls(parent, node))
+
+    @classmethod
+    def try_add_element(cls, parent, elements, node):
+        """Parse a single node element and add it to elements list. If its derivedFrom can not be resolved yet, it is recorded as pending
+        on the root element."""
+
+        try:
+            cls.add_element(parent, elements, node)
+        except Unresolved as error:
+            error.root.pending.append(Pending(cls, parent, elements, node, error))
 
 
 class Parent(Base):
     """Base class for parents"""
 
     def __init__(self, parent, node):
-        self.parent = parent
+        self.__dict__['parent'] = parent
+        if parent is not None and parent.lazy:
+            self.lazy = True
+        if parent is not None and not parent.keep_xml:
+            self.keep_xml = False
 
         super().__init__(node)
 
@@ -59,6 +738,13 @@ class Group(Parent):
 
     attributes = ['size', 'access', 'protection', 'resetValue', 'resetMask']
 
+    # Attributes inherited by any derived class, modifying them invalidates the cached values of descendants
+    inheritable = set(attributes)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Group.inheritable.update(cls.attributes)
+
     def __init__(self, parent_, node):
         super().__init__(parent_, node)
 
@@ -67,12 +753,30 @@ class Group(Parent):
             parent = self.parent
             while parent is not None:
                 try:
-                    return parent.__getattribute__(attr)
+                    value = parent.__getattribute__(attr)
                 except AttributeError:
                     parent = parent.parent
+                    continue
+
+                # Cache inherited value as own attribute, it is removed again if an attribute of a parent is modified
+                self.__dict__[attr] = value
+                self.__dict__['cached'] = self.__dict__.get('cached', ()) + (attr,)
+                return value
 
         raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, attr))
 
+    def has(self, name):
+        if super().has(name):
+            return True
+
+        if name in self.attributes:
+            parent = self.parent
+            while parent is not None:
+                if name in parent.__dict__:
+                    return True
+                parent = parent.parent
+        return False
+
 
 class Derive(Group):
     """Base for deriveable classes"""
@@ -86,96 +790,145 @@ class Derive(Group):
         # If derived, search class, call parse attributes of derived object and call base ctor
         derivedFrom = pysvd.node.Attribute(node, 'derivedFrom')
         if derivedFrom is not None:
-            parts = derivedFrom.split('.')
-            count = len(parts) - 1
-            object = self.parent
-            while count:
-                object = object.parent
-                count -= 1
-
-            if object is None:
-                name = pysvd.parser.Text(pysvd.node.Element(node, 'name'))
-                raise KeyError("Can not find root element from path '{}' to derive '{}'".format(derivedFrom, name))
+            object = self.find_derived(derivedFrom)
+            self.inherit(object)
+            self.derivedFrom = object
 
+    def inherit(self, base):
+        """Take over attributes and child elements of base element without parsing its node again. Child elements are copied with this
+        element as their parent, lists of child elements on their first access. The copies share the attribute values of the base
+        elements, but are objects of their own: parsing scales with the distinct elements, memory of accessed child elements with all."""
+
+        cached = base.__dict__.get('cached', ())
+        for (name, value) in base.__dict__.items():
+            if name in ('node', 'parent', 'derivedFrom', 'lazy', 'keep_xml', 'cached') or name in cached:
+                continue
+            self.__dict__[name] = self.adopt(value)
+
+    def find_derived(self, derivedFrom):
+        """Find element to derive from. The path is first looked up relative to the parent level given by the number of path elements,
+        afterwards as absolute path from the root element."""
+
+        parts = derivedFrom.split('.')
+        count = len(parts) - 1
+        object = self.parent
+        while count and object is not None:
+            object = object.parent
+            count -= 1
+
+        if object is None:
+            name = pysvd.parser.Text(self.element(self.node, 'name'))
+            error = "Can not find root element from path '{}' to derive '{}'".format(derivedFrom, name)
+        else:
             for name in parts:
                 res = object.find(name)
                 if res is None:
-                    raise KeyError("Can not find path element '{}' from path '{}' in object '{}'".format(name, derivedFrom, object.name))
+                    error = "Can not find path element '{}' from path '{}' in object '{}'".format(name, derivedFrom, object.name)
+                    break
                 object = res
+            else:
+                root = self.root()
+                if not root.pending or not any(record.within(object) for record in root.pending):
+                    return object
 
-            self.parse(object.node)
-            self.derivedFrom = object
+                # Base element is not complete until its pending child elements are constructed
+                error = "Can not derive '{}' from incomplete element '{}'".format(derivedFrom, object.name)
+                raise Unresolved(error, root)
+
+        root = self.root()
+        if root is not self:
+            object = root.resolve(derivedFrom)
+            if object is not None:
+                return object
+
+            if root.pending is not None:
+                raise Unresolved(error, root)
+        raise KeyError(error)
 
 
 class Dim(Derive):
 
+    # Attribute moved by dimIncrement for each array element
+    offset_attribute = None
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def parse(self, node):
         super().parse(node)
 
-        self.name = pysvd.parser.Text(pysvd.node.Element(node, 'name', True))
-        displayName = pysvd.parser.Text(pysvd.node.Element(node, 'displayName'))
+        self.name = pysvd.parser.Text(self.element(node, 'name', True))
+        displayName = pysvd.parser.Text(self.element(node, 'displayName'))
         if displayName is not None:
             self.displayName = displayName
-        description = pysvd.parser.Text(pysvd.node.Element(node, 'description'))
+        description = pysvd.parser.Text(self.element(node, 'description'))
         if description is not None:
             self.description = description
-        self.dimName = pysvd.parser.Text(pysvd.node.Element(node, 'dimName'), self.name)
+        self.dimName = pysvd.parser.Text(self.element(node, 'dimName'), self.name)
+
+    def instance(self):
+        """Create array element as copy of this element without parsing its node again. The attributes are shared, set_index() and
+        set_offset() replace the attributes of the copy only. Child elements are copied with the array element as their parent."""
+        return self.copy(self.parent)
 
     # Replace %s with name if not None
     def set_index(self, value):
         value = str(value)
         self.name = self.name.replace('%s', value)
-        if hasattr(self, 'displayName') and self.displayName is not None:
+        if self.has('displayName') and self.displayName is not None:
             self.displayName = self.displayName.replace('%s', value)
-        if hasattr(self, 'description') and self.description is not None:
+        if self.has('description') and self.description is not None:
             self.description = self.description.replace('%s', value)
 
         if self.dimName is not None:
             self.dimName = self.dimName.replace('%s', value)
 
     def set_offset(self, value):
-        pass
+        if self.offset_attribute is not None:
+            setattr(self, self.offset_attribute, getattr(self, self.offset_attribute) + value)
 
     @classmethod
-    def add_elements(cls, parent, elements, node, name):
-        """Parse node elements with respect to dim entries and return a list with constucted elements"""
-
-        for subnode in node.findall(name):
-            dim = pysvd.parser.Integer(pysvd.node.Element(subnode, 'dim'))
-            if dim is not None:
-                dimIncrement = pysvd.parser.Integer(pysvd.node.Element(subnode, 'dimIncrement', True))
-                dimIndex = pysvd.parser.Text(pysvd.node.Element(subnode, 'dimIndex'))
-
-                # if dimIndex is not present, dimName and name has to be examined for '[%s]' string presence,
-                # to distinguish between array and index
-                if dimIndex is None:
-                    dimName = pysvd.parser.Text(pysvd.node.Element(subnode, 'dimName'))
-                    name = pysvd.parser.Text(pysvd.node.Element(subnode, 'name'))
-                    if dimName is not None and '[%s]' not in dimName or name is not None and '[%s]' not in name:
-                        dimIndices = range(dim)
-                    else:
-                        dimIndices = [dim]
+    def add_element(cls, parent, elements, node):
+        """Parse a single node element with respect to dim entries and add the constructed elements to elements list"""
+
+        dim = pysvd.parser.Integer(pysvd.node.Element(node, 'dim'))
+        if dim is not None:
+            texts = pysvd.node.Texts(node)
+            dimIncrement = pysvd.parser.Integer(pysvd.node.Element(node, 'dimIncrement', True, texts))
+            dimIndex = pysvd.parser.Text(pysvd.node.Element(node, 'dimIndex', False, texts))
+
+            # if dimIndex is not present, dimName and name has to be examined for '[%s]' string presence,
+            # to distinguish between array and index
+            array = False
+            if dimIndex is None:
+                dimName = pysvd.parser.Text(pysvd.node.Element(node, 'dimName', False, texts))
+                name = pysvd.parser.Text(pysvd.node.Element(node, 'name', False, texts))
+                dimIndices = range(dim)
+                array = not (dimName is not None and '[%s]' not in dimName or name is not None and '[%s]' not in name)
+            else:
+                if ',' in dimIndex:
+                    dimIndices = dimIndex.split(',')
+                elif '-' in dimIndex:
+                    match = re.search(r'([0-9]+)\-([0-9]+)', dimIndex)
+                    dimIndices = range(int(match.group(1)), int(match.group(2)) + 1)
                 else:
-                    if ',' in dimIndex:
-                        dimIndices = dimIndex.split(',')
-                    elif '-' in dimIndex:
-                        match = re.search(r'([0-9]+)\-([0-9]+)', dimIndex)
-                        dimIndices = list(range(int(match.group(1)), int(match.group(2)) + 1))
-                    else:
-                        raise ValueError("Unexpected value in 'dimIndex': {}".format(dimIndex))
-
-                    if len(dimIndices) != dim:
-                        raise AttributeError("'dim' size does not match elements in 'dimIndex' ({} != {})".format(dim, len(dimIndex)))
-
-                offset = 0
-                for index in dimIndices:
-                    object = cls(parent, subnode)
-                    object.set_index(index)
-                    object.set_offset(offset)
-                    elements.append(object)
-                    offset += dimIncrement
+                    raise ValueError("Unexpected value in 'dimIndex': {}".format(dimIndex))
+
+                if len(dimIndices) != dim:
+                    raise AttributeError("'dim' size does not match elements in 'dimIndex' ({} != {})".format(dim, len(dimIndex)))
+
+            # Parse node once, the array elements are created as copies of it
+            template = cls(parent, node)
+            if array:
+                # Array is kept as single element, e.g. 'CH[4]'. Its elements can be found by name, e.g. 'CH[2]'.
+                object = template.instance()
+                object.set_index(dim)
+                elements.append(object)
+                if isinstance(elements, Elements):
+                    elements.add_array(DimArray(template, dimIndices, dimIncrement), False)
+            elif isinstance(elements, Elements):
+                elements.add_array(DimArray(template, dimIndices, dimIncrement))
             else:
-                elements.append(cls(parent, subnode))
+                elements.extend(DimArray(template, dimIndices, dimIncrement))
+        else:
+            elements.append(cls(parent, node))
@@ -7,10 +7,10 @@ import pysvd
 def compare_attribute(lhs, rhs, attibute):
     """Compare attibute of objects.
     """
-    if hasattr(lhs, attibute) != hasattr(rhs, attibute):
+    if lhs.has(attibute) != rhs.has(attibute):
         return False
 
-    if hasattr(lhs, attibute):
+    if lhs.has(attibute):
         return getattr(lhs, attibute) == getattr(rhs, attibute)
 
     return True
@@ -26,38 +26,45 @@ class Device(pysvd.classes.Base):
       refined at lower levels.
     """
 
-    def __init__(self, node):
-        self.peripherals = []
+    schema = pysvd.schema.device
+
+    def __init__(self, node, stream=False, lazy=False, keep_xml=True):
+        self.peripherals = pysvd.classes.Elements()
+        self.stream = stream
+        if lazy:
+            self.lazy = True
+        if not keep_xml:
+            self.keep_xml = False
+
+        # Forward derivedFrom references and symbol table
+        self.pending = []
+        self.loading = 0
+        self.symbols = None
 
         super().__init__(node)
 
+    @classmethod
+    def from_file(cls, source, lazy=False, keep_xml=True, cache=False):
+        """Load device from file name or file object, see pysvd.loader.load()"""
+        return pysvd.loader.load(source, lazy, keep_xml, cache)
+
     def parse(self, node):
         super().parse(node)
 
         self.__dict__['schemaVersion'] = pysvd.parser.Text(pysvd.node.Attribute(node, 'schemaVersion', True))
 
-        self.add_attribute(node, 'vendor', pysvd.parser.Text)
-        self.add_attribute(node, 'vendorID', pysvd.parser.Text)
-        self.add_attribute(node, 'name', pysvd.parser.Text, True)
-        self.add_attribute(node, 'series', pysvd.parser.Text)
-        self.add_attribute(node, 'version', pysvd.parser.Text, True)
-        self.add_attribute(node, 'description', pysvd.parser.Text, True)
-        self.add_attribute(node, 'licenseText', pysvd.parser.Text)
-        self.add_attribute(node, 'headerSystemFilename', pysvd.parser.Text)
-        self.add_attribute(node, 'headerDefinitionsPrefix', pysvd.parser.Text)
-        self.add_attribute(node, 'addressUnitBits', pysvd.parser.Integer, True)
-        self.add_attribute(node, 'width', pysvd.parser.Integer, True)
-
-        # property group
-        self.add_attribute(node, 'size', pysvd.parser.Integer, False, 32)
-        self.add_enum_attribute(node, 'access', pysvd.type.access, False, pysvd.type.access.read_write)
-        self.add_enum_attribute(node, 'protection', pysvd.type.protection, False, pysvd.type.protection.none)
-        self.add_attribute(node, 'resetValue', pysvd.parser.Integer, False, 0x00000000)
-        self.add_attribute(node, 'resetMask', pysvd.parser.Integer, False, 0xFFFFFFFF)
+        self.add_attributes(node, self.schema, ('name', 'version', 'description', 'addressUnitBits', 'width'), {
+            # property group
+            'size': 32,
+            'access': pysvd.type.access.read_write,
+            'protection': pysvd.type.protection.none,
+            'resetValue': 0x00000000,
+            'resetMask': 0xFFFFFFFF,
+        })
 
         # Clean up license text from whitespaces
         result = ''
-        if hasattr(self, 'licenseText'):
+        if self.has('licenseText'):
             for line in self.licenseText.splitlines():
                 line = line.strip()
                 if len(line):
@@ -68,20 +75,94 @@ class Device(pysvd.classes.Base):
         if cpu_node is not None:
             self.cpu = pysvd.element.Cpu(self, cpu_node)
 
-        peripherals_node = node.find('./peripherals')
+        # In stream mode peripherals are added one by one with add_peripheral()
+        if self.stream:
+            return
+
+        peripherals_node = node.find('peripherals')
         if peripherals_node is None:
             raise SyntaxError("No element 'peripherals' found in 'device'")
 
-        Peripheral.add_elements(self, self.peripherals, peripherals_node, 'peripheral')
-        if len(self.peripherals) < 1:
+        if peripherals_node.find('peripheral') is None:
             raise SyntaxError("At least one element of 'peripheral' is mandatory in 'peripherals'")
+        Peripheral.add_elements(self, self.peripherals, peripherals_node, 'peripheral')
+        self.finish()
+
+    def add_peripheral(self, node):
+        """Parse a single peripheral node and add it (or its dim array) to peripherals. Call finish() after the last one."""
+        Peripheral.try_add_element(self, self.peripherals, node)
+
+    def finish(self):
+        """Build symbol table and resolve forward derivedFrom references after all peripherals have been added"""
+        self.symbols = {}
+        nodes = [('', self)]
+        for (path, element) in nodes:
+            for child in element.children():
+                child_path = path + child.name
+                self.symbols.setdefault(child_path, child)
+                nodes.append((child_path + '.', child))
+
+        self.resolve_pending()
+
+    def resolve_pending(self, elements=None):
+        """Construct elements with forward derivedFrom references, which have been recorded during parsing. If elements is given, only the
+        elements pending for this list are constructed as far as they can be resolved yet, the others stay pending."""
+        inserted = {}
+
+        # Lists loaded while constructing (e.g. copied from a base element) leave the remaining pending elements to this loop
+        self.loading += 1
+        try:
+            while self.pending:
+                resolved = False
+                for record in list(self.pending):
+                    if elements is not None and record.elements is not elements:
+                        continue
+                    self.pending.remove(record)
+                    constructed = pysvd.classes.Elements()
+                    try:
+                        record.cls.add_element(record.parent, constructed, record.node)
+                    except pysvd.classes.Unresolved as error:
+                        record.error = error
+                        self.pending.append(record)
+                        continue
+                    record.insert(constructed, inserted)
+                    resolved = True
+
+                if not resolved:
+                    if elements is not None:
+                        return
+                    error = self.pending[0].error
+                    self.pending = []
+                    raise KeyError(error.args[0])
+        finally:
+            self.loading -= 1
+
+    def children(self):
+        return self.peripherals.loaded()
+
+    def resolve(self, path):
+        """Find element by absolute dotted path, e.g. 'TIM1.CCMR1_Output.OC1M'.
+
+        The symbol table is built by finish() from all parsed elements. Paths of elements parsed later (lazy mode, forward references) are
+        looked up by name and added on first lookup.
+        """
+        if self.symbols is None:
+            return super().resolve(path)
+
+        element = self.symbols.get(path)
+        if element is None:
+            element = super().resolve(path)
+            if element is not None:
+                self.symbols[path] = element
+        return element
 
     def find(self, name):
         """Find peripheral by name."""
-        for peripheral in self.peripherals:
-            if peripheral.name == name:
-                return peripheral
-        return None
+        return self.peripherals.find(name)
+
+    def memory_report(self):
+        """Get approximate memory retained by the device per peripheral and element class, see pysvd.memory.Report"""
+        return pysvd.memory.report(self)
 
 
 # /device/cpu
@@ -91,32 +172,21 @@ class Cpu(pysvd.classes.Parent):
     generate the device header file.
     """
 
+    # The name is parsed separately, as 'CM0+' is no valid identifier of cpuName
+    schema = {tag: parser for (tag, parser) in pysvd.schema.cpu.items() if tag != 'name'}
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def parse(self, node):
         super().parse(node)
 
-        self.__dict__['name'] = pysvd.parser.Enum(pysvd.type.cpuName, pysvd.node.Element(node, 'name', True).replace('+', 'PLUS'))
-        self.add_attribute(node, 'revision', pysvd.parser.Text, True)
-        self.add_enum_attribute(node, 'endian', pysvd.type.endian, True)
-        self.add_attribute(node, 'mpuPresent', pysvd.parser.Boolean, True)
-        self.add_attribute(node, 'fpuPresent', pysvd.parser.Boolean, True)
-        self.add_attribute(node, 'fpuDP', pysvd.parser.Boolean)
-        self.add_attribute(node, 'dspPresent', pysvd.parser.Boolean)
-        self.add_attribute(node, 'icachePresent', pysvd.parser.Boolean)
-        self.add_attribute(node, 'dcachePresent', pysvd.parser.Boolean)
-        self.add_attribute(node, 'itcmPresent', pysvd.parser.Boolean)
-        self.add_attribute(node, 'dtcmPresent', pysvd.parser.Boolean)
-        self.add_attribute(node, 'vtorPresent', pysvd.parser.Boolean, False, True)
-
-        self.add_attribute(node, 'nvicPrioBits', pysvd.parser.Integer, True)
-        self.add_attribute(node, 'vendorSystickConfig', pysvd.parser.Boolean, True)
-
-        self.add_attribute(node, 'deviceNumInterrupts', pysvd.parser.Integer)
-        self.add_attribute(node, 'sauNumRegions', pysvd.parser.Integer)
-
-        sau_regions_config_node = node.find('./sauRegionsConfig')
+        self.__dict__['name'] = pysvd.parser.Enum(pysvd.type.cpuName, self.element(node, 'name', True).replace('+', 'PLUS'))
+        self.add_attributes(node, self.schema,
+                            ('revision', 'endian', 'mpuPresent', 'fpuPresent', 'nvicPrioBits', 'vendorSystickConfig'),
+                            {'vtorPresent': True})
+
+        sau_regions_config_node = node.find('sauRegionsConfig')
         if sau_regions_config_node is not None:
             self.sauRegionsConfig = SauRegionConfig(self, sau_regions_config_node)
 
@@ -156,6 +226,8 @@ class SauRegionsConfigRegion(pysvd.classes.Parent):
     <protectionWhenDisabled> of the enclosing element sauRegionsConfig.
     """
 
+    schema = pysvd.schema.region
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
@@ -167,9 +239,7 @@ class SauRegionsConfigRegion(pysvd.classes.Parent):
         if name is not None:
             self.__dict__['name'] = name
 
-        self.add_attribute(node, 'base', pysvd.parser.Integer, True)
-        self.add_attribute(node, 'limit', pysvd.parser.Integer, True)
-        self.add_enum_attribute(node, 'access', pysvd.type.sauAccess, True)
+        self.add_attributes(node, self.schema, ('base', 'limit', 'access'))
 
 
 # /device/peripherals
@@ -194,11 +264,17 @@ class Peripheral(pysvd.classes.Dim):
     peripheral using different names, you must use the derivedFrom attribute.
     """
 
-    def __init__(self, parent, node):
-        self.addressBlocks = []
-        self.registers = []
-        self.clusters = []
+    offset_attribute = 'baseAddress'
+
+    schema = pysvd.schema.peripheral
+
+    # Child elements, lists are created if present or on first access
+    addressBlocks = pysvd.classes.Children(list)
+    interrupts = pysvd.classes.Children(list)
+    registers = pysvd.classes.Children()
+    clusters = pysvd.classes.Children()
 
+    def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def __eq__(self, other):
@@ -229,59 +305,50 @@ class Peripheral(pysvd.classes.Dim):
         if not isinstance(other, Peripheral):
             return NotImplemented
 
-        if len(self.registers) != len(other.registers):
+        if len(self.child_list('registers')) != len(other.child_list('registers')):
             return False
 
-        for (lhs, rhs) in zip(self.registers, other.registers):
+        for (lhs, rhs) in zip(self.child_list('registers'), other.child_list('registers')):
             if lhs != rhs:
                 return False
 
-        if len(self.clusters) != len(other.clusters):
+        if len(self.child_list('clusters')) != len(other.child_list('clusters')):
             return False
 
-        for (lhs, rhs) in zip(self.clusters, other.clusters):
+        for (lhs, rhs) in zip(self.child_list('clusters'), other.child_list('clusters')):
             if lhs != rhs:
                 return False
         return True
 
-    def set_offset(self, value):
-        self.baseAddress += value
-
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'version', pysvd.parser.Text)
-        self.add_attribute(node, 'alternatePeripheral', pysvd.parser.Text)
-        self.add_attribute(node, 'groupName', pysvd.parser.Text)
-        self.add_attribute(node, 'prependToName', pysvd.parser.Text)
-        self.add_attribute(node, 'appendToName', pysvd.parser.Text)
-        self.add_attribute(node, 'headerStructName', pysvd.parser.Text)
-        self.add_attribute(node, 'disableCondition', pysvd.parser.Text)
-        self.add_attribute(node, 'baseAddress', pysvd.parser.Integer, True)
+        self.add_attributes(node, self.schema, ('name', 'baseAddress'))
 
-        AddressBlock.add_elements(self, self.addressBlocks, node, 'addressBlock')
+        self.add_children(AddressBlock, 'addressBlocks', node, 'addressBlock', list)
 
-        self.interrupts = []
-        Interrupt.add_elements(self, self.interrupts, node, 'interrupt')
+        # Interrupts are not derived
+        self.__dict__.pop('interrupts', None)
+        self.add_children(Interrupt, 'interrupts', node, 'interrupt', list)
 
-        registers_node = node.find('./registers')
+        registers_node = node.find('registers')
         if registers_node is not None:
-            Register.add_elements(self, self.registers, registers_node, 'register')
-            Cluster.add_elements(self, self.clusters, registers_node, 'cluster')
-
-            if len(self.registers) < 1 and len(self.clusters) < 1:
+            if registers_node.find('register') is None and registers_node.find('cluster') is None:
                 raise SyntaxError("At least one element of 'register' or 'cluster' is mandatory in 'registers'")
 
+            self.add_children(Register, 'registers', registers_node, 'register')
+            self.add_children(Cluster, 'clusters', registers_node, 'cluster')
+
     def find(self, name):
         """Find cluster and register by name."""
-        for cluster in self.clusters:
-            if cluster.name == name:
-                return cluster
+        element = self.child_list('clusters').find(name)
+        if element is None:
+            element = self.child_list('registers').find(name)
+        return element
 
-        for register in self.registers:
-            if register.name == name:
-                return register
-        return None
+    def children(self):
+        yield from self.child_list('clusters').loaded()
+        yield from self.child_list('registers').loaded()
 
 
 # /device/peripherals/peripheral/addressBlock
@@ -293,16 +360,15 @@ class AddressBlock(pysvd.classes.Group):
 
     attributes = ['protection']
 
+    schema = pysvd.schema.addressBlock
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'offset', pysvd.parser.Integer, True)
-        self.add_attribute(node, 'size', pysvd.parser.Integer, True)
-        self.add_enum_attribute(node, 'usage', pysvd.type.addressBlockUsage, True)
-        self.add_enum_attribute(node, 'protection', pysvd.type.protection)
+        self.add_attributes(node, self.schema, ('offset', 'size', 'usage'))
 
 
 # /device/peripherals/peripheral/interrupt
@@ -311,15 +377,15 @@ class Interrupt(pysvd.classes.Parent):
     """A peripheral can have multiple interrupts. This entry allows the debugger to show interrupt names instead of interrupt numbers.
     """
 
+    schema = pysvd.schema.interrupt
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text, True)
-        self.add_attribute(node, 'description', pysvd.parser.Text)
-        self.add_attribute(node, 'value', pysvd.parser.Integer, True)
+        self.add_attributes(node, self.schema, ('name', 'value'))
 
 
 # /device/peripherals/peripheral/registers
@@ -343,43 +409,36 @@ class Cluster(pysvd.classes.Dim):
     also specify an array of a cluster using the <dim> element.
     """
 
-    def __init__(self, parent, node):
-        self.registers = []
-        self.clusters = []
+    offset_attribute = 'addressOffset'
 
-        super().__init__(parent, node)
+    schema = pysvd.schema.cluster
 
-    def set_offset(self, value):
-        self.addressOffset += value
+    # Child elements, lists are created if present or on first access
+    registers = pysvd.classes.Children()
+    clusters = pysvd.classes.Children()
+
+    def __init__(self, parent, node):
+        super().__init__(parent, node)
 
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text, True)
-        self.add_attribute(node, 'description', pysvd.parser.Text, self.derivedFrom is not None)
-        self.add_attribute(node, 'alternateCluster', pysvd.parser.Text)
-        self.add_attribute(node, 'headerStructName', pysvd.parser.Text)
-        self.add_attribute(node, 'addressOffset', pysvd.parser.Integer, True)
+        mandatory = ('name', 'description', 'addressOffset') if self.derivedFrom is not None else ('name', 'addressOffset')
+        self.add_attributes(node, self.schema, mandatory)
 
-        self.add_attribute(node, 'size', pysvd.parser.Integer)
-        self.add_enum_attribute(node, 'access', pysvd.type.access)
-        self.add_enum_attribute(node, 'protection', pysvd.type.protection)
-        self.add_attribute(node, 'resetValue', pysvd.parser.Integer)
-        self.add_attribute(node, 'resetMask', pysvd.parser.Integer)
-
-        Register.add_elements(self, self.registers, node, 'register')
-        Cluster.add_elements(self, self.clusters, node, 'cluster')
+        self.add_children(Register, 'registers', node, 'register')
+        self.add_children(Cluster, 'clusters', node, 'cluster')
 
     def find(self, name):
         """Find cluster and register by name."""
-        for cluster in self.clusters:
-            if cluster.name == name:
-                return cluster
+        element = self.child_list('clusters').find(name)
+        if element is None:
+            element = self.child_list('registers').find(name)
+        return element
 
-        for register in self.registers:
-            if register.name == name:
-                return register
-        return None
+    def children(self):
+        yield from self.child_list('clusters').loaded()
+        yield from self.child_list('registers').loaded()
 
 
 # /device/peripherals/peripheral/registers/.../register
@@ -397,9 +456,14 @@ class Register(pysvd.classes.Dim):
     <dimIncrement> specifies the address offset between two registers.
     """
 
-    def __init__(self, parent, node):
-        self.fields = []
+    offset_attribute = 'addressOffset'
 
+    schema = pysvd.schema.register
+
+    # Child elements, list is created if present or on first access
+    fields = pysvd.classes.Children()
+
+    def __init__(self, parent, node):
         super().__init__(parent, node)
 
     def __eq__(self, other):
@@ -432,54 +496,37 @@ class Register(pysvd.classes.Dim):
         if not isinstance(other, Register):
             return NotImplemented
 
-        if len(self.fields) != len(other.fields):
+        if len(self.child_list('fields')) != len(other.child_list('fields')):
             return False
 
-        for (lhs, rhs) in zip(self.fields, other.fields):
+        for (lhs, rhs) in zip(self.child_list('fields'), other.child_list('fields')):
             if lhs != rhs:
                 return False
         return True
 
-    def set_offset(self, value):
-        self.addressOffset += value
-
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text, True)
-        self.add_attribute(node, 'displayName', pysvd.parser.Text)
-        self.add_attribute(node, 'description', pysvd.parser.Text, self.derivedFrom is not None)
-        self.add_attribute(node, 'alternateGroup', pysvd.parser.Text)
-        self.add_attribute(node, 'alternateRegister', pysvd.parser.Text)
-        self.add_attribute(node, 'addressOffset', pysvd.parser.Integer, True)
-
-        self.add_attribute(node, 'size', pysvd.parser.Integer)
-        self.add_enum_attribute(node, 'access', pysvd.type.access)
-        self.add_enum_attribute(node, 'protection', pysvd.type.protection)
-        self.add_attribute(node, 'resetValue', pysvd.parser.Integer)
-        self.add_attribute(node, 'resetMask', pysvd.parser.Integer)
-
-        self.add_enum_attribute(node, 'dataType', pysvd.type.dataType)
-        self.add_enum_attribute(node, 'modifiedWriteValues', pysvd.type.modifiedWriteValues, False, pysvd.type.modifiedWriteValues.modify)
-        self.add_enum_attribute(node, 'readAction', pysvd.type.readAction)
+        mandatory = ('name', 'description', 'addressOffset') if self.derivedFrom is not None else ('name', 'addressOffset')
+        self.add_attributes(node, self.schema, mandatory, {'modifiedWriteValues': pysvd.type.modifiedWriteValues.modify})
 
-        write_constraint_node = node.find('./writeConstraint')
+        write_constraint_node = node.find('writeConstraint')
         if write_constraint_node is not None:
             self.writeConstraint = WriteConstraint(self, write_constraint_node)
 
-        fields_node = node.find('./fields')
+        fields_node = node.find('fields')
         if fields_node is not None:
-            Field.add_elements(self, self.fields, fields_node, 'field')
-
-            if len(self.fields) < 1:
+            if fields_node.find('field') is None:
                 raise SyntaxError("At least one element of 'field' is mandatory in 'fields'")
 
+            self.add_children(Field, 'fields', fields_node, 'field')
+
     def find(self, name):
         """Find field by name."""
-        for field in self.fields:
-            if field.name == name:
-                return field
-        return None
+        return self.child_list('fields').find(name)
+
+    def children(self):
+        return self.child_list('fields').loaded()
 
 
 # /device/peripherals/peripheral/registers/.../register/.../writeConstraint
@@ -494,9 +541,9 @@ class WriteConstraint(pysvd.classes.Parent):
     def parse(self, node):
         super().parse(node)
 
-        writeAsRead = pysvd.node.Element(node, 'writeAsRead')
-        useEnumeratedValues = pysvd.node.Element(node, 'useEnumeratedValues')
-        range_node = node.find("./range")
+        writeAsRead = self.element(node, 'writeAsRead')
+        useEnumeratedValues = self.element(node, 'useEnumeratedValues')
+        range_node = node.find('range')
         if writeAsRead is not None:
             self.__dict__['writeAsRead'] = pysvd.parser.Boolean(writeAsRead)
         elif useEnumeratedValues is not None:
@@ -536,6 +583,10 @@ class Field(pysvd.classes.Dim):
 
     attributes = ['access']
 
+    offset_attribute = 'bitOffset'
+
+    schema = pysvd.schema.field
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
@@ -574,29 +625,26 @@ class Field(pysvd.classes.Dim):
         """
 
 
-    def set_offset(self, value):
-        self.bitOffset += value
-
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text, True)
-        self.add_attribute(node, 'description', pysvd.parser.Text, self.derivedFrom is not None)
+        mandatory = ('name', 'description') if self.derivedFrom is not None else ('name',)
+        self.add_attributes(node, self.schema, mandatory, {'modifiedWriteValues': pysvd.type.modifiedWriteValues.modify})
 
         # bitRangeOffsetWidthStyle
-        bitOffset = pysvd.parser.Integer(pysvd.node.Element(node, 'bitOffset'))
-        bitWidth = pysvd.parser.Integer(pysvd.node.Element(node, 'bitWidth'))
+        bitOffset = pysvd.parser.Integer(self.element(node, 'bitOffset'))
+        bitWidth = pysvd.parser.Integer(self.element(node, 'bitWidth'))
         if bitOffset is not None:
             # If bitWidth is not set, default is 1
             bitWidth = 1 if bitWidth is None else bitWidth
         else:
             # bitRangeLsbMsbStyle
-            lsb = pysvd.parser.Integer(pysvd.node.Element(node, 'lsb'))
-            msb = pysvd.parser.Integer(pysvd.node.Element(node, 'msb'))
+            lsb = pysvd.parser.Integer(self.element(node, 'lsb'))
+            msb = pysvd.parser.Integer(self.element(node, 'msb'))
             if lsb is None or msb is None:
-                bitRange = pysvd.parser.Text(pysvd.node.Element(node, 'bitRange'))
+                bitRange = pysvd.parser.Text(self.element(node, 'bitRange'))
                 if bitRange is None:
-                    raise ValueError("Field '{}' has no valid bit-range".format(self.name if hasattr(self, 'name') else '<unknown>'))
+                    raise ValueError("Field '{}' has no valid bit-range".format(self.name if self.has('name') else '<unknown>'))
 
                 match = re.search(r'\[([0-9]+):([0-9]+)\]', bitRange)
                 lsb = int(match.group(2))
@@ -608,24 +656,24 @@ class Field(pysvd.classes.Dim):
         self.__dict__['bitOffset'] = bitOffset
         self.__dict__['bitWidth'] = bitWidth
 
-        self.add_enum_attribute(node, 'access', pysvd.type.access)
-        self.add_enum_attribute(node, 'modifiedWriteValues', pysvd.type.modifiedWriteValues, False, pysvd.type.modifiedWriteValues.modify)
-        self.add_enum_attribute(node, 'readAction', pysvd.type.readAction)
-
-        write_constraint_node = node.find('./writeConstraint')
+        write_constraint_node = node.find('writeConstraint')
         if write_constraint_node is not None:
             self.writeConstraint = WriteConstraint(self, write_constraint_node)
 
-        enumerated_values_node = node.find('./enumeratedValues')
+        enumerated_values_node = node.find('enumeratedValues')
         if enumerated_values_node is not None:
             self.enumeratedValues = EnumeratedValues(self, enumerated_values_node)
 
     def find(self, name):
         """Find enumeratedValues by name."""
-        if hasattr(self, 'enumeratedValues') and hasattr(self.enumeratedValues, 'name') and self.enumeratedValues.name == name:
+        if self.has('enumeratedValues') and self.enumeratedValues.has('name') and self.enumeratedValues.name == name:
             return self.enumeratedValues
         return None
 
+    def children(self):
+        if self.has('enumeratedValues') and self.enumeratedValues.has('name'):
+            yield self.enumeratedValues
+
 
 # /device/peripherals/peripheral/registers/.../field/enumeratedValues
 # http://www.keil.com/pack/doc/cmsis/svd/html/elem_registers.html#elem_enumeratedValues
@@ -643,6 +691,8 @@ class EnumeratedValues(pysvd.classes.Derive):
     instructive. The detailed description can provide reference manual level details within the debugger.
     """
 
+    schema = pysvd.schema.enumeration
+
     def __init__(self, parent, node):
         self.enumeratedValues = []
 
@@ -674,16 +724,14 @@ class EnumeratedValues(pysvd.classes.Derive):
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text)
-        self.add_attribute(node, 'headerEnumName', pysvd.parser.Text)
-        self.add_enum_attribute(node, 'usage', pysvd.type.enumUsage, False, pysvd.type.enumUsage.read_write)
+        self.add_attributes(node, self.schema, (), {'usage': pysvd.type.enumUsage.read_write})
 
-        for child in node.findall('./enumeratedValue'):
+        for child in node.findall('enumeratedValue'):
             self.enumeratedValues.append(EnumeratedValue(self, child))
 
         if len(self.enumeratedValues) < 1:
             raise SyntaxError("At least one element of enumeratedValue is needed in enumeratedValues '{}'".format(
-                self.name if hasattr(self, 'name') else '<unknown>'))
+                self.name if self.has('name') else '<unknown>'))
 
 
 # /device/peripherals/peripheral/registers/.../enumeratedValue
@@ -692,6 +740,8 @@ class EnumeratedValue(pysvd.classes.Parent):
     """An enumeratedValue defines a map between an unsigned integer and a string.
     """
 
+    schema = pysvd.schema.enumeratedValue
+
     def __init__(self, parent, node):
         super().__init__(parent, node)
 
@@ -707,14 +757,11 @@ class EnumeratedValue(pysvd.classes.Parent):
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'name', pysvd.parser.Text)
-        self.add_attribute(node, 'description', pysvd.parser.Text)
-        self.add_attribute(node, 'value', pysvd.parser.Integer)
-        self.add_attribute(node, 'isDefault', pysvd.parser.Boolean)
+        self.add_attributes(node, self.schema)
 
-        if not hasattr(self, 'value') and not hasattr(self, 'isDefault'):
+        if not self.has('value') and not self.has('isDefault'):
             raise SyntaxError("Either 'value' or 'isDefault' is mandatory in enumeratedValue '{}'".format(
-                self.name if hasattr(self, 'name') else '<unknown>'))
+                self.name if self.has('name') else '<unknown>'))
 
 
 # /device/peripherals/peripheral/.../dimArrayIndex
@@ -725,6 +772,8 @@ class DimArrayIndex(pysvd.classes.Parent):
     debugger becomes more instructive.
     """
 
+    schema = pysvd.schema.dimArrayIndex
+
     def __init__(self, parent, node):
         self.enumeratedValues = []
 
@@ -733,11 +782,11 @@ class DimArrayIndex(pysvd.classes.Parent):
     def parse(self, node):
         super().parse(node)
 
-        self.add_attribute(node, 'headerEnumName', pysvd.parser.Text)
+        self.add_attributes(node, self.schema)
 
-        for child in node.findall('./enumeratedValue'):
+        for child in node.findall('enumeratedValue'):
             self.enumeratedValues.append(EnumeratedValue(self, child))
 
         if len(self.enumeratedValues) < 1:
             raise SyntaxError("At least one element of enumeratedValue is needed in dimArrayIndex '{}'".format(
-                self.headerEnumNames if hasattr(self, 'headerEnumName') else '<unknown>'))
+                self.headerEnumNames if self.has('headerEnumName') else '<unknown>'))
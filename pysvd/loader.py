@@ -0,0 +1,265 @@
+"""Load SVD files into a device element tree
+"""
+import concurrent.futures
+import io
+import itertools
+import os
+import re
+import time
+import pysvd
+
+
+def stream(source, keep_xml=False):
+    """Parse SVD file incrementally. Yields the device as soon as it is constructed, afterwards the peripherals as they are stored in
+    device.peripherals: elements, or the DimArray of a peripheral array, whose elements are not created.
+
+    The device is constructed from the elements preceding <peripherals>, afterwards every <peripheral> is parsed on its closing tag.
+    Unless keep_xml is set, the elements do not keep references to their nodes and every peripheral node is removed from the document
+    after it has been constructed, so the document never holds more than the device header and the peripheral currently read (nodes of
+    peripherals with forward derivedFrom references are kept until finish()). Kept nodes are not removed, the device node holds the
+    whole document.
+    """
+    device = None
+    nodes = []
+    for event, node in pysvd.node.iterparse(source, ('start', 'end')):
+        if event == 'start':
+            nodes.append(node)
+            if len(nodes) == 2 and node.tag == 'peripherals':
+                device = pysvd.element.Device(nodes[0], stream=True, keep_xml=keep_xml)
+                yield device
+        else:
+            nodes.pop()
+            if len(nodes) == 2 and node.tag == 'peripheral' and device is not None:
+                count = list.__len__(device.peripherals)
+                device.add_peripheral(node)
+                if not keep_xml:
+                    nodes[-1].remove(node)
+                yield from itertools.islice(device.peripherals.loaded(True), count, None)
+
+    if device is None:
+        raise SyntaxError("No element 'peripherals' found in 'device'")
+
+    # Peripherals with forward derivedFrom references are constructed at the end
+    streamed = set(map(id, device.peripherals.loaded(True)))
+    device.finish()
+    yield from (item for item in device.peripherals.loaded(True) if id(item) not in streamed)
+
+    if len(device.peripherals) < 1:
+        raise SyntaxError("At least one element of 'peripheral' is mandatory in 'peripherals'")
+
+
+def iterparse(source, keep_xml=True):
+    """Parse SVD file incrementally and yield every peripheral as soon as it is constructed, see stream(). The constructed device is
+    available as parent of the yielded peripherals."""
+    items = stream(source, keep_xml)
+    next(items)
+    for item in items:
+        if isinstance(item, pysvd.classes.DimArray):
+            yield from item
+        else:
+            yield item
+
+
+# Peripheral tags of SVD files. Comments and CDATA sections are matched to skip their content.
+TAGS = re.compile(rb'<!--.*?-->|<!\[CDATA\[.*?\]\]>|<(/?)peripheral(\s[^>]*)?>', re.S)
+
+# XML declaration, specifies the encoding of peripheral elements split from a document
+DECLARATION = re.compile(rb'(\xef\xbb\xbf)?<\?xml[^>]*\?>')
+
+
+def split(data):
+    """Split SVD document into XML declaration, device header (the document without its peripheral elements) and the spans (start, end,
+    derived) of the peripheral elements"""
+    spans = []
+    start = None
+    for match in TAGS.finditer(data):
+        if match.group(1) is None:
+            continue
+        if not match.group(1):
+            start = match
+        elif start is not None:
+            spans.append((start.start(), match.end(), b'derivedFrom' in (start.group(2) or b'')))
+            start = None
+
+    declaration = DECLARATION.match(data)
+    declaration = declaration.group(0) if declaration else b''
+    if not spans:
+        return (declaration, data, spans)
+    return (declaration, data[:spans[0][0]] + data[spans[-1][1]:], spans)
+
+
+def parse_peripherals(header, chunk, backend):
+    """Parse peripheral elements of chunk in the context of the device header. Returns the Elements of every peripheral, None for
+    peripherals depending on elements of other peripherals."""
+    pysvd.node.use(backend)
+    device = pysvd.element.Device(pysvd.node.parse(io.BytesIO(header)), stream=True, keep_xml=False)
+
+    results = []
+    for node in pysvd.node.parse(io.BytesIO(chunk)):
+        elements = pysvd.classes.Elements()
+        pysvd.element.Peripheral.try_add_element(device, elements, node)
+        if device.pending:
+            device.pending = []
+            elements = None
+        results.append(elements)
+    return results
+
+
+def parallel(source, workers, keep_xml=True):
+    """Load device and parse its peripherals in a pool of worker processes.
+
+    The peripheral elements are split from the document without parsing it. Peripherals without derivedFrom are parsed in chunks by the
+    workers. Peripherals which are derived or contain elements derived from other peripherals are parsed afterwards by this process in
+    document order, so the derivedFrom references are resolved as if the file was loaded by a single process. Peripherals parsed by
+    workers have no XML nodes.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as file:
+            data = file.read()
+    else:
+        data = source.read()
+        if isinstance(data, str):
+            data = data.encode()
+
+    (declaration, header, spans) = split(data)
+    if not spans:
+        # Let the device report the missing peripherals
+        return pysvd.element.Device(pysvd.node.parse(io.BytesIO(data)), keep_xml=keep_xml)
+    device = pysvd.element.Device(pysvd.node.parse(io.BytesIO(header)), stream=True, keep_xml=keep_xml)
+
+    independent = [span for span in spans if not span[2]]
+    size = max(1, -(-len(independent) // (workers * 4)))
+    chunks = [independent[start:start + size] for start in range(0, len(independent), size)]
+
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = []
+        for chunk in chunks:
+            data_chunk = declaration + b'<peripherals>' + b''.join(data[start:end] for (start, end, derived) in chunk) + b'</peripherals>'
+            futures.append(executor.submit(parse_peripherals, header, data_chunk, pysvd.node.backend.name))
+        for (chunk, future) in zip(chunks, futures):
+            results.update(zip(chunk, future.result()))
+
+    for span in spans:
+        elements = results.get(span)
+        if elements is None:
+            device.add_peripheral(pysvd.node.parse(io.BytesIO(declaration + data[span[0]:span[1]])))
+            continue
+
+        device.peripherals.share(elements)
+        for element in elements.created():
+            element.__dict__['parent'] = device
+            element.uncache()
+    device.finish()
+    return device
+
+
+def load(source, lazy=False, keep_xml=True, cache=False, workers=None):
+    """Load device from SVD file name or file object.
+
+    In lazy mode peripherals, registers, clusters and fields are only parsed when their list is accessed the first time.
+
+    If keep_xml is not set, the node attribute of all elements is None. The file is streamed with stream() then, so the document is
+    released while it is parsed (in lazy mode the document is parsed as a whole and the nodes of not yet parsed lists are kept until they
+    are accessed). Otherwise the elements keep the nodes of the whole document.
+
+    The file is parsed with the XML backend selected by pysvd.node.use().
+
+    If cache is set (True for the default cache or a pysvd.cache.Cache), the loaded device is stored in a cache directory and later loads
+    of the same file content with the same options are unpickled from there. Cached devices never keep their XML nodes.
+
+    If workers is greater than one, the peripherals are parsed by that many processes, see parallel().
+
+    Compiled device images (file names ending with .svdb) are opened with pysvd.binary.load(), the options do not apply to them.
+    """
+    if isinstance(source, str) and source.endswith(pysvd.binary.extension):
+        return pysvd.binary.load(source)
+
+    if cache:
+        return pysvd.cache.load(source, lazy, cache, workers)
+
+    if workers is not None and workers > 1 and not lazy:
+        return parallel(source, workers, keep_xml)
+
+    if lazy or keep_xml:
+        return pysvd.element.Device(pysvd.node.parse(source), lazy=lazy, keep_xml=keep_xml)
+
+    items = stream(source)
+    device = next(items)
+    for item in items:
+        pass
+    return device
+
+
+class Loaded(tuple):
+    """(path, device or exception) of a file loaded by load_many(). Elapsed is the time in seconds taken to load the file."""
+
+    def __new__(cls, path, result, elapsed):
+        self = super().__new__(cls, (path, result))
+        self.elapsed = elapsed
+        return self
+
+    @property
+    def path(self):
+        return self[0]
+
+    @property
+    def result(self):
+        return self[1]
+
+
+def load_file(path, lazy, keep_xml, cache):
+    """Load device of path and return (device or exception, elapsed seconds)"""
+    start = time.perf_counter()
+    try:
+        result = load(path, lazy, keep_xml, cache)
+    except Exception as error:
+        result = error
+    return (result, time.perf_counter() - start)
+
+
+def load_many(paths, workers=None, pending=None, lazy=False, keep_xml=False, cache=False):
+    """Load SVD files in a pool of worker processes and yield Loaded (path, device or exception) in order of completion.
+
+    Workers defaults to the number of CPUs, with a single worker the files are loaded by this process. At most pending (twice the workers
+    by default) files are submitted at a time, so only a bounded number of loaded devices waits for the consumer. Errors of single files
+    are yielded instead of raised.
+
+    Devices are pickled to be returned by the workers, which drops their XML nodes, so keep_xml is off by default.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if pending is None:
+        pending = workers * 2
+
+    paths = iter(paths)
+    if workers <= 1:
+        for path in paths:
+            yield Loaded(path, *load_file(path, lazy, keep_xml, cache))
+        return
+
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    futures = {}
+    try:
+        while True:
+            for path in paths:
+                futures[executor.submit(load_file, path, lazy, keep_xml, cache)] = path
+                if len(futures) >= pending:
+                    break
+            if not futures:
+                break
+
+            (done, _) = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                path = futures.pop(future)
+                try:
+                    (result, elapsed) = future.result()
+                except Exception as error:
+                    # Worker process died or the device could not be returned
+                    (result, elapsed) = (error, 0.0)
+                yield Loaded(path, result, elapsed)
+    finally:
+        # Files not yet loaded when the consumer stops iterating are dropped
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
@@ -0,0 +1,138 @@
+"""Memory accounting of parsed devices.
+
+Sizes are approximations, the sum of sys.getsizeof() of all objects reachable from an element. Objects shared by all devices (classes,
+functions, enum members) are not accounted. Nodes of lxml documents are only accounted as far as Python proxies exist for them.
+"""
+import collections
+import enum
+import gc
+import sys
+import types
+import xml.etree.ElementTree
+
+import pysvd
+
+# Objects shared by all devices, not accounted to any of them
+shared = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, enum.Enum)
+
+# Node types of the XML backends
+nodes = (xml.etree.ElementTree.Element,)
+if pysvd.node.lxml is not None:
+    nodes += (pysvd.node.lxml.etree._Element,)
+
+
+def sizeof(root):
+    """Approximate memory in bytes retained by root, the total size of all objects reachable from it"""
+    seen = set()
+    objects = [root]
+    total = 0
+    while objects:
+        obj = objects.pop()
+        if id(obj) in seen or isinstance(obj, shared) or obj is None:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        objects.extend(gc.get_referents(obj))
+    return total
+
+
+class Report(object):
+    """Memory retained by a device per peripheral, per element class and per kind of object.
+
+    Every object is accounted to the first element it is reachable from without passing another element, attribute values shared by
+    derived elements and array elements with their base element are accounted once. Kinds are 'xml' (XML nodes and their content),
+    'strings' and 'objects' (elements, lists, dicts and numbers).
+    """
+
+    kinds = ('objects', 'strings', 'xml')
+
+    def __init__(self, device):
+        self.total = 0
+        self.kinds = dict.fromkeys(Report.kinds, 0)
+        self.classes = collections.defaultdict(lambda: [0, 0])
+        self.peripherals = collections.defaultdict(int)
+
+        # Deepest elements first, so every element owns its XML node except the nodes of its child elements
+        elements = sorted(self.elements(device), key=self.depth, reverse=True)
+        seen = set()
+        for element in elements:
+            size = 0
+            objects = [(element, 'objects')]
+            while objects:
+                (obj, kind) = objects.pop()
+                if id(obj) in seen or isinstance(obj, shared) or obj is None:
+                    continue
+                if isinstance(obj, pysvd.classes.Base) and obj is not element:
+                    continue
+                seen.add(id(obj))
+
+                if isinstance(obj, nodes):
+                    kind = 'xml'
+                elif isinstance(obj, str) and kind != 'xml':
+                    kind = 'strings'
+                obj_size = sys.getsizeof(obj)
+                self.kinds[kind] += obj_size
+                size += obj_size
+                objects.extend((referent, kind) for referent in gc.get_referents(obj))
+
+            self.total += size
+            entry = self.classes[type(element).__name__]
+            entry[0] += 1
+            entry[1] += size
+            self.peripherals[self.peripheral(element)] += size
+
+    @staticmethod
+    def elements(device):
+        """List all elements reachable from device"""
+        seen = set()
+        elements = []
+        objects = [device]
+        while objects:
+            obj = objects.pop()
+            if id(obj) in seen or isinstance(obj, shared + nodes + (str, int)) or obj is None:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, pysvd.classes.Base):
+                elements.append(obj)
+            objects.extend(gc.get_referents(obj))
+        return elements
+
+    @staticmethod
+    def depth(element):
+        depth = 0
+        while element.parent is not None:
+            element = element.parent
+            depth += 1
+        return depth
+
+    @staticmethod
+    def peripheral(element):
+        """Name of peripheral containing element, None for device level elements"""
+        while element is not None and not isinstance(element, pysvd.element.Peripheral):
+            element = element.parent
+        return None if element is None else element.name
+
+    def format(self, top=10):
+        """Format report as text, only the top peripherals with the most memory are listed"""
+        lines = ["Total: {:,} bytes".format(self.total)]
+        lines.extend("  {}: {:,} bytes".format(kind, size) for (kind, size) in sorted(self.kinds.items()))
+
+        lines.append("Element classes:")
+        for (name, (count, size)) in sorted(self.classes.items(), key=lambda item: -item[1][1]):
+            lines.append("  {}: {:,} elements, {:,} bytes".format(name, count, size))
+
+        lines.append("Peripherals:")
+        peripherals = sorted(self.peripherals.items(), key=lambda item: -item[1])
+        for (name, size) in peripherals[:top]:
+            lines.append("  {}: {:,} bytes".format('(device)' if name is None else name, size))
+        if len(peripherals) > top:
+            lines.append("  ... {} more".format(len(peripherals) - top))
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+def report(device):
+    """Get memory Report of device"""
+    return Report(device)
@@ -1,17 +1,115 @@
-import re
+import functools
+import os
+import xml.etree.ElementTree
 
+try:
+    import lxml.etree
+except ImportError:
+    lxml = None
 
-def Element(node, tag, mandatory=False):
-    """Get the element text for the provided tag from the provided node"""
 
-    value = node.findtext(tag)
+class ElementTree(object):
+    """XML backend of the standard library.
+
+    All backends parse into nodes providing the ElementTree API used by the elements (find(), findall(), findtext(), get(), text, tag,
+    len(), iteration and remove()). Comments and processing instructions are not part of the parsed documents.
+    """
+
+    name = 'etree'
+
+    def parse(self, source):
+        """Parse SVD file name or file object and return the root node"""
+        return xml.etree.ElementTree.parse(source).getroot()
+
+    def iterparse(self, source, events=('end',)):
+        """Iterate over (event, node) of SVD file name or file object"""
+        return xml.etree.ElementTree.iterparse(source, events=events)
+
+    def write(self, root, filename):
+        """Write document of root node to filename"""
+        xml.etree.ElementTree.ElementTree(root).write(filename, encoding="utf-8", xml_declaration=True, method="xml",
+                                                      short_empty_elements=True)
+
+
+class LXml(ElementTree):
+    """XML backend of lxml, parses in C without creating Python objects for nodes never accessed"""
+
+    name = 'lxml'
+
+    def parse(self, source):
+        parser = lxml.etree.XMLParser(remove_comments=True, remove_pis=True, resolve_entities=False)
+        if isinstance(source, (str, bytes, os.PathLike)):
+            # Missing files raise FileNotFoundError like with ElementTree instead of the OSError of lxml
+            with open(source, 'rb') as file:
+                return lxml.etree.parse(file, parser).getroot()
+        return lxml.etree.parse(source, parser).getroot()
+
+    def iterparse(self, source, events=('end',)):
+        return lxml.etree.iterparse(source, events=events, remove_comments=True, remove_pis=True, resolve_entities=False)
+
+    def write(self, root, filename):
+        root.getroottree().write(filename, encoding="utf-8", xml_declaration=True, method="xml")
+
+
+# Available backends by name, lxml is used if installed
+backends = {ElementTree.name: ElementTree()}
+if lxml is not None:
+    backends[LXml.name] = LXml()
+backend = backends.get(LXml.name, backends[ElementTree.name])
+
+
+def use(name):
+    """Select XML backend by name for all following parse() and iterparse() calls"""
+    global backend
+
+    if name not in backends:
+        raise ValueError("Unknown XML backend '{}', available are {}".format(name, ', '.join(sorted(backends))))
+    backend = backends[name]
+
+
+def parse(source):
+    """Parse SVD file name or file object with the selected backend and return the root node"""
+    return backend.parse(source)
+
+
+def iterparse(source, events=('end',)):
+    """Iterate over (event, node) of SVD file name or file object with the selected backend"""
+    return backend.iterparse(source, events)
+
+
+def Normalize(value):
+    """Replace whitespace sequences by a single space and strip leading and trailing whitespace"""
+
+    # Fast path for names, numbers and enum values without line breaks, tabs or repeated spaces
+    if value.isprintable() and '  ' not in value and value[:1] != ' ' and value[-1:] != ' ':
+        return value
+    return Whitespace(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def Whitespace(value):
+    """Normalize whitespace of value. Results are cached, as descriptions are often repeated within a file."""
+
+    return ' '.join(value.split())
+
+
+def Texts(node):
+    """Get text of the direct children of node by tag. The first child with a tag wins and a child without text gives an empty string,
+    like node.findtext(tag). Elements look up all their tags in the texts of their node built once per parse (see Base.texts)."""
+    return {child.tag: child.text or '' for child in reversed(node)}
+
+
+def Element(node, tag, mandatory=False, texts=None):
+    """Get the element text for the provided tag (a direct child) from the provided node. If given, the text is looked up in texts of
+    the node (see Texts())."""
+
+    value = node.findtext(tag) if texts is None else texts.get(tag)
     if value is None:
         if mandatory:
             raise SyntaxError("Element '{}.{}' is mandatory, but not present!".format(node.tag, tag))
         return None
     else:
-        value = re.sub(r'\s+', ' ', value)
-        return value.strip()
+        return Normalize(value)
 
 
 def Attribute(node, tag, mandatory=False):
@@ -23,5 +121,4 @@ def Attribute(node, tag, mandatory=False):
             raise SyntaxError("Attribute '{}@{}' is mandatory, but not present!".format(node.tag, tag))
         return None
     else:
-        value = re.sub(r'\s+', ' ', value)
-        return value.strip()
+        return Normalize(value)
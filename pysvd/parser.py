@@ -57,8 +57,7 @@ def Enum(enum, value, default=None):
     if value is None:
         return default
 
-    for pair in enum:
-        if pair.value == value:
-            return pair
-
-    raise KeyError("Value '{}' not contained in enum type".format(value))
+    try:
+        return enum(value)
+    except ValueError:
+        raise KeyError("Value '{}' not contained in enum type".format(value)) from None
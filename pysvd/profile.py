@@ -0,0 +1,209 @@
+"""Counters and timers of the parse phases.
+
+Profiling is off by default and costs nothing then, enable() installs hooks into the loader and the element classes, disable() removes
+them again. The numbers are collected in the module level stats:
+
+    pysvd.profile.enable()
+    device = pysvd.load('device.svd')
+    pysvd.profile.disable()
+    print(pysvd.profile.stats)
+
+Counters and timers are named by phase:
+
+* xml.parse, xml.iterparse: calls and time of the XML backend (iterparse including its iteration)
+* elements.<class>: constructed elements and their construction time excluding the construction of their child elements
+* derive.find: derivedFrom lookups, derive.path.<n> the lookups by number of path elements, derive.unresolved the lookups failing on
+  forward references (each is parsed again after the following elements), derive.inherit the elements taking over a base element
+* dim.arrays, dim.indices: dim arrays and their number of elements, dim.instances.<class> the array elements created from templates
+* getattr.<attribute>: inherited registerPropertiesGroup attributes looked up at the parents (Group.__getattr__), getattr.missing the
+  lookups without value
+
+Peripherals parsed by worker processes (see pysvd.loader.parallel()) are not profiled.
+"""
+import collections
+import contextlib
+import time
+
+import pysvd
+
+
+class Stats(object):
+    """Counters and timers (seconds) by name"""
+
+    def __init__(self):
+        self.counters = collections.Counter()
+        self.timers = collections.defaultdict(float)
+
+    def reset(self):
+        self.counters.clear()
+        self.timers.clear()
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Count and time a block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+            self.counters[name] += 1
+
+    def format(self):
+        """Format counters and timers as text sorted by name"""
+        lines = []
+        for name in sorted(set(self.counters) | set(self.timers)):
+            if name in self.timers:
+                lines.append("{}: {:,} calls, {:.4f} s".format(name, self.counters[name], self.timers[name]))
+            else:
+                lines.append("{}: {:,}".format(name, self.counters[name]))
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+stats = Stats()
+
+# Installed hooks as (owner, name, original attribute)
+installed = []
+
+# Construction times of the elements being constructed as [start, time of child elements]
+constructing = []
+
+
+def parse(original):
+    def parse(source):
+        with stats.timer('xml.parse'):
+            return original(source)
+    return parse
+
+
+def iterparse(original):
+    def iterparse(source, events=('end',)):
+        iterator = iter(original(source, events))
+        stats.count('xml.iterparse')
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                stats.timers['xml.iterparse'] += time.perf_counter() - start
+            yield item
+    return iterparse
+
+
+def construct(original):
+    def __init__(self, node):
+        entry = [time.perf_counter(), 0.0]
+        constructing.append(entry)
+        try:
+            original(self, node)
+        finally:
+            constructing.pop()
+            elapsed = time.perf_counter() - entry[0]
+            if constructing:
+                constructing[-1][1] += elapsed
+
+            name = 'elements.' + self.__class__.__name__
+            stats.counters[name] += 1
+            stats.timers[name] += elapsed - entry[1]
+    return __init__
+
+
+def find_derived(original):
+    def find_derived(self, derivedFrom):
+        stats.count('derive.path.{}'.format(derivedFrom.count('.') + 1))
+        try:
+            with stats.timer('derive.find'):
+                return original(self, derivedFrom)
+        except pysvd.classes.Unresolved:
+            stats.count('derive.unresolved')
+            raise
+    return find_derived
+
+
+def inherit(original):
+    def inherit(self, base):
+        with stats.timer('derive.inherit'):
+            original(self, base)
+    return inherit
+
+
+def dim_array(original):
+    def __init__(self, template, indices, increment, positions=None, elements=None):
+        original(self, template, indices, increment, positions, elements)
+
+        # Slices share the elements of their array
+        if positions is None:
+            stats.count('dim.arrays')
+            stats.count('dim.indices', len(indices))
+    return __init__
+
+
+def instance(original):
+    def instance(self):
+        stats.count('dim.instances.' + self.__class__.__name__)
+        return original(self)
+    return instance
+
+
+def getattr_(original):
+    def __getattr__(self, attr):
+        try:
+            value = original(self, attr)
+        except AttributeError:
+            stats.count('getattr.missing')
+            raise
+        stats.count('getattr.' + attr)
+        return value
+    return __getattr__
+
+
+# Hooks as (owner, name, wrapper factory)
+hooks = (
+    (pysvd.node, 'parse', parse),
+    (pysvd.node, 'iterparse', iterparse),
+    (pysvd.classes.Base, '__init__', construct),
+    (pysvd.classes.Derive, 'find_derived', find_derived),
+    (pysvd.classes.Derive, 'inherit', inherit),
+    (pysvd.classes.DimArray, '__init__', dim_array),
+    (pysvd.classes.Dim, 'instance', instance),
+    (pysvd.classes.Group, '__getattr__', getattr_),
+)
+
+
+def enable():
+    """Install hooks, the counters keep counting from their current values"""
+    if installed:
+        return
+    for (owner, name, factory) in hooks:
+        original = getattr(owner, name)
+        installed.append((owner, name, original))
+        setattr(owner, name, factory(original))
+
+
+def disable():
+    """Remove hooks"""
+    while installed:
+        (owner, name, original) = installed.pop()
+        setattr(owner, name, original)
+
+
+def reset():
+    stats.reset()
+
+
+@contextlib.contextmanager
+def profiling():
+    """Profile a block with reset counters, yields the stats"""
+    reset()
+    enable()
+    try:
+        yield stats
+    finally:
+        disable()
@@ -0,0 +1,149 @@
+"""Parsers of simple child elements of SVD elements
+
+Generated by scripts/xsd2schema.py from cmsis-svd-1.3.6.xsd, cmsis-svd-1.3.3.xsd, do not edit.
+"""
+import functools
+import pysvd.parser
+import pysvd.type
+
+# Enum parsers
+addressBlockUsage = functools.partial(pysvd.parser.Enum, pysvd.type.addressBlockUsage)
+protection = functools.partial(pysvd.parser.Enum, pysvd.type.protection)
+cpuName = functools.partial(pysvd.parser.Enum, pysvd.type.cpuName)
+endian = functools.partial(pysvd.parser.Enum, pysvd.type.endian)
+sauAccess = functools.partial(pysvd.parser.Enum, pysvd.type.sauAccess)
+enumUsage = functools.partial(pysvd.parser.Enum, pysvd.type.enumUsage)
+access = functools.partial(pysvd.parser.Enum, pysvd.type.access)
+modifiedWriteValues = functools.partial(pysvd.parser.Enum, pysvd.type.modifiedWriteValues)
+readAction = functools.partial(pysvd.parser.Enum, pysvd.type.readAction)
+dataType = functools.partial(pysvd.parser.Enum, pysvd.type.dataType)
+
+addressBlock = {
+    'offset': pysvd.parser.Integer,
+    'size': pysvd.parser.Integer,
+    'usage': addressBlockUsage,
+    'protection': protection,
+}
+
+interrupt = {
+    'name': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'value': pysvd.parser.Integer,
+}
+
+cpu = {
+    'name': cpuName,
+    'revision': pysvd.parser.Text,
+    'endian': endian,
+    'mpuPresent': pysvd.parser.Boolean,
+    'fpuPresent': pysvd.parser.Boolean,
+    'fpuDP': pysvd.parser.Boolean,
+    'dspPresent': pysvd.parser.Boolean,
+    'icachePresent': pysvd.parser.Boolean,
+    'dcachePresent': pysvd.parser.Boolean,
+    'itcmPresent': pysvd.parser.Boolean,
+    'dtcmPresent': pysvd.parser.Boolean,
+    'vtorPresent': pysvd.parser.Boolean,
+    'nvicPrioBits': pysvd.parser.Integer,
+    'vendorSystickConfig': pysvd.parser.Boolean,
+    'deviceNumInterrupts': pysvd.parser.Integer,
+    'sauNumRegions': pysvd.parser.Integer,
+}
+
+region = {
+    'base': pysvd.parser.Integer,
+    'limit': pysvd.parser.Integer,
+    'access': sauAccess,
+}
+
+enumeratedValue = {
+    'name': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'value': pysvd.parser.Integer,
+    'isDefault': pysvd.parser.Boolean,
+}
+
+enumeration = {
+    'name': pysvd.parser.Text,
+    'headerEnumName': pysvd.parser.Text,
+    'usage': enumUsage,
+}
+
+dimArrayIndex = {
+    'headerEnumName': pysvd.parser.Text,
+}
+
+field = {
+    'name': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'access': access,
+    'modifiedWriteValues': modifiedWriteValues,
+    'readAction': readAction,
+}
+
+register = {
+    'name': pysvd.parser.Text,
+    'displayName': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'alternateGroup': pysvd.parser.Text,
+    'alternateRegister': pysvd.parser.Text,
+    'addressOffset': pysvd.parser.Integer,
+    'size': pysvd.parser.Integer,
+    'access': access,
+    'protection': protection,
+    'resetValue': pysvd.parser.Integer,
+    'resetMask': pysvd.parser.Integer,
+    'dataType': dataType,
+    'modifiedWriteValues': modifiedWriteValues,
+    'readAction': readAction,
+}
+
+cluster = {
+    'name': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'alternateCluster': pysvd.parser.Text,
+    'headerStructName': pysvd.parser.Text,
+    'addressOffset': pysvd.parser.Integer,
+    'size': pysvd.parser.Integer,
+    'access': access,
+    'protection': protection,
+    'resetValue': pysvd.parser.Integer,
+    'resetMask': pysvd.parser.Integer,
+}
+
+peripheral = {
+    'name': pysvd.parser.Text,
+    'version': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'alternatePeripheral': pysvd.parser.Text,
+    'groupName': pysvd.parser.Text,
+    'prependToName': pysvd.parser.Text,
+    'appendToName': pysvd.parser.Text,
+    'headerStructName': pysvd.parser.Text,
+    'disableCondition': pysvd.parser.Text,
+    'baseAddress': pysvd.parser.Integer,
+    'size': pysvd.parser.Integer,
+    'access': access,
+    'protection': protection,
+    'resetValue': pysvd.parser.Integer,
+    'resetMask': pysvd.parser.Integer,
+}
+
+device = {
+    'vendor': pysvd.parser.Text,
+    'vendorID': pysvd.parser.Text,
+    'name': pysvd.parser.Text,
+    'series': pysvd.parser.Text,
+    'version': pysvd.parser.Text,
+    'description': pysvd.parser.Text,
+    'licenseText': pysvd.parser.Text,
+    'headerSystemFilename': pysvd.parser.Text,
+    'headerDefinitionsPrefix': pysvd.parser.Text,
+    'addressUnitBits': pysvd.parser.Integer,
+    'width': pysvd.parser.Integer,
+    'size': pysvd.parser.Integer,
+    'access': access,
+    'protection': protection,
+    'resetValue': pysvd.parser.Integer,
+    'resetMask': pysvd.parser.Integer,
+}
@@ -6,7 +6,7 @@ Read SVD file and generate C-style register access structs.
 """
 
 import argparse
-import xml.etree.ElementTree as ET
+import sys
 import pysvd
 from enum import Enum
 
@@ -52,10 +52,10 @@ def format_registers(output, prefix, registers):
                     field.bitOffset + field.bitWidth - 1, field.bitOffset, field.access, field.name))
             output.write('   {}\n\n'.format(field.description))
 
-            if hasattr(field, 'enumeratedValues'):
+            if field.has('enumeratedValues'):
                 for enumeratedValue in field.enumeratedValues.enumeratedValues:
                     output.write('   - {} - {}\n'.format(enumeratedValue.value, enumeratedValue.name))
-                    if hasattr(enumeratedValue, 'description'):
+                    if enumeratedValue.has('description'):
                         output.write('      {}\n'.format(enumeratedValue.description))
                 output.write('\n')
 
@@ -84,11 +84,16 @@ def main():
     parser = argparse.ArgumentParser(description='SVD to C-style register access structs')
     parser.add_argument('--svd', metavar='FILE', type=str, help='System view description (SVD) file', required=True)
     parser.add_argument('--output', '-o',  metavar='FILE', type=str, help='C output file', required=True)
+    parser.add_argument('--backend', choices=sorted(pysvd.node.backends), help='XML parser backend', default=pysvd.node.backend.name)
+    parser.add_argument('--cache', action='store_true', help='Cache parsed device (see pysvd.cache)')
+    parser.add_argument('--profile', action='store_true', help='Print counters and timers of the parse phases (see pysvd.profile)')
     parser.add_argument('--version', action='version', version=pysvd.__version__)
     args = parser.parse_args()
 
-    node = ET.parse(args.svd).getroot()
-    device = pysvd.element.Device(node)
+    pysvd.node.use(args.backend)
+    if args.profile:
+        pysvd.profile.enable()
+    device = pysvd.load(args.svd, keep_xml=not args.cache, cache=args.cache)
 
     output = open(args.output, "w")
 
@@ -129,5 +134,8 @@ def main():
             write_peripheral(peripheral, output)
     output.close()
 
+    if args.profile:
+        print(pysvd.profile.stats, file=sys.stderr)
+
 if __name__ == '__main__':
     main()
@@ -6,7 +6,7 @@ Read SVD file and generate device datasheet in rst format.
 """
 
 import argparse
-import xml.etree.ElementTree as ET
+import sys
 import pysvd
 from enum import Enum
 
@@ -100,10 +100,10 @@ def format_registers(output, prefix, registers):
                     field.bitOffset + field.bitWidth - 1, field.bitOffset, field.access, field.name))
             output.write('   {}\n\n'.format(field.description))
 
-            if hasattr(field, 'enumeratedValues'):
+            if field.has('enumeratedValues'):
                 for enumeratedValue in field.enumeratedValues.enumeratedValues:
                     output.write('   - {} - {}\n'.format(enumeratedValue.value, enumeratedValue.name))
-                    if hasattr(enumeratedValue, 'description'):
+                    if enumeratedValue.has('description'):
                         output.write('      {}\n'.format(enumeratedValue.description))
                 output.write('\n')
 
@@ -112,11 +112,16 @@ def main():
     parser = argparse.ArgumentParser(description='SVD to ReST converter')
     parser.add_argument('--svd', metavar='FILE', type=str, help='System view description (SVD) file', required=True)
     parser.add_argument('--output', '-o',  metavar='FILE', type=str, help='ReST output file', required=True)
+    parser.add_argument('--backend', choices=sorted(pysvd.node.backends), help='XML parser backend', default=pysvd.node.backend.name)
+    parser.add_argument('--cache', action='store_true', help='Cache parsed device (see pysvd.cache)')
+    parser.add_argument('--profile', action='store_true', help='Print counters and timers of the parse phases (see pysvd.profile)')
     parser.add_argument('--version', action='version', version=pysvd.__version__)
     args = parser.parse_args()
 
-    node = ET.parse(args.svd).getroot()
-    device = pysvd.element.Device(node)
+    pysvd.node.use(args.backend)
+    if args.profile:
+        pysvd.profile.enable()
+    device = pysvd.load(args.svd, keep_xml=not args.cache, cache=args.cache)
 
     output = open(args.output, "w")
 
@@ -125,10 +130,10 @@ def main():
 
     output.write(rst_list_name.format('Name', device.name))
     output.write(rst_list_name.format('Description', device.description))
-    if hasattr(device, 'series'):
+    if device.has('series'):
         output.write(rst_list_name.format('Series', device.series))
     output.write(rst_list_name.format('Version', device.version))
-    if hasattr(device, 'vendor'):
+    if device.has('vendor'):
         output.write(rst_list_name.format('Vendor', device.vendor))
     output.write('\n')
 
@@ -145,18 +150,18 @@ def main():
     output.write(rst_list_name.format('Endian', cpu.endian))
     output.write(rst_list_name.format('MPU', 'yes' if cpu.mpuPresent else 'no'))
     output.write(rst_list_name.format('FPU', 'yes' if cpu.fpuPresent else 'no'))
-    if hasattr(cpu, 'fpuDP'):
+    if cpu.has('fpuDP'):
         output.write(rst_list_name.format('FPU DP', 'yes' if cpu.fpuDP else 'no'))
-    if hasattr(cpu, 'icachePresent'):
+    if cpu.has('icachePresent'):
         output.write(rst_list_name.format('I-Cache', 'yes' if cpu.icachePresent else 'no'))
-    if hasattr(cpu, 'dcachePresent'):
+    if cpu.has('dcachePresent'):
         output.write(rst_list_name.format('D-Cache', 'yes' if cpu.dcachePresent else 'no'))
-    if hasattr(cpu, 'itcmPresent'):
+    if cpu.has('itcmPresent'):
         output.write(rst_list_name.format('ITCM', 'yes' if cpu.itcmPresent else 'no'))
-    if hasattr(cpu, 'dtcmPresent'):
+    if cpu.has('dtcmPresent'):
         output.write(rst_list_name.format('DTCM', 'yes' if cpu.dtcmPresent else 'no'))
     output.write(rst_list_name.format('VTOR', 'yes' if cpu.vtorPresent else 'no'))
-    if hasattr(cpu, 'deviceNumInterrupts'):
+    if cpu.has('deviceNumInterrupts'):
         output.write(rst_list_name.format('Interrupts', cpu.deviceNumInterrupts))
     output.write(rst_list_name.format('Interrupt priorities', 2 ** cpu.nvicPrioBits))
     output.write(rst_list_name.format('Vendor SYSTICK', 'yes' if cpu.vendorSystickConfig else 'no'))
@@ -190,7 +195,7 @@ def main():
 
         output.write(underline('{} ({})'.format(peripheral.description, peripheral.name), section.subsection))
 
-        if hasattr(peripheral, 'version'):
+        if peripheral.has('version'):
             output.write(rst_list_name.format('Version', peripheral.version))
         output.write(rst_list_name.format('Address', '0x{:08X}'.format(peripheral.baseAddress)))
         for interrupt in peripheral.interrupts:
@@ -215,6 +220,9 @@ def main():
     output.write("Autogenerated ReST with pysvd {}\n".format(pysvd.__version__))
     output.close()
 
+    if args.profile:
+        print(pysvd.profile.stats, file=sys.stderr)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Compile SVD file into binary device image (see pysvd.binary).
+"""
+
+import argparse
+import pysvd
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SVD to binary device image compiler')
+    parser.add_argument('--svd', metavar='FILE', type=str, help='System view description (SVD) file', required=True)
+    parser.add_argument('--output', '-o', metavar='FILE', type=str, help='Binary device image (.svdb) output file', required=True)
+    parser.add_argument('--version', action='version', version=pysvd.__version__)
+    args = parser.parse_args()
+
+    pysvd.binary.write(pysvd.load(args.svd, keep_xml=False), args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,6 @@
 
 import sys
 import argparse
-import xml.etree.ElementTree as ET
 from enum import IntEnum
 import itertools
 from natsort import natsorted
@@ -122,11 +121,16 @@ def main():
     parser.add_argument('--level', '-l', choices=['all', 'hint', 'warning'], help='Select level of output messages', default='all')
     parser.add_argument('--depth', '-d', choices=['peripherals', 'registers', 'fields', 'enumeratedValues'], help='Select depth of analysis', default='enumeratedValues')
     parser.add_argument('--sort', action='store_true', help='Sort elements before comparing')
+    parser.add_argument('--backend', choices=sorted(pysvd.node.backends), help='XML parser backend', default=pysvd.node.backend.name)
+    parser.add_argument('--profile', action='store_true', help='Print counters and timers of the parse phases (see pysvd.profile)')
     args = parser.parse_args()
     level = Level[args.level]
     depth = Depth[args.depth]
 
-    xml = ET.parse(args.svd)
+    pysvd.node.use(args.backend)
+    if args.profile:
+        pysvd.profile.enable()
+    xml = pysvd.node.parse(args.svd)
 
     if args.sort:
       print('Sort peripherals by name')
@@ -151,12 +155,12 @@ def main():
         item.text = ' '.join(text.split())
 
     if args.output:
-        xml.write(args.output, encoding="utf-8", xml_declaration=True, method="xml", short_empty_elements=True)
+        pysvd.node.backend.write(xml, args.output)
     print()
 
     # Load cleaned-up SVD file
     try:
-        device = pysvd.element.Device(xml.getroot())
+        device = pysvd.element.Device(xml)
     except Exception as e:
         print("Error parsing SVD file: {}".format(str(e)))
         sys.exit(2)
@@ -167,5 +171,8 @@ def main():
         for peripheral in peripherals:
             compare_registers(level, peripheral, peripheral.registers)
 
+    if args.profile:
+        print(pysvd.profile.stats, file=sys.stderr)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Generate pysvd/schema.py from the CMSIS-SVD XSD schema files.
+
+For every element type of the schema a table of its simple child elements is generated, which maps the tag to the parser of its text. The
+element classes parse all of these tags with one pass over the children of a node (see pysvd.classes.Base.add_attributes()).
+"""
+
+import argparse
+import xml.etree.ElementTree as ET
+
+import pysvd
+
+XS = '{http://www.w3.org/2001/XMLSchema}'
+
+# Tags parsed by the element classes itself (dim arrays, field bit ranges and write constraints)
+skip = {'dim', 'dimIncrement', 'dimIndex', 'dimName', 'lsb', 'msb', 'bitOffset', 'bitWidth', 'bitRange', 'writeConstraint'}
+
+# Simple types of numbers in string representation
+numbers = {'scaledNonNegativeInteger', 'enumeratedValueDataType'}
+
+# Parsers of XSD built-in types
+builtins = {
+    'xs:integer': 'pysvd.parser.Integer',
+    'xs:nonNegativeInteger': 'pysvd.parser.Integer',
+    'xs:boolean': 'pysvd.parser.Boolean',
+}
+
+
+class Schema(object):
+    """Collect element tables of XSD schema files"""
+
+    def __init__(self):
+        self.tables = {}
+        self.enums = []
+
+    def read(self, filename):
+        root = ET.parse(filename).getroot()
+        self.simple_types = {node.get('name'): node for node in root.findall(XS + 'simpleType')}
+        self.complex_types = {node.get('name'): node for node in root.findall(XS + 'complexType')}
+        self.groups = {node.get('name'): node for node in root.findall(XS + 'group')}
+
+        for (name, node) in self.complex_types.items():
+            self.add_table(name[:-len('Type')] if name.endswith('Type') else name, node)
+        for node in root.findall(XS + 'element'):
+            self.add_element_table(node)
+
+    def add_element_table(self, node):
+        """Add table of element with anonymous complex type"""
+        complex_type = node.find(XS + 'complexType')
+        if complex_type is not None:
+            self.add_table(node.get('name'), complex_type)
+
+    def add_table(self, name, node):
+        if name in skip:
+            return
+
+        table = self.tables.setdefault(name, {})
+        for element in self.elements(node):
+            tag = element.get('name')
+            if tag in skip:
+                continue
+
+            parser = self.parser(name, element)
+            if parser is not None:
+                table.setdefault(tag, parser)
+            else:
+                self.add_element_table(element)
+
+    def elements(self, node):
+        """Iterate over child element declarations of sequences, choices and groups"""
+        for child in node:
+            if child.tag == XS + 'element':
+                yield child
+            elif child.tag in (XS + 'sequence', XS + 'choice', XS + 'all'):
+                yield from self.elements(child)
+            elif child.tag == XS + 'group':
+                yield from self.elements(self.groups[child.get('ref')])
+
+    def parser(self, owner, element):
+        """Get parser expression of simple element, None for complex elements"""
+        name = element.get('type')
+        if name is None:
+            simple_type = element.find(XS + 'simpleType')
+            if simple_type is None:
+                return None
+            return self.simple_parser(owner + element.get('name')[0].upper() + element.get('name')[1:], simple_type)
+
+        if name in builtins:
+            return builtins[name]
+        if name.startswith('xs:'):
+            return 'pysvd.parser.Text'
+        if name in self.simple_types:
+            return self.simple_parser(name, self.simple_types[name])
+        return None
+
+    def simple_parser(self, name, node):
+        restriction = node.find(XS + 'restriction')
+        if name in numbers or restriction is not None and builtins.get(restriction.get('base')) == 'pysvd.parser.Integer':
+            return 'pysvd.parser.Integer'
+        if restriction is not None and restriction.get('base') == 'xs:boolean':
+            return 'pysvd.parser.Boolean'
+
+        for suffix in ('StringType', 'Type'):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+
+        if hasattr(pysvd.type, name):
+            if name not in self.enums:
+                self.enums.append(name)
+            return name
+        return 'pysvd.parser.Text'
+
+    def write(self, output, sources):
+        output.write('"""Parsers of simple child elements of SVD elements\n')
+        output.write('\n')
+        output.write('Generated by scripts/xsd2schema.py from {}, do not edit.\n'.format(', '.join(sources)))
+        output.write('"""\n')
+        output.write('import functools\n')
+        output.write('import pysvd.parser\n')
+        output.write('import pysvd.type\n')
+        output.write('\n')
+
+        output.write('# Enum parsers\n')
+        for name in self.enums:
+            output.write('{0} = functools.partial(pysvd.parser.Enum, pysvd.type.{0})\n'.format(name))
+
+        for (name, table) in self.tables.items():
+            if not table:
+                continue
+            output.write('\n')
+            output.write('{} = {{\n'.format(name))
+            for (tag, parser) in table.items():
+                output.write("    '{}': {},\n".format(tag, parser))
+            output.write('}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate pysvd/schema.py from CMSIS-SVD XSD files')
+    parser.add_argument('--xsd', metavar='FILE', type=str, action='append', help='CMSIS-SVD schema file (newest first)', required=True)
+    parser.add_argument('--output', '-o', metavar='FILE', type=str, help='Python output file', required=True)
+    parser.add_argument('--version', action='version', version=pysvd.__version__)
+    args = parser.parse_args()
+
+    schema = Schema()
+    for filename in args.xsd:
+        schema.read(filename)
+
+    with open(args.output, 'w') as output:
+        schema.write(output, [filename.split('/')[-1] for filename in args.xsd])
+
+
+if __name__ == "__main__":
+    main()
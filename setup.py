@@ -28,7 +28,6 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Topic :: System :: Hardware",
@@ -36,12 +35,13 @@ setuptools.setup(
         "Topic :: Software Development :: Code Generators",
         "Topic :: Software Development :: Embedded Systems",
     ],
-    python_requires='>=3.5',
+    python_requires='>=3.6',
     entry_points={
         'console_scripts': [
             'svd2rst = scripts.svd2rst:main',
             'svd2register = scripts.svd2register:main',
             'svd_duplicates = scripts.svd_duplicates:main',
+            'svd2svdb = scripts.svd2svdb:main',
         ],
     },
     setup_requires=["pytest-runner"],
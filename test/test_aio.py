@@ -0,0 +1,90 @@
+import asyncio
+import io
+import threading
+import unittest
+
+import pysvd
+
+
+def run_loop(coroutine):
+    """Run coroutine in a new event loop like asyncio.run() of Python 3.7"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncLoader(unittest.TestCase):
+
+    def test_aload(self):
+        device = run_loop(pysvd.aload("test/example.svd"))
+
+        self.assertEqual(device.name, "ARM_Example")
+        self.assertEqual(len(device.peripherals), len(pysvd.load("test/example.svd").peripherals))
+
+    def test_file(self):
+        with open("test/example.svd", 'rb') as file:
+            device = run_loop(pysvd.aload(io.BytesIO(file.read()), keep_xml=False))
+
+        self.assertEqual(device.name, "ARM_Example")
+
+    def test_deduplicate(self):
+        loader = pysvd.aio.AsyncLoader()
+        calls = []
+        load = pysvd.loader.load
+
+        def counted(*args):
+            calls.append(args)
+            return load(*args)
+
+        async def run():
+            devices = await asyncio.gather(*(loader.load("test/example.svd") for _ in range(10)))
+            self.assertEqual(loader.loading, {})
+            return devices
+
+        pysvd.loader.load = counted
+        try:
+            devices = run_loop(run())
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(all(device is devices[0] for device in devices))
+
+            # Completed loads are not kept
+            run_loop(run())
+            self.assertEqual(len(calls), 2)
+        finally:
+            pysvd.loader.load = load
+
+    def test_error(self):
+        with self.assertRaises(FileNotFoundError):
+            run_loop(pysvd.aload("test/missing.svd"))
+
+    def test_limit(self):
+        loader = pysvd.aio.AsyncLoader(limit=2)
+        lock = threading.Lock()
+        active = [0, 0]
+        load = pysvd.loader.load
+
+        def counted(*args):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            try:
+                return load(*args)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        async def run():
+            with open("test/example.svd", 'rb') as file:
+                data = file.read()
+            return await asyncio.gather(*(loader.load(io.BytesIO(data)) for _ in range(8)))
+
+        pysvd.loader.load = counted
+        try:
+            devices = run_loop(run())
+        finally:
+            pysvd.loader.load = load
+
+        self.assertEqual(len(devices), 8)
+        self.assertLessEqual(active[1], 2)
@@ -0,0 +1,41 @@
+import io
+import unittest
+
+import pysvd
+import benchmark.generate
+import benchmark.suite
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def load(self, **parameters):
+        return pysvd.load(io.BytesIO(benchmark.generate.generate(**parameters).encode()))
+
+    def test_generate(self):
+        device = self.load(peripherals=6, registers=2, fields=3, values=1, derived=2, description=50)
+
+        self.assertEqual(len(device.peripherals), 6)
+        derived = [peripheral.derivedFrom.name for peripheral in device.peripherals if peripheral.derivedFrom is not None]
+        self.assertEqual(derived, ["P0", "P0", "P3", "P3"])
+        self.assertEqual(len(device.find("P4").registers[1].fields), 3)
+        self.assertEqual(len(device.find("P0").description), len("Peripheral 0 ") + 50)
+
+    def test_dim(self):
+        device = self.load(peripherals=2, registers=3, fields=1, values=0, dim=2, depth=2)
+        paths = [path for (path, register) in benchmark.suite.registers(device.find("P1"))]
+
+        self.assertEqual(len(paths), 2 * 2 * 3 * 2)
+        self.assertEqual(paths[0], "C0_0.C1_0.R0_0")
+        self.assertEqual(device.address("P1.C0_1.C1_1.R2_1"), 0x40000400 + 0x30 + 0x18 + 0x14)
+
+    def test_compare(self):
+        parameters = benchmark.suite.scenarios['flat']
+        baseline = {'scenarios': {'flat': {'parameters': parameters, 'load': 1.0, 'peak': 100}}}
+        results = {'scenarios': {'flat': {'parameters': parameters, 'load': 1.1, 'lookup': 1.0, 'expand': 1.0, 'derive': 0.0, 'peak': 200}}}
+
+        self.assertEqual(benchmark.suite.compare(results, baseline, 0.2), [('flat', 'peak', 200, 100)])
+        self.assertEqual(benchmark.suite.compare(results, baseline, 1.0), [])
+
+        # Results of other parameters are not compared
+        baseline['scenarios']['flat']['parameters'] = dict(parameters, peripherals=1)
+        self.assertEqual(benchmark.suite.compare(results, baseline, 0.0), [])
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+import pysvd
+
+
+def attached_names(name, queue):
+    with pysvd.binary.attach(name) as shared:
+        queue.put([peripheral.name for peripheral in shared.device.peripherals])
+
+
+class TestBinary(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.device = pysvd.load("test/example.svd")
+        cls.image = pysvd.binary.Image(pysvd.binary.pack(cls.device))
+
+    def test_device(self):
+        view = self.image.device
+
+        self.assertEqual(view.name, self.device.name)
+        self.assertEqual(view.schemaVersion, self.device.schemaVersion)
+        self.assertEqual(view.access, pysvd.type.access.read_write)
+        self.assertEqual(view.cpu.name, self.device.cpu.name)
+        self.assertEqual(view.cpu.mpuPresent, self.device.cpu.mpuPresent)
+        self.assertIsNone(view.parent)
+        self.assertIs(view.cpu.parent.image, view.image)
+
+    def test_elements(self):
+        view = self.image.device
+
+        self.assertEqual(len(view.peripherals), len(self.device.peripherals))
+        for (lhs, rhs) in zip(view.peripherals, self.device.peripherals):
+            self.assertEqual(lhs.name, rhs.name)
+            self.assertEqual(lhs.baseAddress, rhs.baseAddress)
+            self.assertEqual(len(lhs.registers), len(rhs.registers))
+            for (register, reference) in zip(lhs.registers, rhs.registers):
+                self.assertEqual(register.name, reference.name)
+                self.assertEqual(register.addressOffset, reference.addressOffset)
+                # Inherited attributes are stored with their effective value
+                self.assertEqual(register.size, reference.size)
+                self.assertEqual(register.resetMask, reference.resetMask)
+                self.assertEqual([field.name for field in register.fields], [field.name for field in reference.fields])
+                self.assertEqual([field.bitWidth for field in register.fields], [field.bitWidth for field in reference.fields])
+
+    def test_find(self):
+        view = self.image.device
+        timer = view.find('TIMER0')
+
+        self.assertEqual(timer.find('RELOAD[4]').addressOffset, self.device.find('TIMER0').find('RELOAD[4]').addressOffset)
+        self.assertEqual(timer.find('RELOAD[4]').parent, timer)
+        self.assertIsNone(timer.find('unknown'))
+
+        # Registers of derived peripherals are stored with the derived peripheral as parent
+        derived = view.peripherals[1]
+        self.assertEqual(derived.registers[0].name, timer.registers[0].name)
+        self.assertEqual(derived.registers[0].parent, derived)
+
+    def test_inherited(self):
+        for filename in ("test/example.svd", "res/cortex-m3.svd"):
+            device = pysvd.load(filename)
+            nodes = [(pysvd.binary.Image(pysvd.binary.pack(device)).device, device)]
+            for (view, element) in nodes:
+                # Inherited registerPropertiesGroup values are stored with every element kind having them
+                for attribute in getattr(element, 'attributes', ()):
+                    self.assertEqual(view.has(attribute), element.has(attribute), (element, attribute))
+                    if element.has(attribute):
+                        self.assertEqual(getattr(view, attribute), getattr(element, attribute), (element, attribute))
+                nodes.extend((view.find(child.name), child) for child in element.children())
+                if isinstance(element, pysvd.element.Field) and element.has('enumeratedValues'):
+                    if not element.enumeratedValues.has('name'):
+                        nodes.append((view.enumeratedValues, element.enumeratedValues))
+            self.assertGreater(len(nodes), 100)
+
+    def test_has(self):
+        field = self.image.device.peripherals[0].registers[0].fields[0]
+
+        self.assertTrue(field.has('bitOffset'))
+        self.assertFalse(field.has('readAction'))
+        with self.assertRaises(AttributeError):
+            field.readAction
+        with self.assertRaises(AttributeError):
+            field.unknown
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'example.svdb')
+            pysvd.binary.write(self.device, filename)
+
+            view = pysvd.load(filename)
+            self.assertEqual([peripheral.name for peripheral in view.peripherals],
+                             [peripheral.name for peripheral in self.device.peripherals])
+            del view
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            pysvd.binary.Image(b'<?xml version="1.0"?>')
+
+
+@unittest.skipIf(sys.version_info < (3, 8), 'shared memory requires Python 3.8')
+class TestBinaryShared(unittest.TestCase):
+
+    def test_publish(self):
+        device = pysvd.load("test/example.svd")
+        with pysvd.binary.publish(device) as published:
+            with pysvd.binary.attach(published.name) as shared:
+                self.assertEqual(shared.device.name, device.name)
+                self.assertEqual(shared.device.find('TIMER0').registers[0].name, device.find('TIMER0').registers[0].name)
+
+            # Block is still available after other processes detached
+            self.assertEqual(published.device.peripherals[0].name, device.peripherals[0].name)
+
+        with self.assertRaises(FileNotFoundError):
+            pysvd.binary.attach(published.name)
+
+    def test_attach_tracker(self):
+        device = pysvd.load("test/example.svd")
+        with pysvd.binary.publish(device) as published:
+            with unittest.mock.patch('multiprocessing.resource_tracker.register') as register, \
+                    unittest.mock.patch('multiprocessing.resource_tracker.unregister') as unregister:
+                pysvd.binary.attach(published.name).close()
+
+            # The block stays registered by the publishing process only
+            register.assert_not_called()
+            unregister.assert_not_called()
+
+    def test_process(self):
+        device = pysvd.load("test/example.svd")
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        with pysvd.binary.publish(device) as published:
+            process = context.Process(target=attached_names, args=(published.name, queue))
+            process.start()
+            names = queue.get(timeout=30)
+            process.join()
+
+        self.assertEqual(names, [peripheral.name for peripheral in device.peripherals])
@@ -0,0 +1,150 @@
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import pysvd
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = pysvd.cache.Cache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load(self):
+        reference = pysvd.load("test/example.svd")
+        device = pysvd.load("test/example.svd", keep_xml=False, cache=self.cache)
+        cached = pysvd.load("test/example.svd", keep_xml=False, cache=self.cache)
+
+        self.assertEqual(len(self.cache.entries()), 1)
+        self.assertIsNot(cached, device)
+        self.assertEqual(len(cached.peripherals), len(reference.peripherals))
+        for (lhs, rhs) in zip(cached.peripherals, reference.peripherals):
+            self.assertEqual(lhs, rhs)
+            self.assertIs(lhs.parent, cached)
+
+        # Derived elements and dim arrays are restored
+        self.assertIs(cached.peripherals[1].derivedFrom, cached.peripherals[0])
+        self.assertEqual(cached.find('TIMER0').find('RELOAD[1]').name, 'RELOAD[1]')
+
+    def test_key(self):
+        data = open("test/example.svd", 'rb').read()
+
+        self.assertEqual(self.cache.key(data, lazy=False), self.cache.key(data, lazy=False))
+        self.assertNotEqual(self.cache.key(data, lazy=False), self.cache.key(data, lazy=True))
+        self.assertNotEqual(self.cache.key(data, lazy=False), self.cache.key(data + b' ', lazy=False))
+
+        pysvd.load(io.BytesIO(data), cache=self.cache)
+        pysvd.load(io.BytesIO(data), lazy=True, cache=self.cache)
+        self.assertEqual(len(self.cache.entries()), 2)
+
+        # XML nodes are never cached
+        pysvd.load(io.BytesIO(data), keep_xml=False, cache=self.cache)
+        self.assertEqual(len(self.cache.entries()), 2)
+        self.assertIsNone(pysvd.load(io.BytesIO(data), cache=self.cache).node)
+
+    def test_evict(self):
+        pysvd.load("test/example.svd", keep_xml=False, cache=self.cache)
+        pysvd.load("res/cortex-m3.svd", keep_xml=False, cache=self.cache)
+        key = self.cache.key(open("res/cortex-m3.svd", 'rb').read(), lazy=False)
+
+        # Least recently used entry is removed first
+        entries = sorted(self.cache.entries(), key=lambda entry: entry[2] != self.cache.path(key))
+        os.utime(entries[1][2], (0, 0))
+        self.cache.size = entries[0][1] + entries[1][1] - 1
+        self.cache.evict()
+
+        self.assertEqual([entry[2] for entry in self.cache.entries()], [self.cache.path(key)])
+
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_corrupt(self):
+        pysvd.load("res/cortex-m3.svd", keep_xml=False, cache=self.cache)
+        path = self.cache.entries()[0][2]
+        with open(path, 'wb') as file:
+            file.write(b'corrupt')
+
+        device = pysvd.load("res/cortex-m3.svd", keep_xml=False, cache=self.cache)
+        self.assertEqual(device.name, "ARMCM3")
+        self.assertEqual(len(self.cache.entries()), 1)
+
+    def test_pickle_elements(self):
+        device = pysvd.load("test/example.svd", lazy=True)
+        copy = pickle.loads(pickle.dumps(device))
+
+        self.assertEqual(len(copy.peripherals), len(device.peripherals))
+        self.assertEqual(copy.peripherals[0].registers.find('RELOAD[2]').name, 'RELOAD[2]')
+
+        # XML nodes are not pickled
+        self.assertIsNotNone(device.peripherals[0].node)
+        self.assertIsNone(copy.node)
+        self.assertIsNone(copy.peripherals[0].node)
+
+
+class TestDeviceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load(self):
+        cache = pysvd.cache.DeviceCache()
+        device = cache.load("test/example.svd")
+
+        self.assertEqual(device.name, "ARM_Example")
+        self.assertIsNone(device.node)
+        self.assertIs(cache.load("test/example.svd"), device)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+
+        # Same content by file object and hash
+        with open("test/example.svd", 'rb') as file:
+            data = file.read()
+        self.assertIs(cache.load(io.BytesIO(data)), device)
+        self.assertIs(cache.find(cache.key(data)), device)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        self.assertGreater(cache.memory(cache.key(data)), 0)
+        self.assertEqual(cache.total, cache.memory(cache.key(data)))
+
+    def test_modified(self):
+        cache = pysvd.cache.DeviceCache()
+        path = os.path.join(self.directory.name, "device.svd")
+        shutil.copy("test/example.svd", path)
+        device = cache.load(path)
+
+        with open(path, 'a') as file:
+            file.write("\n")
+        self.assertIsNot(cache.load(path), device)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_evict(self):
+        cache = pysvd.cache.DeviceCache()
+        example = cache.load("test/example.svd")
+        cortex = cache.load("res/cortex-m3.svd")
+        self.assertEqual(len(cache), 2)
+
+        # Least recently used device is dropped first
+        self.assertIs(cache.load("test/example.svd"), example)
+        cache.size = cache.total - 1
+        cache.evict()
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIs(cache.load("test/example.svd"), example)
+        self.assertIsNot(cache.load("res/cortex-m3.svd"), cortex)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.evictions, 2)
+
+        # Devices exceeding the size are not kept
+        cache.size = 0
+        self.assertIsNot(cache.load("test/example.svd"), example)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.total, 0)
@@ -115,6 +115,31 @@ class TestClassBase(unittest.TestCase):
 
         self.assertIsNone(test.find("test"))
 
+    def test_add_attributes(self):
+        xml = '''
+        <node>
+            <name>first</name>
+            <name>second</name>
+            <description>Multi
+                line</description>
+            <size>0x20</size>
+            <other>1</other>
+        </node>'''
+        node = ET.fromstring(xml)
+        schema = {'name': pysvd.parser.Text, 'description': pysvd.parser.Text, 'size': pysvd.parser.Integer, 'width': pysvd.parser.Integer}
+
+        test = pysvd.classes.Base(None)
+        test.add_attributes(node, schema, ('name', 'size'), {'size': 8, 'width': 32})
+
+        self.assertEqual(test.name, 'first')
+        self.assertEqual(test.description, 'Multi line')
+        self.assertEqual(test.size, 0x20)
+        self.assertEqual(test.width, 32)
+        self.assertFalse(test.has('other'))
+
+        with self.assertRaises(SyntaxError):
+            test.add_attributes(node, schema, ('name', 'width'))
+
 
 class TestClassParent(unittest.TestCase):
 
@@ -260,6 +285,51 @@ class TestClassGroup(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.assertIsNone(subchild.extra)
 
+    def test_group_has(self):
+        test = pysvd.classes.Group(None, None)
+        test.__dict__.update({'name': 'test', 'size': 8, 'extra': 'xxx'})
+        child = pysvd.classes.Group(test, None)
+        child.__dict__.update({'name': 'child'})
+
+        for name in ('name', 'size', 'resetValue', 'extra', 'description'):
+            self.assertEqual(test.has(name), hasattr(test, name))
+            self.assertEqual(child.has(name), hasattr(child, name))
+        self.assertTrue(child.has('size'))
+        self.assertFalse(child.has('extra'))
+
+    def test_group_cache(self):
+        test = pysvd.classes.Group(None, None)
+        test.__dict__.update({'name': 'test', 'size': 8})
+        child = pysvd.classes.Group(test, None)
+        child.children = pysvd.classes.Elements()
+        subchild = pysvd.classes.Group(child, None)
+        child.children.append(subchild)
+        test.children = [child]
+
+        # Inherited value is cached by every element on the path
+        self.assertEqual(subchild.size, 8)
+        self.assertEqual(subchild.__dict__['size'], 8)
+        self.assertEqual(subchild.cached, ('size',))
+
+        # Modification of a parent removes cached values of descendants
+        child.size = 16
+        self.assertNotIn('size', subchild.__dict__)
+        self.assertEqual(subchild.size, 16)
+        test.size = 32
+        self.assertEqual(subchild.size, 16)
+        del child.size
+        self.assertEqual(subchild.size, 32)
+
+        # Own value replaces cached one
+        subchild.size = 4
+        self.assertEqual(subchild.cached, ())
+        test.size = 64
+        self.assertEqual(subchild.size, 4)
+
+        subchild.parent = None
+        with self.assertRaises(AttributeError):
+            subchild.resetValue
+
     def test_group_attributes(self):
         test_attr = {
             'name': 'test',
@@ -700,6 +770,45 @@ class TestClassDim(unittest.TestCase):
         self.assertEqual(test[3].dimName, "irq6_t")
         self.assertEqual(test[3].offset, 24)
 
+    def test_template(self):
+        '''Array elements are copies of one parsed element'''
+
+        xml = '''
+        <root>
+            <register>
+                <dim>4</dim>
+                <dimIncrement>4</dimIncrement>
+                <name>PORT%s</name>
+                <description>Port %s</description>
+                <field>
+                    <name>BitField0</name>
+                    <description>Bit field 0</description>
+                    <access>read-write</access>
+                </field>
+            </register>
+        </root>'''
+
+        class HelperClassDimCount(HelperClassDim):
+            count = 0
+
+            def parse(self, node):
+                super().parse(node)
+                HelperClassDimCount.count += 1
+                self.field = []
+                HelperClassDeriveField.add_elements(self, self.field, node, 'field')
+
+        node = ET.fromstring(xml)
+        test = []
+        HelperClassDimCount.add_elements(None, test, node, 'register')
+        self.assertEqual(len(test), 4)
+        self.assertEqual(HelperClassDimCount.count, 1)
+
+        self.assertEqual([item.name for item in test], ["PORT0", "PORT1", "PORT2", "PORT3"])
+        self.assertEqual([item.offset for item in test], [0, 4, 8, 12])
+        self.assertEqual(test[3].description, "Port 3")
+        self.assertIs(test[3].field[0].parent, test[3])
+        self.assertIs(test[0].field[0].parent, test[0])
+
     def test_index_exception(self):
         '''dimIndex can not be interpreted as integer'''
 
@@ -731,3 +840,118 @@ class TestClassDim(unittest.TestCase):
         node = ET.fromstring(xml)
         with self.assertRaises(AttributeError):
             pysvd.classes.Dim.add_elements(None, None, node, 'register')
+
+
+class TestClassDimArray(unittest.TestCase):
+
+    xml = '''
+        <root>
+            <register>
+                <dim>1024</dim>
+                <dimIncrement>4</dimIncrement>
+                <name>PORT%s</name>
+                <description>Port %s</description>
+            </register>
+        </root>'''
+
+    def test_virtual(self):
+        node = ET.fromstring(self.xml)
+        test = pysvd.classes.Elements()
+        HelperClassDim.add_elements(None, test, node, 'register')
+
+        # Array is stored as single entry, elements are only created on access
+        self.assertEqual(list.__len__(test), 1)
+        array = test.arrays[0]
+        self.assertEqual(len(array), 1024)
+        self.assertEqual(array.name(37), "PORT37")
+        self.assertEqual(len(array.elements), 0)
+
+        self.assertEqual(test.find("PORT37").name, "PORT37")
+        self.assertEqual(test.find("PORT37").offset, 148)
+        self.assertIs(test.find("PORT37"), array[37])
+        self.assertEqual(len(array.elements), 1)
+        self.assertIsNone(test.find("PORT037"))
+        self.assertIsNone(test.find("PORT1024"))
+        self.assertIsNone(test.find("PORT"))
+
+        # Slices share created elements
+        part = array[36:40]
+        self.assertEqual(len(part), 4)
+        self.assertEqual(part.name(0), "PORT36")
+        self.assertIs(part[1], array[37])
+        self.assertEqual(len(array.elements), 1)
+
+        # Length and indexing do not expand the array
+        self.assertEqual(len(test), 1024)
+        self.assertIs(test[37], array[37])
+        self.assertEqual(test[-1].offset, 4092)
+        self.assertEqual(list.__len__(test), 1)
+        self.assertEqual(len(array.elements), 2)
+        with self.assertRaises(IndexError):
+            test[1024]
+
+        # Iteration expands the array
+        self.assertEqual(len(list(test)), 1024)
+        self.assertEqual(list.__len__(test), 1024)
+        self.assertIs(test[37], array[37])
+        self.assertEqual(test[1023].offset, 4092)
+
+    def test_index(self):
+        xml = self.xml.replace('<dim>1024</dim>', '<dim>3</dim><dimIndex>A,B,C</dimIndex>')
+        node = ET.fromstring(xml)
+        test = pysvd.classes.Elements()
+        HelperClassDim.add_elements(None, test, node, 'register')
+
+        self.assertEqual(test.find("PORTB").offset, 4)
+        self.assertIsNone(test.find("PORTD"))
+        self.assertEqual([item.name for item in test], ["PORTA", "PORTB", "PORTC"])
+
+    def test_array(self):
+        xml = self.xml.replace('PORT%s', 'PORT[%s]')
+        node = ET.fromstring(xml)
+        test = pysvd.classes.Elements()
+        HelperClassDim.add_elements(None, test, node, 'register')
+
+        self.assertEqual([item.name for item in test], ["PORT[1024]"])
+        self.assertEqual(test.find("PORT[37]").offset, 148)
+        self.assertIsNone(test.find("PORT[1024]x"))
+
+
+class HelperClassElement(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class TestClassElements(unittest.TestCase):
+
+    def test_find(self):
+        a = HelperClassElement('a')
+        b = HelperClassElement('b')
+        test = pysvd.classes.Elements([a])
+
+        self.assertIs(test.find('a'), a)
+        self.assertIsNone(test.find('b'))
+
+        test.append(b)
+        self.assertIs(test.find('b'), b)
+
+    def test_find_duplicate(self):
+        first = HelperClassElement('a')
+        second = HelperClassElement('a')
+        test = pysvd.classes.Elements([first, second])
+
+        self.assertIs(test.find('a'), first)
+
+    def test_find_modified(self):
+        a = HelperClassElement('a')
+        b = HelperClassElement('b')
+        test = pysvd.classes.Elements([a])
+
+        self.assertIs(test.find('a'), a)
+        test[0] = b
+        self.assertIsNone(test.find('a'))
+        self.assertIs(test.find('b'), b)
+
+        del test[0]
+        self.assertIsNone(test.find('b'))
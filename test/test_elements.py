@@ -1,3 +1,4 @@
+import io
 import unittest
 import xml.etree.ElementTree as ET
 
@@ -140,6 +141,305 @@ class TestElementDevice(unittest.TestCase):
         self.assertIsNotNone(test.find("Timer1"))
         self.assertIsNone(test.find("Timer2"))
 
+    derive_xml = '''
+        <device schemaVersion="1.3">
+            <name>ARM_Cortex_M4</name>
+            <version>0.1</version>
+            <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals>
+                <peripheral derivedFrom="TIMER1">
+                    <name>TIMER0</name>
+                    <baseAddress>0x40002000</baseAddress>
+                </peripheral>
+                <peripheral>
+                    <name>TIMER1</name>
+                    <baseAddress>0x40002400</baseAddress>
+                    <registers>
+                        <register derivedFrom="CTRL">
+                            <name>CTRL_SET</name>
+                            <description>Control set register</description>
+                            <addressOffset>0x4</addressOffset>
+                        </register>
+                        <register>
+                            <name>CTRL</name>
+                            <description>Control register</description>
+                            <addressOffset>0x0</addressOffset>
+                            <fields>
+                                <field>
+                                    <name>EN</name>
+                                    <bitOffset>0</bitOffset>
+                                </field>
+                            </fields>
+                        </register>
+                        <cluster>
+                            <name>CH</name>
+                            <addressOffset>0x10</addressOffset>
+                            <register derivedFrom="TIMER1.CTRL">
+                                <name>CHCTRL</name>
+                                <description>Channel control register</description>
+                                <addressOffset>0x0</addressOffset>
+                            </register>
+                        </cluster>
+                    </registers>
+                </peripheral>
+            </peripherals>
+        </device>'''
+
+    def test_derive_forward(self):
+        node = ET.fromstring(self.derive_xml)
+        test = pysvd.element.Device(node)
+
+        self.assertEqual([peripheral.name for peripheral in test.peripherals], ["TIMER0", "TIMER1"])
+        self.assertIs(test.peripherals[0].derivedFrom, test.peripherals[1])
+        self.assertEqual(test.peripherals[0].baseAddress, 0x40002000)
+        self.assertEqual(len(test.peripherals[0].registers), 2)
+
+        timer1 = test.peripherals[1]
+        self.assertEqual([register.name for register in timer1.registers], ["CTRL_SET", "CTRL"])
+        self.assertIs(timer1.registers[0].derivedFrom, timer1.registers[1])
+        self.assertEqual(timer1.registers[0].description, "Control set register")
+        self.assertEqual(timer1.registers[0].addressOffset, 4)
+        self.assertEqual(timer1.registers[0].fields[0].name, "EN")
+
+        # Absolute path from within a cluster
+        self.assertIs(timer1.clusters[0].registers[0].derivedFrom, timer1.registers[1])
+
+    def test_derive_forward_stream(self):
+        test = pysvd.load(io.BytesIO(self.derive_xml.encode()))
+
+        self.assertEqual([peripheral.name for peripheral in test.peripherals], ["TIMER0", "TIMER1"])
+        self.assertIs(test.peripherals[0].derivedFrom, test.peripherals[1])
+
+    def test_derive_unknown_exception(self):
+        node = ET.fromstring(self.derive_xml.replace('derivedFrom="CTRL"', 'derivedFrom="STATUS"'))
+        with self.assertRaises(KeyError):
+            pysvd.element.Device(node)
+
+    def test_resolve(self):
+        node = ET.fromstring(self.derive_xml)
+        test = pysvd.element.Device(node)
+
+        self.assertIs(test.resolve("TIMER1"), test.peripherals[1])
+        self.assertIs(test.resolve("TIMER1.CTRL.EN"), test.peripherals[1].registers[1].fields[0])
+        self.assertIs(test.resolve("TIMER0.CTRL_SET"), test.peripherals[0].registers[0])
+        self.assertIs(test.resolve("TIMER1.CH.CHCTRL"), test.peripherals[1].clusters[0].registers[0])
+        self.assertIsNone(test.resolve("TIMER1.STATUS"))
+        self.assertIsNone(test.resolve("TIMER2"))
+
+    def test_rename(self):
+        node = ET.fromstring(self.derive_xml)
+        test = pysvd.element.Device(node)
+
+        timer1 = test.find("TIMER1")
+        ctrl = timer1.find("CTRL")
+        timer1.name = "TIMER2"
+        self.assertIs(test.find("TIMER2"), timer1)
+        self.assertIsNone(test.find("TIMER1"))
+        self.assertIs(test.resolve("TIMER2.CTRL"), ctrl)
+        self.assertIsNone(test.resolve("TIMER1.CTRL"))
+
+    def test_inherit_cache(self):
+        node = ET.fromstring(self.derive_xml)
+        test = pysvd.element.Device(node)
+        test.size = 32
+        test.access = pysvd.type.access.read_write
+
+        timer1 = test.peripherals[1]
+        field = timer1.registers[1].fields[0]
+        self.assertEqual(field.access, pysvd.type.access.read_write)
+        self.assertEqual(timer1.registers[1].size, 32)
+
+        timer1.access = pysvd.type.access.read_only
+        self.assertEqual(field.access, pysvd.type.access.read_only)
+        test.size = 16
+        self.assertEqual(timer1.registers[1].size, 16)
+        self.assertEqual(timer1.clusters[0].registers[0].size, 16)
+
+    def test_derive_parent(self):
+        node = ET.fromstring(self.derive_xml)
+        test = pysvd.element.Device(node)
+
+        (timer0, timer1) = test.peripherals
+        register = timer0.find("CTRL")
+        self.assertIs(register.parent, timer0)
+        self.assertEqual(register.parent.baseAddress, 0x40002000)
+        self.assertIs(register.fields[0].parent, register)
+        self.assertIs(timer0.find("CH").registers[0].parent, timer0.find("CH"))
+        self.assertIs(timer1.find("CTRL").parent, timer1)
+
+        # Attributes of the base element are not inherited by the children of derived elements
+        timer1.size = 64
+        self.assertEqual(timer1.find("CTRL").size, 64)
+        self.assertEqual(register.size, 32)
+
+    def test_derive_cluster(self):
+        xml = '''
+        <device schemaVersion="1.3">
+            <name>TEST</name>
+            <version>0.1</version>
+            <description>Test</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals>
+                <peripheral>
+                    <name>TIMER0</name>
+                    <baseAddress>0x40002000</baseAddress>
+                    <registers>
+                        <cluster>
+                            <name>A</name>
+                            <addressOffset>0x0</addressOffset>
+                            <size>16</size>
+                            <access>read-write</access>
+                            <register>
+                                <name>CTRL</name>
+                                <addressOffset>0x0</addressOffset>
+                            </register>
+                        </cluster>
+                        <cluster derivedFrom="A">
+                            <name>B</name>
+                            <description>Derived cluster</description>
+                            <addressOffset>0x10</addressOffset>
+                            <size>8</size>
+                            <access>read-only</access>
+                        </cluster>
+                    </registers>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        test = pysvd.element.Device(ET.fromstring(xml))
+
+        self.assertEqual(test.resolve("TIMER0.A.CTRL").size, 16)
+        self.assertEqual(test.resolve("TIMER0.A.CTRL").access, pysvd.type.access.read_write)
+        self.assertEqual(test.resolve("TIMER0.B.CTRL").size, 8)
+        self.assertEqual(test.resolve("TIMER0.B.CTRL").access, pysvd.type.access.read_only)
+
+    def test_derive_lazy_forward(self):
+        xml = '''
+        <device schemaVersion="1.3">
+            <name>TEST</name>
+            <version>0.1</version>
+            <description>Test</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals>
+                <peripheral>
+                    <name>C</name>
+                    <baseAddress>0x40002000</baseAddress>
+                    <registers>
+                        <register derivedFrom="R2">
+                            <name>R1</name>
+                            <description>Register 1</description>
+                            <addressOffset>0x0</addressOffset>
+                        </register>
+                        <register>
+                            <name>R2</name>
+                            <addressOffset>0x4</addressOffset>
+                        </register>
+                    </registers>
+                </peripheral>
+                <peripheral derivedFrom="C">
+                    <name>B</name>
+                    <baseAddress>0x40002400</baseAddress>
+                    <registers>
+                        <register>
+                            <name>RB</name>
+                            <addressOffset>0x8</addressOffset>
+                        </register>
+                    </registers>
+                </peripheral>
+                <peripheral derivedFrom="B">
+                    <name>A</name>
+                    <baseAddress>0x40002800</baseAddress>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        for lazy in (False, True):
+            test = pysvd.element.Device(ET.fromstring(xml), lazy=lazy)
+
+            # Base elements are complete before their child elements are copied
+            self.assertEqual([register.name for register in test.find("A").registers], ["R1", "R2", "RB"])
+            self.assertEqual([register.name for register in test.find("B").registers], ["R1", "R2", "RB"])
+            self.assertEqual([register.name for register in test.find("C").registers], ["R1", "R2"])
+            self.assertIs(test.resolve("A.R1").parent, test.find("A"))
+
+    def test_address(self):
+        xml = self.derive_xml.replace('''<name>CH</name>''', '''<dim>64</dim>
+                            <dimIncrement>0x20</dimIncrement>
+                            <name>CH[%s]</name>''').replace('''<name>CHCTRL</name>''', '''<dim>16</dim>
+                                <dimIncrement>4</dimIncrement>
+                                <name>CHCTRL%s</name>''')
+        node = ET.fromstring(xml)
+        test = pysvd.element.Device(node)
+
+        self.assertEqual(test.address("TIMER1"), 0x40002400)
+        self.assertEqual(test.address("TIMER1.CTRL_SET"), 0x40002404)
+        self.assertEqual(test.address("TIMER0.CTRL_SET.EN"), 0x40002004)
+        self.assertEqual(test.address("TIMER1.CH[37].CHCTRL15"), 0x40002400 + 0x10 + 37 * 0x20 + 15 * 4)
+        self.assertEqual(test["TIMER1"].address("CH[37].CHCTRL2"), 0x40002400 + 0x10 + 37 * 0x20 + 2 * 4)
+        self.assertIsNone(test.address("TIMER1.CH[65].CHCTRL2"))
+        self.assertEqual(test.resolve("TIMER1.CH[37].CHCTRL2").parent.name, "CH[37]")
+        self.assertEqual(test.resolve("TIMER1.CH[37].CHCTRL2").parent.addressOffset, 0x10 + 37 * 0x20)
+
+        # Register array of cluster is not expanded by lookups
+        cluster = test.peripherals[1].clusters[0]
+        self.assertEqual(cluster.name, "CH[64]")
+        cluster.registers.load_sources()
+        self.assertEqual(list.__len__(cluster.registers), 1)
+        self.assertEqual(len(cluster.registers), 16)
+
+    def test_dim_parent(self):
+        xml = '''
+        <device schemaVersion="1.3">
+            <name>TEST</name>
+            <version>0.1</version>
+            <description>Test</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals>
+                <peripheral>
+                    <dim>2</dim>
+                    <dimIncrement>0x400</dimIncrement>
+                    <dimIndex>A,B</dimIndex>
+                    <name>GPIO%s</name>
+                    <baseAddress>0x50000000</baseAddress>
+                    <interrupt>
+                        <name>GPIO</name>
+                        <value>3</value>
+                    </interrupt>
+                    <registers>
+                        <register>
+                            <name>MODER</name>
+                            <addressOffset>0x0</addressOffset>
+                        </register>
+                        <cluster>
+                            <dim>4</dim>
+                            <dimIncrement>0x40</dimIncrement>
+                            <name>CH%s</name>
+                            <addressOffset>0x100</addressOffset>
+                            <register>
+                                <name>CCR</name>
+                                <addressOffset>0x0</addressOffset>
+                            </register>
+                        </cluster>
+                    </registers>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        test = pysvd.element.Device(ET.fromstring(xml))
+
+        gpiob = test.find("GPIOB")
+        self.assertIs(gpiob.find("MODER").parent, gpiob)
+        self.assertEqual(gpiob.find("MODER").parent.baseAddress, 0x50000400)
+        self.assertIs(gpiob.interrupts[0].parent, gpiob)
+
+        channel = gpiob.find("CH2")
+        self.assertIs(channel.find("CCR").parent, channel)
+        self.assertEqual(channel.find("CCR").parent.addressOffset, 0x180)
+        self.assertIs(channel.parent, gpiob)
+        self.assertIs(test.find("GPIOA").find("CH2").parent, test.find("GPIOA"))
+
 
 class TestElementCpu(unittest.TestCase):
 
@@ -280,6 +580,100 @@ class TestElementPeripheral(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             pysvd.element.Peripheral(None, node)
 
+    def test_register_properties(self):
+        xml = '''
+        <peripheral>
+            <name>Timer1</name>
+            <baseAddress>0x40002000</baseAddress>
+            <size>16</size>
+            <access>read-only</access>
+            <registers>
+                <register>
+                    <name>TimerCtrl0</name>
+                    <addressOffset>0x0</addressOffset>
+                </register>
+            </registers>
+        </peripheral>'''
+        node = ET.fromstring(xml)
+        test = pysvd.element.Peripheral(None, node)
+
+        self.assertEqual(test.size, 16)
+        self.assertEqual(test.access, pysvd.type.access.read_only)
+        self.assertEqual(test.registers[0].size, 16)
+        self.assertEqual(test.registers[0].access, pysvd.type.access.read_only)
+
+    def test_register_properties_device(self):
+        xml = '''
+        <device schemaVersion="1.3">
+            <name>TEST</name>
+            <version>0.1</version>
+            <description>Test</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <size>32</size>
+            <access>read-write</access>
+            <resetValue>0x00000000</resetValue>
+            <resetMask>0xFFFFFFFF</resetMask>
+            <peripherals>
+                <peripheral>
+                    <name>Timer1</name>
+                    <baseAddress>0x40002000</baseAddress>
+                    <size>8</size>
+                    <access>read-only</access>
+                    <protection>s</protection>
+                    <resetValue>0x12</resetValue>
+                    <resetMask>0xFF</resetMask>
+                    <registers>
+                        <register>
+                            <name>TimerCtrl0</name>
+                            <addressOffset>0x0</addressOffset>
+                        </register>
+                        <register>
+                            <name>TimerCtrl1</name>
+                            <addressOffset>0x4</addressOffset>
+                            <size>16</size>
+                            <access>write-only</access>
+                        </register>
+                        <cluster>
+                            <name>CH</name>
+                            <addressOffset>0x10</addressOffset>
+                            <register>
+                                <name>ChCtrl</name>
+                                <addressOffset>0x0</addressOffset>
+                            </register>
+                        </cluster>
+                    </registers>
+                </peripheral>
+                <peripheral>
+                    <name>Timer2</name>
+                    <baseAddress>0x40003000</baseAddress>
+                    <registers>
+                        <register>
+                            <name>TimerCtrl0</name>
+                            <addressOffset>0x0</addressOffset>
+                        </register>
+                    </registers>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        test = pysvd.element.Device(ET.fromstring(xml))
+
+        # Properties of the peripheral override the device defaults for its registers
+        register = test.resolve("Timer1.TimerCtrl0")
+        self.assertEqual(register.size, 8)
+        self.assertEqual(register.access, pysvd.type.access.read_only)
+        self.assertEqual(register.protection, pysvd.type.protection.secure)
+        self.assertEqual(register.resetValue, 0x12)
+        self.assertEqual(register.resetMask, 0xFF)
+        self.assertEqual(test.resolve("Timer1.CH.ChCtrl").size, 8)
+
+        # Own properties of registers and registers of other peripherals are not affected
+        self.assertEqual(test.resolve("Timer1.TimerCtrl1").size, 16)
+        self.assertEqual(test.resolve("Timer1.TimerCtrl1").access, pysvd.type.access.write_only)
+        self.assertEqual(test.resolve("Timer1.TimerCtrl1").resetMask, 0xFF)
+        self.assertEqual(test.resolve("Timer2.TimerCtrl0").size, 32)
+        self.assertEqual(test.resolve("Timer2.TimerCtrl0").access, pysvd.type.access.read_write)
+
     def test_register_cluster_exception(self):
         xml = '''
         <peripheral>
@@ -401,6 +795,11 @@ class TestElementPeripheral(unittest.TestCase):
         self.assertIsNotNone(test.find("TimerCtrl1"))
         self.assertIsNone(test.find("TimerCtrl2"))
 
+        self.assertIs(test.find("Value1"), test.registers[3])
+        self.assertIs(test["Mode1"], test.clusters[1])
+        with self.assertRaises(KeyError):
+            test["Value%s"]
+
 
 class TestElementAddressBlock(unittest.TestCase):
 
@@ -505,6 +904,17 @@ class TestElementCluster(unittest.TestCase):
         self.assertIsNotNone(cluster.find('SUBMODE'))
         self.assertIsNone(cluster.find('VALUE'))
 
+        # Lists of absent child elements are created on first access
+        submode = cluster.clusters[0]
+        self.assertIsNone(submode.find('CTRL'))
+        self.assertTrue(submode.has('registers'))
+        self.assertNotIn('registers', submode.__dict__)
+        self.assertEqual(len(submode.registers), 0)
+        self.assertIn('registers', submode.__dict__)
+        submode.registers.append(cluster.registers[0])
+        self.assertIs(submode.find(cluster.registers[0].name), cluster.registers[0])
+        self.assertEqual(len(cluster.clusters[0].registers), 1)
+
 
 class TestElementRegister(unittest.TestCase):
 
@@ -0,0 +1,279 @@
+import io
+import unittest
+import xml.etree.ElementTree as ET
+
+import pysvd
+
+
+class TestLoader(unittest.TestCase):
+
+    def test_load(self):
+        device = pysvd.load("test/example.svd", keep_xml=False)
+        reference = pysvd.element.Device(ET.parse("test/example.svd").getroot())
+
+        self.assertEqual(type(device), pysvd.element.Device)
+        self.assertEqual(device.name, reference.name)
+        self.assertEqual(device.cpu.name, reference.cpu.name)
+        self.assertEqual(len(device.peripherals), len(reference.peripherals))
+        for (lhs, rhs) in zip(device.peripherals, reference.peripherals):
+            self.assertEqual(lhs, rhs)
+            self.assertEqual(lhs.parent, device)
+
+        # Derived peripherals are resolved against the already streamed peripherals
+        self.assertEqual(device.peripherals[1].derivedFrom, device.peripherals[0])
+
+    def test_backends(self):
+        reference = pysvd.element.Device(ET.parse("test/example.svd").getroot())
+
+        previous = pysvd.node.backend.name
+        try:
+            for name in pysvd.node.backends:
+                pysvd.node.use(name)
+                for lazy in (False, True):
+                    device = pysvd.load("test/example.svd", lazy=lazy)
+                    self.assertEqual(len(device.peripherals), len(reference.peripherals))
+                    for (lhs, rhs) in zip(device.peripherals, reference.peripherals):
+                        self.assertEqual(lhs, rhs)
+        finally:
+            pysvd.node.use(previous)
+
+    def test_from_file(self):
+        device = pysvd.element.Device.from_file("res/cortex-m3.svd")
+
+        self.assertEqual(device.name, "ARMCM3")
+        self.assertIsNotNone(device.find("SCB"))
+
+    def test_keep_xml(self):
+        device = pysvd.load("test/example.svd", keep_xml=False)
+        reference = pysvd.load("test/example.svd")
+
+        self.assertEqual(len(device.peripherals), len(reference.peripherals))
+        for (lhs, rhs) in zip(device.peripherals, reference.peripherals):
+            self.assertEqual(lhs, rhs)
+
+        self.assertIsNotNone(reference.peripherals[0].registers[0].node)
+        nodes = [device]
+        for element in nodes:
+            self.assertIsNone(element.node)
+            self.assertNotIn('node', element.__dict__)
+            nodes.extend(element.children())
+        self.assertGreater(len(nodes), 10)
+
+    def test_keep_xml_lazy(self):
+        device = pysvd.load("test/example.svd", lazy=True, keep_xml=False)
+
+        register = device.peripherals[1].registers[0]
+        self.assertIsNone(register.node)
+        self.assertIsNone(register.fields[0].node)
+        self.assertIs(device.peripherals[1].derivedFrom, device.peripherals[0])
+
+    def test_iterparse(self):
+        peripherals = pysvd.loader.iterparse("test/example.svd")
+
+        peripheral = next(peripherals)
+        self.assertEqual(peripheral.name, "TIMER0")
+        self.assertEqual(len(peripheral.parent.peripherals), 1)
+        self.assertEqual([peripheral.name for peripheral in peripherals], ["TIMER1", "TIMER2"])
+
+        # Kept nodes are not removed from the document
+        self.assertEqual(len(peripheral.parent.node.find('peripherals')), 3)
+        self.assertIs(peripheral.node, peripheral.parent.node.find('peripherals')[0])
+
+    def test_stream(self):
+        xml = b'''
+        <device schemaVersion="1.3">
+            <name>ARM_Cortex_M4</name>
+            <version>0.1</version>
+            <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals>
+                <peripheral>
+                    <dim>4</dim>
+                    <dimIncrement>0x100</dimIncrement>
+                    <name>TIMER%s</name>
+                    <baseAddress>0x40010000</baseAddress>
+                </peripheral>
+                <peripheral>
+                    <name>UART</name>
+                    <baseAddress>0x40020000</baseAddress>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        items = pysvd.loader.stream(io.BytesIO(xml))
+        device = next(items)
+        (array, uart) = items
+
+        # Arrays are yielded as stored, without creating their elements
+        self.assertIsInstance(array, pysvd.classes.DimArray)
+        self.assertEqual(len(array.elements), 0)
+        self.assertEqual(uart.name, "UART")
+        self.assertEqual(list.__len__(device.peripherals), 2)
+        self.assertEqual(len(device.peripherals), 5)
+
+        peripherals = pysvd.loader.iterparse(io.BytesIO(xml))
+        self.assertEqual([peripheral.name for peripheral in peripherals], ["TIMER0", "TIMER1", "TIMER2", "TIMER3", "UART"])
+
+    def test_peripherals_exception(self):
+        xml = b'''
+        <device schemaVersion="1.3">
+            <name>ARM_Cortex_M4</name>
+            <version>0.1</version>
+            <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+        </device>'''
+        with self.assertRaises(SyntaxError):
+            pysvd.load(io.BytesIO(xml))
+
+    def test_peripheral_minimal_exception(self):
+        xml = b'''
+        <device schemaVersion="1.3">
+            <name>ARM_Cortex_M4</name>
+            <version>0.1</version>
+            <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <peripherals />
+        </device>'''
+        with self.assertRaises(SyntaxError):
+            pysvd.load(io.BytesIO(xml))
+
+
+class TestLoaderLazy(unittest.TestCase):
+
+    def test_load(self):
+        device = pysvd.load("test/example.svd", lazy=True)
+        reference = pysvd.load("test/example.svd")
+
+        self.assertTrue(device.lazy)
+        self.assertEqual(len(device.peripherals.sources), 1)
+        self.assertEqual(list.__len__(device.peripherals), 0)
+
+        self.assertEqual(len(device.peripherals), len(reference.peripherals))
+        self.assertEqual(len(device.peripherals.sources), 0)
+        for (lhs, rhs) in zip(device.peripherals, reference.peripherals):
+            self.assertEqual(lhs, rhs)
+
+    def test_peripheral(self):
+        device = pysvd.load("test/example.svd", lazy=True)
+        peripheral = device.find("TIMER0")
+        self.assertEqual(list.__len__(peripheral.registers), 0)
+
+        register = peripheral.find("CR")
+        self.assertIs(register.parent, peripheral)
+        self.assertTrue(register.lazy)
+        self.assertEqual(list.__len__(register.fields), 0)
+        self.assertEqual(register.fields[0].name, "EN")
+        self.assertEqual(register.size, 32)
+
+        # Derived peripherals get copies of the registers of their base
+        derived = device.find("TIMER1")
+        self.assertIs(derived.derivedFrom, peripheral)
+        self.assertIs(derived.find("CR").parent, derived)
+        self.assertEqual(derived.find("CR").fields[0].name, "EN")
+        self.assertIs(register.parent, peripheral)
+
+
+class TestLoaderParallel(unittest.TestCase):
+
+    def test_load(self):
+        device = pysvd.load("test/example.svd", workers=2)
+        reference = pysvd.load("test/example.svd")
+
+        self.assertEqual(len(device.peripherals), len(reference.peripherals))
+        for (lhs, rhs) in zip(device.peripherals, reference.peripherals):
+            self.assertEqual(lhs, rhs)
+            self.assertIs(lhs.parent, device)
+        self.assertIs(device.peripherals[1].derivedFrom, device.peripherals[0])
+
+    def test_derived(self):
+        xml = b'''
+        <device schemaVersion="1.3">
+            <name>ARM_Cortex_M4</name>
+            <version>0.1</version>
+            <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+            <addressUnitBits>8</addressUnitBits>
+            <width>32</width>
+            <size>16</size>
+            <peripherals>
+                <peripheral derivedFrom="TIMER1">
+                    <name>TIMER0</name>
+                    <description>Timer 0</description>
+                    <baseAddress>0x40000000</baseAddress>
+                </peripheral>
+                <peripheral>
+                    <name>TIMER1</name>
+                    <baseAddress>0x40001000</baseAddress>
+                    <registers>
+                        <register>
+                            <name>CR</name>
+                            <addressOffset>0x0</addressOffset>
+                        </register>
+                    </registers>
+                </peripheral>
+                <peripheral>
+                    <name>UART0</name>
+                    <baseAddress>0x40002000</baseAddress>
+                    <registers>
+                        <register derivedFrom="TIMER1.CR">
+                            <name>CTRL</name>
+                            <description>Control register</description>
+                            <addressOffset>0x4</addressOffset>
+                        </register>
+                    </registers>
+                </peripheral>
+            </peripherals>
+        </device>'''
+        device = pysvd.load(io.BytesIO(xml), workers=2)
+
+        self.assertEqual([peripheral.name for peripheral in device.peripherals], ["TIMER0", "TIMER1", "UART0"])
+        self.assertIs(device.find("TIMER0").derivedFrom, device.find("TIMER1"))
+        self.assertIs(device.find("UART0").find("CTRL").derivedFrom, device.find("TIMER1").find("CR"))
+        self.assertEqual(device.find("TIMER1").find("CR").size, 16)
+
+        # Inherited attributes follow the device of this process
+        device.size = 32
+        self.assertEqual(device.find("TIMER1").find("CR").size, 32)
+
+    def test_split(self):
+        xml = b'''<?xml version="1.0" encoding="utf-8"?>
+        <device>
+            <!-- <peripheral> -->
+            <peripherals>
+                <peripheral><name>A</name><description><![CDATA[</peripheral>]]></description></peripheral>
+                <peripheral derivedFrom="A"><name>B</name></peripheral>
+            </peripherals>
+        </device>'''
+        (declaration, header, spans) = pysvd.loader.split(xml)
+
+        self.assertEqual(declaration, b'<?xml version="1.0" encoding="utf-8"?>')
+        self.assertNotIn(b'<name>', header)
+        self.assertIn(b'<!-- <peripheral> -->', header)
+        self.assertEqual([derived for (start, end, derived) in spans], [False, True])
+        self.assertTrue(all(xml[start:start + 11] == b'<peripheral' for (start, end, derived) in spans))
+        self.assertTrue(all(xml[start:end].endswith(b'</peripheral>') for (start, end, derived) in spans))
+
+
+class TestLoaderMany(unittest.TestCase):
+
+    def test_load_many(self):
+        paths = ["test/example.svd", "res/cortex-m3.svd", "test/missing.svd"]
+        results = {}
+        for loaded in pysvd.load_many(paths, workers=2, pending=1):
+            (path, result) = loaded
+            self.assertGreaterEqual(loaded.elapsed, 0.0)
+            results[path] = result
+
+        self.assertEqual(sorted(results), sorted(paths))
+        self.assertEqual(results["test/example.svd"].name, "ARM_Example")
+        self.assertEqual(results["res/cortex-m3.svd"].name, pysvd.load("res/cortex-m3.svd").name)
+        self.assertIsInstance(results["test/missing.svd"], FileNotFoundError)
+
+    def test_serial(self):
+        loaded = list(pysvd.load_many(["test/missing.svd", "test/example.svd"], workers=1))
+
+        self.assertEqual([path for (path, result) in loaded], ["test/missing.svd", "test/example.svd"])
+        self.assertIsInstance(loaded[0].result, FileNotFoundError)
+        self.assertIsInstance(loaded[1].result, pysvd.element.Device)
+        self.assertIsNone(loaded[1].result.node)
@@ -0,0 +1,36 @@
+import unittest
+
+import pysvd
+
+
+class TestMemory(unittest.TestCase):
+
+    def test_sizeof(self):
+        self.assertGreater(pysvd.memory.sizeof(pysvd.load("test/example.svd")),
+                           pysvd.memory.sizeof(pysvd.load("test/example.svd", keep_xml=False)))
+
+    def test_report(self):
+        device = pysvd.load("test/example.svd")
+        report = device.memory_report()
+
+        self.assertEqual(report.total, pysvd.memory.sizeof(device))
+        self.assertEqual(sum(report.kinds.values()), report.total)
+        self.assertEqual(sum(size for (count, size) in report.classes.values()), report.total)
+        self.assertEqual(sum(report.peripherals.values()), report.total)
+        self.assertGreater(report.kinds['xml'], 0)
+        self.assertGreater(report.kinds['strings'], 0)
+
+        self.assertEqual(report.classes['Device'][0], 1)
+        self.assertEqual(report.classes['Peripheral'][0], len(device.peripherals))
+        self.assertIn('EnumeratedValue', report.classes)
+        self.assertEqual(set(report.peripherals), {None} | {peripheral.name for peripheral in device.peripherals})
+
+        # XML nodes are owned by the deepest element
+        self.assertLess(report.classes['Peripheral'][1], report.classes['Field'][1])
+
+    def test_no_xml(self):
+        report = pysvd.load("test/example.svd", keep_xml=False).memory_report()
+
+        self.assertEqual(report.kinds['xml'], 0)
+        self.assertIn("Peripherals:", str(report))
+        self.assertIn("TIMER0", report.format(1))
@@ -1,3 +1,4 @@
+import io
 import unittest
 import xml.etree.ElementTree as ET
 import pysvd
@@ -26,6 +27,21 @@ class TestNodeElement(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             pysvd.node.Element(node, 'unknown', True)
 
+    def test_texts(self):
+        node = ET.fromstring('''<node><value>first</value><empty /><value>second</value></node>''')
+        texts = pysvd.node.Texts(node)
+
+        self.assertEqual(texts, {'value': 'first', 'empty': ''})
+        self.assertEqual(pysvd.node.Element(node, 'value', False, texts), node.findtext('value'))
+        self.assertEqual(pysvd.node.Element(node, 'empty', False, texts), '')
+        self.assertIsNone(pysvd.node.Element(node, 'unknown', False, texts))
+        with self.assertRaises(SyntaxError):
+            pysvd.node.Element(node, 'unknown', True, texts)
+
+        # Without texts the node is looked up, modifications are seen
+        node[0].text = 'modified'
+        self.assertEqual(pysvd.node.Element(node, 'value'), 'modified')
+
 
 class TestNodeAttribute(unittest.TestCase):
     xml = '''
@@ -48,3 +64,55 @@ class TestNodeAttribute(unittest.TestCase):
         node = ET.fromstring(self.xml)
         with self.assertRaises(SyntaxError):
             pysvd.node.Attribute(node, 'unknown', True)
+
+
+class TestNodeNormalize(unittest.TestCase):
+
+    def test_value(self):
+        self.assertEqual(pysvd.node.Normalize('0x40000000'), '0x40000000')
+        self.assertEqual(pysvd.node.Normalize('read-write'), 'read-write')
+        self.assertEqual(pysvd.node.Normalize('Single spaced text'), 'Single spaced text')
+        self.assertEqual(pysvd.node.Normalize(' text '), 'text')
+        self.assertEqual(pysvd.node.Normalize('multi\n    line\ttext  '), 'multi line text')
+        self.assertEqual(pysvd.node.Normalize('\n \t'), '')
+        self.assertEqual(pysvd.node.Normalize(''), '')
+
+
+class TestNodeBackend(unittest.TestCase):
+    xml = b'''<?xml version="1.0"?>
+    <device>
+        <!-- comment -->
+        <name>test</name>
+        <?pi instruction?>
+        <peripherals><peripheral /></peripherals>
+    </device>'''
+
+    def setUp(self):
+        self.previous = pysvd.node.backend.name
+
+    def tearDown(self):
+        pysvd.node.use(self.previous)
+
+    def test_default(self):
+        self.assertIn('etree', pysvd.node.backends)
+        self.assertIs(pysvd.node.backend, pysvd.node.backends.get('lxml', pysvd.node.backends['etree']))
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            pysvd.node.use('unknown')
+
+    def test_parse(self):
+        for name in pysvd.node.backends:
+            pysvd.node.use(name)
+            root = pysvd.node.parse(io.BytesIO(self.xml))
+
+            self.assertEqual([child.tag for child in root], ['name', 'peripherals'])
+            self.assertEqual(pysvd.node.Element(root, 'name'), 'test')
+            self.assertEqual(root.find('peripherals').findall('peripheral')[0].tag, 'peripheral')
+
+    def test_iterparse(self):
+        for name in pysvd.node.backends:
+            pysvd.node.use(name)
+            tags = [node.tag for (event, node) in pysvd.node.iterparse(io.BytesIO(self.xml))]
+
+            self.assertEqual(tags, ['name', 'peripheral', 'peripherals', 'device'])
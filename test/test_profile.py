@@ -0,0 +1,81 @@
+import io
+import unittest
+
+import pysvd
+
+
+class TestProfile(unittest.TestCase):
+
+    xml = b'''
+    <device schemaVersion="1.3">
+        <name>ARM_Cortex_M4</name>
+        <version>0.1</version>
+        <description>Arm Cortex-M4 based Microcontroller demonstration device</description>
+        <addressUnitBits>8</addressUnitBits>
+        <width>32</width>
+        <size>32</size>
+        <peripherals>
+            <peripheral derivedFrom="TIMER1">
+                <name>TIMER0</name>
+                <description>Timer 0</description>
+                <baseAddress>0x40000000</baseAddress>
+            </peripheral>
+            <peripheral>
+                <name>TIMER1</name>
+                <baseAddress>0x40001000</baseAddress>
+                <registers>
+                    <register>
+                        <dim>4</dim>
+                        <dimIncrement>4</dimIncrement>
+                        <name>CR%s</name>
+                        <addressOffset>0x0</addressOffset>
+                    </register>
+                    <register derivedFrom="TIMER1.CR0">
+                        <name>CTRL</name>
+                        <description>Control register</description>
+                        <addressOffset>0x10</addressOffset>
+                    </register>
+                </registers>
+            </peripheral>
+        </peripherals>
+    </device>'''
+
+    def tearDown(self):
+        pysvd.profile.disable()
+        pysvd.profile.reset()
+
+    def test_profiling(self):
+        with pysvd.profile.profiling() as stats:
+            device = pysvd.load(io.BytesIO(self.xml), keep_xml=False)
+            self.assertEqual([register.size for register in device.find("TIMER1").registers], [32] * 5)
+
+        self.assertEqual(stats.counters['xml.iterparse'], 1)
+        self.assertEqual(stats.counters['elements.Device'], 1)
+        # TIMER0 and CTRL refer to elements following them and are parsed again, TIMER0 twice as TIMER1 is incomplete until CTRL is
+        self.assertEqual(stats.counters['elements.Peripheral'], 4)
+        self.assertEqual(stats.counters['elements.Register'], 3)
+        self.assertGreater(stats.timers['elements.Register'], 0.0)
+
+        self.assertEqual(stats.counters['derive.find'], 5)
+        self.assertEqual(stats.counters['derive.path.1'], 3)
+        self.assertEqual(stats.counters['derive.path.2'], 2)
+        self.assertEqual(stats.counters['derive.unresolved'], 3)
+        self.assertEqual(stats.counters['derive.inherit'], 2)
+
+        self.assertEqual(stats.counters['dim.arrays'], 1)
+        self.assertEqual(stats.counters['dim.indices'], 4)
+        self.assertEqual(stats.counters['dim.instances.Register'], 4)
+        self.assertGreaterEqual(stats.counters['getattr.size'], 4)
+
+        self.assertIn("elements.Register: 3 calls", stats.format())
+
+    def test_disabled(self):
+        init = pysvd.classes.Base.__init__
+        pysvd.profile.enable()
+        pysvd.profile.enable()
+        self.assertIsNot(pysvd.classes.Base.__init__, init)
+        pysvd.profile.disable()
+        self.assertIs(pysvd.classes.Base.__init__, init)
+
+        pysvd.load(io.BytesIO(self.xml))
+        self.assertEqual(pysvd.profile.stats.counters, {})
@@ -0,0 +1,29 @@
+import io
+import os
+import unittest
+
+import pysvd
+import scripts.xsd2schema
+
+
+class TestSchema(unittest.TestCase):
+
+    root = os.path.join(os.path.dirname(__file__), '..')
+
+    def test_generated(self):
+        schema = scripts.xsd2schema.Schema()
+        for filename in ('cmsis-svd-1.3.6.xsd', 'cmsis-svd-1.3.3.xsd'):
+            schema.read(os.path.join(self.root, 'res', filename))
+
+        output = io.StringIO()
+        schema.write(output, ['cmsis-svd-1.3.6.xsd', 'cmsis-svd-1.3.3.xsd'])
+
+        with open(os.path.join(self.root, 'pysvd', 'schema.py')) as f:
+            self.assertEqual(output.getvalue(), f.read(), 'pysvd/schema.py is outdated, run scripts/xsd2schema.py')
+
+    def test_tables(self):
+        self.assertEqual(pysvd.schema.register['addressOffset'], pysvd.parser.Integer)
+        self.assertEqual(pysvd.schema.field['access']('read-only'), pysvd.type.access.read_only)
+        self.assertEqual(pysvd.schema.addressBlock['usage']('registers'), pysvd.type.addressBlockUsage.registers)
+        self.assertNotIn('bitOffset', pysvd.schema.field)
+        self.assertNotIn('dim', pysvd.schema.register)
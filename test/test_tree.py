@@ -809,3 +809,13 @@ class TestTreeComplete(unittest.TestCase):
                 register_index += 1
 
             peripheral_index += 1
+
+    def test_find(self):
+        device = self.device
+
+        self.assertIs(device["TIMER1"], device.peripherals[1])
+        self.assertIs(device["TIMER1"]["CR"], device.peripherals[1].registers[0])
+        self.assertEqual(device["TIMER1"]["CR"]["EN"].name, "EN")
+        self.assertIs(device.find("TIMER2").find("RELOAD[4]"), device.peripherals[2].registers[7])
+        with self.assertRaises(KeyError):
+            device["TIMER3"]